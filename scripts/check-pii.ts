@@ -0,0 +1,57 @@
+// Golden check for the PII Vault. Compares redactPII and
+// updateIncrementalRedaction against fixtures whose expected entities were
+// produced by the original engine (one regex pass per pattern, overlaps
+// dropped in start order), which the single-pass scanner must reproduce
+// exactly.
+//
+//   npx tsx scripts/check-pii.ts
+//
+// redaction-cases.json: texts with their expected redactedText and entities,
+//   including "ending in" phrases that span whitespace or newlines and
+//   overlapping SSN / phone / account matches.
+// incremental-cases.json: a starting text and a sequence of edits
+//   ({ at, remove, insert }); after each edit the incremental state must hold
+//   the entities listed for it.
+
+import { redactPII } from "@/lib/utils/pii-redaction";
+import {
+  createIncrementalRedaction,
+  toRedactionResult,
+  updateIncrementalRedaction,
+} from "@/lib/utils/pii-incremental";
+import redactionCases from "./pii-golden/redaction-cases.json";
+import incrementalCases from "./pii-golden/incremental-cases.json";
+
+const failures: string[] = [];
+
+function check(name: string, expected: unknown, actual: unknown) {
+  const want = JSON.stringify(expected);
+  const got = JSON.stringify(actual);
+  if (want !== got) failures.push(`${name}\n  expected ${want}\n  actual   ${got}`);
+}
+
+for (const c of redactionCases) {
+  const result = redactPII(c.text);
+  check(`redactPII: ${c.name}`, { redactedText: c.redactedText, entities: c.entities }, result);
+}
+
+for (const c of incrementalCases) {
+  let text = c.text;
+  let state = createIncrementalRedaction(text);
+  c.edits.forEach((edit, i) => {
+    text = text.slice(0, edit.at) + edit.insert + text.slice(edit.at + edit.remove);
+    state = updateIncrementalRedaction(state, text);
+    const name = `updateIncrementalRedaction: ${c.name} (edit ${i + 1})`;
+    check(name, edit.entities, state.entities);
+    check(`${name} redactedText`, redactPII(text).redactedText, toRedactionResult(state).redactedText);
+  });
+}
+
+const total =
+  redactionCases.length + incrementalCases.reduce((n, c) => n + c.edits.length, 0);
+if (failures.length > 0) {
+  console.error(failures.join("\n\n"));
+  console.error(`\n${failures.length} PII check(s) failed`);
+  process.exit(1);
+}
+console.log(`${total} PII cases match`);
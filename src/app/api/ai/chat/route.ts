@@ -1,57 +1,22 @@
-import { createAIProvider, parseAIError } from "@/lib/ai/provider";
+import { createAIProvider, isFallbackError, parseAIError } from "@/lib/ai/provider";
+import { fallbackChain } from "@/lib/ai/fallback";
 import { getChatSystemPrompt } from "@/lib/ai/prompts";
 import { streamText } from "ai";
 import { NextRequest } from "next/server";
 import { createServerSupabaseClient } from "@/lib/supabase/server";
+import { getChatClientContext } from "@/lib/ai/chat-context";
+import { encodeChatEvent } from "@/lib/ai/chat-events";
+import type { ChatStreamEvent } from "@/lib/ai/chat-events";
+import { acquireAISlot, callOutcome, RATE_LIMIT_RETRIES } from "@/lib/ai/scheduler";
 
-async function buildClientContext(): Promise<string> {
-  const supabase = await createServerSupabaseClient();
-
-  const [clientsRes, meetingsRes, tasksRes] = await Promise.all([
-    supabase.from("clients").select("*").order("name"),
-    supabase
-      .from("meetings")
-      .select("id, title, client_id, status, created_at, clients(name)")
-      .order("created_at", { ascending: false })
-      .limit(10),
-    supabase
-      .from("tasks")
-      .select("*, clients(name)")
-      .eq("status", "pending")
-      .order("due_date", { ascending: true }),
-  ]);
-
-  const clients = clientsRes.data || [];
-  const meetings = meetingsRes.data || [];
-  const tasks = tasksRes.data || [];
-
-  let context = "## Client Book\n";
-  for (const c of clients) {
-    context += `- **${c.name}**: AUM $${Number(c.aum_value).toLocaleString()}, Risk: ${c.risk_tolerance}, Status: ${c.status}`;
-    if (c.notes) context += `, Notes: ${c.notes}`;
-    context += "\n";
-  }
-
-  context += "\n## Recent Meetings\n";
-  for (const m of meetings) {
-    const clientName = (m.clients as unknown as { name: string } | null)?.name || "Unknown";
-    context += `- "${m.title}" with ${clientName} (${m.status}) — ${new Date(m.created_at).toLocaleDateString()}\n`;
-  }
-
-  context += "\n## Pending Tasks\n";
-  for (const t of tasks) {
-    const clientName = (t.clients as unknown as { name: string } | null)?.name || "Unknown";
-    context += `- [${t.priority}] ${t.description} — for ${clientName}`;
-    if (t.due_date) context += ` (due ${new Date(t.due_date).toLocaleDateString()})`;
-    context += "\n";
-  }
-
-  return context;
-}
+// User turns embedded as the retrieval query; the previous turn resolves
+// follow-ups like "what about their tasks?".
+const RETRIEVAL_QUERY_TURNS = 2;
 
 export async function POST(req: NextRequest) {
   try {
-    const { apiKey, messages, model } = await req.json();
+    const { apiKey, messages, model, fallbackModels, conversationId, historySummary } =
+      await req.json();
 
     if (!apiKey) {
       return new Response(JSON.stringify({ error: "API key is required" }), {
@@ -61,37 +26,89 @@ export async function POST(req: NextRequest) {
     }
 
     const selectedModel = model || "gemini-2.0-flash";
-    const aiModel = createAIProvider(apiKey, selectedModel);
-    const clientContext = await buildClientContext();
-    const systemPrompt = getChatSystemPrompt(clientContext);
-
-    const result = streamText({
-      model: aiModel,
-      system: systemPrompt,
-      messages,
+    const models = fallbackChain(selectedModel, fallbackModels);
+    const query = (messages as { role: string; content: string }[])
+      .filter((m) => m.role === "user")
+      .slice(-RETRIEVAL_QUERY_TURNS)
+      .map((m) => m.content)
+      .join("\n");
+    const clientContext = await getChatClientContext(await createServerSupabaseClient(), {
+      conversationId,
+      retrieval: { apiKey, model: selectedModel, query },
     });
+    const systemPrompt = getChatSystemPrompt(clientContext, historySummary);
 
-    // Wrap the stream to catch mid-stream errors (e.g. 429 quota)
-    const encoder = new TextEncoder();
-    const stream = new ReadableStream({
+    // Mid-stream failures (e.g. 429 quota) become a typed error event. The
+    // call holds an interactive scheduler slot for the whole stream. Until
+    // text has been sent, a rate-limited attempt is retried and quota or
+    // availability errors move on to the next model in the fallback chain.
+    const stream = new ReadableStream<Uint8Array>({
       async start(controller) {
-        try {
-          for await (const chunk of result.textStream) {
-            controller.enqueue(encoder.encode(chunk));
+        const send = (event: ChatStreamEvent) => controller.enqueue(encodeChatEvent(event));
+        const toError = (streamError: unknown): ChatStreamEvent => {
+          const { message, isQuota } = parseAIError(streamError);
+          console.error("Chat stream error:", message);
+          return { type: "error", error: message, isQuota };
+        };
+        let end: ChatStreamEvent = { type: "done" };
+        let modelIndex = 0;
+        for (let attempt = 0; ; attempt++) {
+          const currentModel = models[modelIndex];
+          const hasFallback = modelIndex < models.length - 1;
+          const release = await acquireAISlot(apiKey, "interactive", currentModel);
+          let sentText = false;
+          let failure: { error: unknown } | null = null;
+          try {
+            const result = streamText({
+              model: createAIProvider(apiKey, currentModel),
+              system: systemPrompt,
+              messages,
+            });
+            for await (const part of result.fullStream) {
+              if (part.type === "text-delta") {
+                sentText = true;
+                send({ type: "delta", text: part.text });
+              } else if (part.type === "error") {
+                failure = { error: part.error };
+                break;
+              } else if (part.type === "finish") {
+                send({
+                  type: "usage",
+                  inputTokens: part.totalUsage.inputTokens ?? null,
+                  outputTokens: part.totalUsage.outputTokens ?? null,
+                });
+              }
+            }
+          } catch (streamError) {
+            failure = { error: streamError };
           }
-          controller.close();
-        } catch (streamError) {
-          const { message } = parseAIError(streamError);
-          controller.enqueue(
-            encoder.encode(`\n\n[STREAM_ERROR]${message}`)
-          );
-          controller.close();
+
+          const outcome = failure ? callOutcome(failure.error) : "ok";
+          release(outcome);
+          if (failure && !sentText) {
+            if (hasFallback && isFallbackError(failure.error)) {
+              console.warn(`Chat failed on ${currentModel}:`, parseAIError(failure.error).message);
+              modelIndex++;
+              attempt = -1;
+              send({ type: "fallback", model: models[modelIndex] });
+              continue;
+            }
+            if (outcome === "rate_limited" && attempt < RATE_LIMIT_RETRIES) continue;
+          }
+          if (failure) end = toError(failure.error);
+          break;
         }
+        send(end);
+        controller.close();
       },
     });
 
     return new Response(stream, {
-      headers: { "Content-Type": "text/plain; charset=utf-8" },
+      headers: {
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache, no-transform",
+        Connection: "keep-alive",
+      },
     });
   } catch (error: unknown) {
     const { message, isQuota } = parseAIError(error);
@@ -0,0 +1,57 @@
+import { createAIProvider, parseAIError } from "@/lib/ai/provider";
+import { CHAT_HISTORY_SUMMARY_PROMPT } from "@/lib/ai/prompts";
+import type { HistoryMessage } from "@/lib/ai/chat-history";
+import { runWithFallback } from "@/lib/ai/fallback";
+import { RATE_LIMIT_RETRIES, scheduleAICall } from "@/lib/ai/scheduler";
+import { generateText } from "ai";
+import { NextRequest, NextResponse } from "next/server";
+
+export async function POST(req: NextRequest) {
+  try {
+    const { apiKey, model, fallbackModels, summary, messages } = await req.json();
+
+    if (!apiKey) {
+      return NextResponse.json(
+        { error: "API key is required" },
+        { status: 401 }
+      );
+    }
+
+    if (!Array.isArray(messages) || messages.length === 0) {
+      return NextResponse.json(
+        { error: "Messages are required" },
+        { status: 400 }
+      );
+    }
+
+    const transcript = (messages as HistoryMessage[])
+      .map((m) => `${m.role === "user" ? "Advisor" : "Assistant"}: ${m.content}`)
+      .join("\n\n");
+
+    const { value } = await runWithFallback(
+      "chat",
+      { model: model || "gemini-2.0-flash", fallbackModels },
+      (attemptModel, signal, isLast) =>
+        scheduleAICall(
+          apiKey,
+          () =>
+            generateText({
+              model: createAIProvider(apiKey, attemptModel),
+              system: CHAT_HISTORY_SUMMARY_PROMPT,
+              prompt: `## Existing Summary\n${summary || "(none)"}\n\n## New Messages\n${transcript}`,
+              abortSignal: signal,
+            }),
+          { model: attemptModel, retries: isLast ? RATE_LIMIT_RETRIES : 0 }
+        )
+    );
+
+    return NextResponse.json({ data: { summary: value.text.trim() } });
+  } catch (error: unknown) {
+    const { message, isQuota } = parseAIError(error);
+    console.error("Chat summary error:", message);
+    return NextResponse.json(
+      { error: message, isQuota },
+      { status: isQuota ? 402 : 500 }
+    );
+  }
+}
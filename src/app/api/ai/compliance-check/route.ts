@@ -1,12 +1,13 @@
-import { createAIProvider, parseAIError } from "@/lib/ai/provider";
-import { COMPLIANCE_SENTINEL_PROMPT } from "@/lib/ai/prompts";
-import { ComplianceFlagSchema } from "@/lib/ai/schemas";
-import { generateObject } from "ai";
+import { parseAIError } from "@/lib/ai/provider";
+import { complianceCacheKey, reviewCompliance } from "@/lib/ai/meeting-analysis";
+import { aiCacheHeaders, cachedAIResult } from "@/lib/ai/result-cache";
+import { createServerSupabaseClient } from "@/lib/supabase/server";
 import { NextRequest, NextResponse } from "next/server";
 
 export async function POST(req: NextRequest) {
   try {
-    const { apiKey, emailDraft, clientRiskTolerance, model } = await req.json();
+    const { apiKey, emailDraft, clientRiskTolerance, model, fallbackModels } =
+      await req.json();
 
     if (!apiKey) {
       return NextResponse.json(
@@ -22,17 +23,24 @@ export async function POST(req: NextRequest) {
       );
     }
 
-    const selectedModel = model || "gemini-2.0-flash";
-    const aiModel = createAIProvider(apiKey, selectedModel);
-
-    const result = await generateObject({
-      model: aiModel,
-      schema: ComplianceFlagSchema,
-      system: COMPLIANCE_SENTINEL_PROMPT,
-      prompt: `Client risk tolerance: ${clientRiskTolerance || "Balanced"}\n\nReview this email draft for compliance issues:\n\n${emailDraft}`,
-    });
+    const input = {
+      apiKey,
+      model,
+      emailDraft,
+      riskTolerance: clientRiskTolerance,
+      priority: "interactive" as const,
+      fallbackModels,
+    };
+    const result = await cachedAIResult(
+      complianceCacheKey(input),
+      () => reviewCompliance(input),
+      { supabase: await createServerSupabaseClient() }
+    );
 
-    return NextResponse.json({ data: result.object });
+    return NextResponse.json(
+      { data: result.value },
+      { headers: aiCacheHeaders(result) }
+    );
   } catch (error: unknown) {
     const { message, isQuota } = parseAIError(error);
     console.error("Compliance check error:", message);
@@ -1,13 +1,26 @@
-import { createAIProvider, parseAIError } from "@/lib/ai/provider";
-import { getMeetingProcessorPrompt } from "@/lib/ai/prompts";
-import { MeetingOutputSchema } from "@/lib/ai/schemas";
-import { generateObject } from "ai";
+import { parseAIError } from "@/lib/ai/provider";
+import { acquireAISlot, callOutcome } from "@/lib/ai/scheduler";
+import {
+  analyzeMeeting,
+  meetingAnalysisCacheKey,
+  startMeetingAnalysisStream,
+} from "@/lib/ai/meeting-analysis";
+import { aiCacheHeaders, cachedAIResult } from "@/lib/ai/result-cache";
+import { createServerSupabaseClient } from "@/lib/supabase/server";
 import { NextRequest, NextResponse } from "next/server";
 
 export async function POST(req: NextRequest) {
   try {
-    const { apiKey, transcript, clientName, riskTolerance, aumValue, model } =
-      await req.json();
+    const {
+      apiKey,
+      transcript,
+      clientName,
+      riskTolerance,
+      aumValue,
+      model,
+      fallbackModels,
+      stream,
+    } = await req.json();
 
     if (!apiKey) {
       return NextResponse.json(
@@ -23,22 +36,48 @@ export async function POST(req: NextRequest) {
       );
     }
 
-    const selectedModel = model || "gemini-2.0-flash";
-    const aiModel = createAIProvider(apiKey, selectedModel);
-    const systemPrompt = getMeetingProcessorPrompt(
-      clientName || "Client",
-      riskTolerance || "Balanced",
-      aumValue || 0
-    );
+    const input = {
+      apiKey,
+      model,
+      transcript,
+      clientName,
+      riskTolerance,
+      aumValue,
+      fallbackModels,
+    };
+
+    // Streaming mode: partial JSON objects, email_draft first. Runs on the
+    // selected model only; the client owns the stream.
+    if (stream) {
+      const release = await acquireAISlot(apiKey, "batch", model);
+      // Neither callback is guaranteed to fire when the client disconnects,
+      // so an abort releases the slot too (release is idempotent).
+      if (req.signal.aborted) {
+        release("error");
+        return new Response(null, { status: 499 });
+      }
+      req.signal.addEventListener("abort", () => release("error"), { once: true });
+      return startMeetingAnalysisStream(
+        input,
+        (error) => {
+          release(callOutcome(error));
+          console.error("Process meeting stream error:", parseAIError(error).message);
+        },
+        () => release("ok"),
+        req.signal
+      ).toTextStreamResponse();
+    }
 
-    const result = await generateObject({
-      model: aiModel,
-      schema: MeetingOutputSchema,
-      system: systemPrompt,
-      prompt: `Process this meeting transcript:\n\n${transcript}`,
-    });
+    const result = await cachedAIResult(
+      meetingAnalysisCacheKey(input),
+      () => analyzeMeeting(input),
+      { supabase: await createServerSupabaseClient() }
+    );
 
-    return NextResponse.json({ data: result.object });
+    return NextResponse.json(
+      { data: result.value },
+      { headers: aiCacheHeaders(result) }
+    );
   } catch (error: unknown) {
     const { message, isQuota } = parseAIError(error);
     console.error("Process meeting error:", message);
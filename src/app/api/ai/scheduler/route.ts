@@ -0,0 +1,10 @@
+import { getSchedulerMetrics } from "@/lib/ai/scheduler";
+import { NextResponse } from "next/server";
+
+export const dynamic = "force-dynamic";
+
+// Queue depth, concurrency window and wait-time percentiles for this server
+// instance's LLM scheduler. Keys appear only as short hash prefixes.
+export async function GET() {
+  return NextResponse.json({ data: getSchedulerMetrics() });
+}
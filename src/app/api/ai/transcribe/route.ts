@@ -1,5 +1,13 @@
 import { createAIProvider, parseAIError } from "@/lib/ai/provider";
-import { TRANSCRIPTION_PROMPT } from "@/lib/ai/prompts";
+import {
+  TRANSCRIPTION_PROMPT,
+  getSegmentTranscriptionPrompt,
+} from "@/lib/ai/prompts";
+import { TRANSCRIBE_HEADERS, parseSegmentHeader } from "@/lib/ai/transcribe-upload";
+import type { TranscribeSegment } from "@/lib/ai/transcribe-upload";
+import { runWithFallback } from "@/lib/ai/fallback";
+import { RATE_LIMIT_RETRIES, scheduleAICall } from "@/lib/ai/scheduler";
+import { readBodyWithLimit } from "@/lib/utils/request-body";
 import { generateText } from "ai";
 import { NextRequest, NextResponse } from "next/server";
 
@@ -26,10 +34,67 @@ const SUPPORTED_TEXT_TYPES = new Set([
   "text/csv",
 ]);
 
+interface TranscribeInput {
+  apiKey: string | null;
+  model: string | null;
+  mode: string | null;
+  fileName: string | null;
+  mimeType: string;
+  /** Base64 string in JSON mode, raw bytes when the body is streamed. */
+  fileData: string | Uint8Array | null;
+  /** Set when the file is one window of a longer, segmented recording. */
+  segment: TranscribeSegment | null;
+  fallbackModels: string[];
+}
+
+function tooLargeResponse() {
+  return NextResponse.json(
+    { error: `File too large. Maximum size is ${MAX_FILE_SIZE / 1024 / 1024}MB.` },
+    { status: 413 }
+  );
+}
+
 export async function POST(req: NextRequest) {
   try {
-    const { apiKey, fileData, mimeType, fileName, model, mode } =
-      await req.json();
+    const contentType = req.headers.get("content-type") || "";
+    let input: TranscribeInput;
+
+    if (contentType.startsWith("application/json")) {
+      const { apiKey, fileData, mimeType, fileName, model, mode, segment, fallbackModels } =
+        await req.json();
+      input = {
+        apiKey,
+        fileData,
+        mimeType,
+        fileName,
+        model,
+        mode,
+        segment: segment || null,
+        fallbackModels: Array.isArray(fallbackModels) ? fallbackModels : [],
+      };
+    } else {
+      // Streaming mode: the body is the file, metadata travels in headers
+      const fileName = req.headers.get(TRANSCRIBE_HEADERS.fileName);
+      input = {
+        apiKey: req.headers.get(TRANSCRIBE_HEADERS.apiKey),
+        model: req.headers.get(TRANSCRIBE_HEADERS.model),
+        mode: req.headers.get(TRANSCRIBE_HEADERS.mode),
+        fileName: fileName ? decodeURIComponent(fileName) : null,
+        mimeType: contentType,
+        fileData: null,
+        segment: parseSegmentHeader(req.headers.get(TRANSCRIBE_HEADERS.segment)),
+        fallbackModels: (req.headers.get(TRANSCRIBE_HEADERS.fallbackModels) || "")
+          .split(",")
+          .filter(Boolean),
+      };
+      if (input.apiKey) {
+        input.fileData = await readBodyWithLimit(req, MAX_FILE_SIZE);
+        if (!input.fileData) return tooLargeResponse();
+      }
+    }
+
+    const { apiKey, fileData, mimeType, fileName, model, mode, segment, fallbackModels } =
+      input;
 
     if (!apiKey) {
       return NextResponse.json(
@@ -38,7 +103,7 @@ export async function POST(req: NextRequest) {
       );
     }
 
-    if (!fileData) {
+    if (!fileData || fileData.length === 0) {
       return NextResponse.json(
         { error: "File data is required" },
         { status: 400 }
@@ -46,21 +111,20 @@ export async function POST(req: NextRequest) {
     }
 
     // Validate file size (base64 is ~33% larger than binary)
-    const estimatedSize = (fileData.length * 3) / 4;
+    const estimatedSize =
+      typeof fileData === "string" ? (fileData.length * 3) / 4 : fileData.byteLength;
     if (estimatedSize > MAX_FILE_SIZE) {
-      return NextResponse.json(
-        { error: `File too large. Maximum size is ${MAX_FILE_SIZE / 1024 / 1024}MB.` },
-        { status: 413 }
-      );
+      return tooLargeResponse();
     }
 
     const selectedModel = model || "gemini-2.0-flash";
-    const aiModel = createAIProvider(apiKey, selectedModel);
 
     // Mode: "audio" for audio transcription, "text" for text extraction
     if (mode === "text") {
-      // For text files, decode base64 directly
-      const textContent = Buffer.from(fileData, "base64").toString("utf-8");
+      const textContent =
+        typeof fileData === "string"
+          ? Buffer.from(fileData, "base64").toString("utf-8")
+          : new TextDecoder().decode(fileData);
       return NextResponse.json({
         data: {
           transcript: textContent,
@@ -82,22 +146,40 @@ export async function POST(req: NextRequest) {
       );
     }
 
-    const result = await generateText({
-      model: aiModel,
-      messages: [
-        {
-          role: "user",
-          content: [
-            { type: "text", text: TRANSCRIPTION_PROMPT },
-            {
-              type: "file",
-              mediaType: baseMime as `audio/${string}`,
-              data: fileData,
-            },
-          ],
-        },
-      ],
-    });
+    const { value: result, model: usedModel } = await runWithFallback(
+      "transcription",
+      { model: selectedModel, fallbackModels },
+      (attemptModel, signal, isLast) =>
+        scheduleAICall(
+          apiKey,
+          () =>
+            generateText({
+              model: createAIProvider(apiKey, attemptModel),
+              abortSignal: signal,
+              messages: [
+                {
+                  role: "user",
+                  content: [
+                    {
+                      type: "text",
+                      text: segment
+                        ? getSegmentTranscriptionPrompt(segment.index, segment.total)
+                        : TRANSCRIPTION_PROMPT,
+                    },
+                    {
+                      type: "file",
+                      mediaType: baseMime as `audio/${string}`,
+                      data: fileData,
+                    },
+                  ],
+                },
+              ],
+            }),
+          { model: attemptModel, retries: isLast ? RATE_LIMIT_RETRIES : 0 }
+        )
+      // Not hedged: latency scales with audio length, so a p95 across
+      // uploads of every size would hedge long recordings needlessly.
+    );
 
     if (!result.text || result.text.trim().length === 0) {
       return NextResponse.json(
@@ -111,6 +193,7 @@ export async function POST(req: NextRequest) {
         transcript: result.text.trim(),
         source: "audio_transcription",
         fileName,
+        model: usedModel,
         tokensUsed: result.usage?.totalTokens || 0,
       },
     });
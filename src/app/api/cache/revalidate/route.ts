@@ -0,0 +1,24 @@
+import { revalidateBookData } from "@/lib/cache/book-data";
+import { BOOK_TAGS } from "@/lib/cache/book-tags";
+import type { BookTag } from "@/lib/cache/book-tags";
+import { NextRequest, NextResponse } from "next/server";
+
+// Purges book-data cache tags after writes made from the browser (e.g. the
+// meeting workbench).
+export async function POST(req: NextRequest) {
+  const { tags } = await req.json().catch(() => ({}));
+
+  if (
+    !Array.isArray(tags) ||
+    tags.length === 0 ||
+    !tags.every((t) => BOOK_TAGS.includes(t as BookTag))
+  ) {
+    return NextResponse.json(
+      { error: `Tags must be some of: ${BOOK_TAGS.join(", ")}` },
+      { status: 400 }
+    );
+  }
+
+  revalidateBookData(...(tags as BookTag[]));
+  return NextResponse.json({ data: { revalidated: tags } });
+}
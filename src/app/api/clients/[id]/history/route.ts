@@ -0,0 +1,30 @@
+import { getClientHistoryPage } from "@/lib/cache/book-data";
+import { isClientHistoryKind } from "@/lib/clients/history-query";
+import { NextRequest, NextResponse } from "next/server";
+
+interface RouteContext {
+  params: Promise<{ id: string }>;
+}
+
+// Older meetings or tasks of a client (?kind=meetings|tasks&cursor=...).
+export async function GET(req: NextRequest, { params }: RouteContext) {
+  try {
+    const { id } = await params;
+    const searchParams = req.nextUrl.searchParams;
+    const kind = searchParams.get("kind");
+    if (!isClientHistoryKind(kind)) {
+      return NextResponse.json(
+        { error: "kind must be meetings or tasks" },
+        { status: 400 }
+      );
+    }
+
+    const data = await getClientHistoryPage(id, kind, searchParams.get("cursor") || null);
+    return NextResponse.json({ data });
+  } catch (error: unknown) {
+    const message =
+      error instanceof Error ? error.message : "Failed to load client history";
+    console.error("Client history error:", message);
+    return NextResponse.json({ error: message }, { status: 500 });
+  }
+}
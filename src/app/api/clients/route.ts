@@ -0,0 +1,20 @@
+import { getClientPage } from "@/lib/cache/book-data";
+import { parseClientListFilters } from "@/lib/clients/list-query";
+import { NextRequest, NextResponse } from "next/server";
+
+// Later pages of the client list; the first page is rendered with the page.
+export async function GET(req: NextRequest) {
+  try {
+    const params = req.nextUrl.searchParams;
+    const data = await getClientPage(
+      parseClientListFilters(params),
+      params.get("cursor") || null
+    );
+    return NextResponse.json({ data });
+  } catch (error: unknown) {
+    const message =
+      error instanceof Error ? error.message : "Failed to load clients";
+    console.error("Client list error:", message);
+    return NextResponse.json({ error: message }, { status: 500 });
+  }
+}
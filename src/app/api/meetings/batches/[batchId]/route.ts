@@ -0,0 +1,66 @@
+import { getBatchJobs, runMeetingBatch } from "@/lib/jobs/meeting-batch";
+import { streamJobEvents } from "@/lib/jobs/meeting-job";
+import { encodeBatchEvent } from "@/lib/jobs/meeting-job-events";
+import { createServerSupabaseClient } from "@/lib/supabase/server";
+import { NextRequest, NextResponse, after } from "next/server";
+
+export const maxDuration = 300;
+
+interface RouteContext {
+  params: Promise<{ batchId: string }>;
+}
+
+// Status of every job in the batch, without transcripts.
+export async function GET(_req: NextRequest, { params }: RouteContext) {
+  try {
+    const { batchId } = await params;
+    const supabase = await createServerSupabaseClient();
+    const data = await getBatchJobs(supabase, batchId);
+    if (data.length === 0) {
+      return NextResponse.json({ error: "Import not found" }, { status: 404 });
+    }
+    return NextResponse.json({ data });
+  } catch (error: unknown) {
+    const message =
+      error instanceof Error ? error.message : "Failed to load import";
+    return NextResponse.json({ error: message }, { status: 500 });
+  }
+}
+
+// Runs the batch's queued jobs (plus failed ones with `retryFailed`) and
+// streams their progress. A run ends after a time budget; the client starts
+// another while jobs remain queued.
+export async function POST(req: NextRequest, { params }: RouteContext) {
+  try {
+    const { batchId } = await params;
+    const { apiKey, model, fallbackChains, retryFailed } = await req.json();
+
+    if (!apiKey) {
+      return NextResponse.json(
+        { error: "API key is required" },
+        { status: 401 }
+      );
+    }
+
+    const supabase = await createServerSupabaseClient();
+    const { response, done } = streamJobEvents(encodeBatchEvent, (emit) =>
+      runMeetingBatch(
+        supabase,
+        batchId,
+        { apiKey, model, fallbackChains },
+        emit,
+        { retryFailed: Boolean(retryFailed) }
+      ).catch((error) => {
+        console.error(`Meeting batch ${batchId} run failed:`, error);
+      })
+    );
+    // Keep running after the response if the client disconnects.
+    after(() => done);
+    return response;
+  } catch (error: unknown) {
+    const message =
+      error instanceof Error ? error.message : "Failed to run import";
+    console.error("Meeting batch run error:", message);
+    return NextResponse.json({ error: message }, { status: 500 });
+  }
+}
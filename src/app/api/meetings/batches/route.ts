@@ -0,0 +1,55 @@
+import { createMeetingBatch, MAX_BATCH_BYTES, MAX_BATCH_ITEMS } from "@/lib/jobs/meeting-batch";
+import type { MeetingBatchItem } from "@/lib/jobs/meeting-batch";
+import { createServerSupabaseClient } from "@/lib/supabase/server";
+import { readBodyWithLimit } from "@/lib/utils/request-body";
+import { NextRequest, NextResponse } from "next/server";
+
+// Creates a batch import, or adds items to `batchId`. Large imports are sent
+// in chunks of up to MAX_BATCH_ITEMS and MAX_BATCH_BYTES; nothing is
+// processed until a run.
+export async function POST(req: NextRequest) {
+  try {
+    const body = await readBodyWithLimit(req, MAX_BATCH_BYTES);
+    if (!body) {
+      return NextResponse.json(
+        { error: `At most ${MAX_BATCH_BYTES / (1024 * 1024)}MB per request` },
+        { status: 413 }
+      );
+    }
+
+    const { batchId, items } = JSON.parse(new TextDecoder().decode(body)) as {
+      batchId?: string | null;
+      items?: MeetingBatchItem[];
+    };
+
+    if (!Array.isArray(items) || items.length === 0) {
+      return NextResponse.json(
+        { error: "Items are required" },
+        { status: 400 }
+      );
+    }
+
+    if (items.length > MAX_BATCH_ITEMS) {
+      return NextResponse.json(
+        { error: `At most ${MAX_BATCH_ITEMS} items per request` },
+        { status: 400 }
+      );
+    }
+
+    if (items.some((item) => !item?.clientId || !item.transcript?.trim())) {
+      return NextResponse.json(
+        { error: "Every item needs a client and a transcript" },
+        { status: 400 }
+      );
+    }
+
+    const supabase = await createServerSupabaseClient();
+    const data = await createMeetingBatch(supabase, items, batchId || undefined);
+    return NextResponse.json({ data });
+  } catch (error: unknown) {
+    const message =
+      error instanceof Error ? error.message : "Failed to create import";
+    console.error("Meeting batch error:", message);
+    return NextResponse.json({ error: message }, { status: 500 });
+  }
+}
@@ -0,0 +1,65 @@
+import { claimMeetingJob, streamMeetingJob } from "@/lib/jobs/meeting-job";
+import { createServerSupabaseClient } from "@/lib/supabase/server";
+import { NextRequest, NextResponse, after } from "next/server";
+
+export const maxDuration = 300;
+
+interface RouteContext {
+  params: Promise<{ jobId: string }>;
+}
+
+// Job status, without the transcript.
+export async function GET(_req: NextRequest, { params }: RouteContext) {
+  const { jobId } = await params;
+  const supabase = await createServerSupabaseClient();
+  const { data, error } = await supabase
+    .from("meeting_jobs")
+    .select("id, client_id, meeting_id, status, current_step, attempts, error, created_at, updated_at")
+    .eq("id", jobId)
+    .maybeSingle();
+
+  if (error) {
+    return NextResponse.json({ error: error.message }, { status: 500 });
+  }
+  if (!data) {
+    return NextResponse.json({ error: "Job not found" }, { status: 404 });
+  }
+  return NextResponse.json({ data });
+}
+
+// Resumes a failed (or abandoned) job from its last checkpoint.
+export async function POST(req: NextRequest, { params }: RouteContext) {
+  try {
+    const { jobId } = await params;
+    const { apiKey, model, fallbackChains } = await req.json();
+
+    if (!apiKey) {
+      return NextResponse.json(
+        { error: "API key is required" },
+        { status: 401 }
+      );
+    }
+
+    const supabase = await createServerSupabaseClient();
+    const job = await claimMeetingJob(supabase, jobId);
+    if (!job) {
+      return NextResponse.json(
+        { error: "Job is not resumable — it is running or already finished" },
+        { status: 409 }
+      );
+    }
+
+    const { response, done } = streamMeetingJob(supabase, job, {
+      apiKey,
+      model,
+      fallbackChains,
+    });
+    after(() => done);
+    return response;
+  } catch (error: unknown) {
+    const message =
+      error instanceof Error ? error.message : "Failed to resume processing";
+    console.error("Meeting job retry error:", message);
+    return NextResponse.json({ error: message }, { status: 500 });
+  }
+}
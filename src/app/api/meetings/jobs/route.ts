@@ -0,0 +1,57 @@
+import { createMeetingJob, streamMeetingJob } from "@/lib/jobs/meeting-job";
+import { createServerSupabaseClient } from "@/lib/supabase/server";
+import { NextRequest, NextResponse, after } from "next/server";
+
+// Analysis and compliance calls (with retries) run inside this request.
+export const maxDuration = 300;
+
+export async function POST(req: NextRequest) {
+  try {
+    const {
+      apiKey,
+      model,
+      fallbackChains,
+      clientId,
+      title,
+      transcript,
+      sourceType,
+      sourceFileName,
+    } = await req.json();
+
+    if (!apiKey) {
+      return NextResponse.json(
+        { error: "API key is required" },
+        { status: 401 }
+      );
+    }
+
+    if (!clientId || !transcript) {
+      return NextResponse.json(
+        { error: "Client and transcript are required" },
+        { status: 400 }
+      );
+    }
+
+    const supabase = await createServerSupabaseClient();
+    const job = await createMeetingJob(supabase, clientId, {
+      title: title || "Untitled Meeting",
+      transcript,
+      source_type: sourceType || "paste",
+      source_file_name: sourceFileName || null,
+    });
+
+    const { response, done } = streamMeetingJob(supabase, job, {
+      apiKey,
+      model,
+      fallbackChains,
+    });
+    // Keep the job alive after the response if the client disconnects.
+    after(() => done);
+    return response;
+  } catch (error: unknown) {
+    const message =
+      error instanceof Error ? error.message : "Failed to start processing";
+    console.error("Meeting job error:", message);
+    return NextResponse.json({ error: message }, { status: 500 });
+  }
+}
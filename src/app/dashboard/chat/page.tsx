@@ -6,6 +6,10 @@ import { Button } from "@/components/ui/button";
 import { Textarea } from "@/components/ui/textarea";
 import { Badge } from "@/components/ui/badge";
 import { useApiKey } from "@/hooks/use-api-key";
+import { compactHistory, nextSummaryRange, summarizeHistory } from "@/lib/ai/chat-history";
+import type { HistorySummary } from "@/lib/ai/chat-history";
+import { readChatEvents } from "@/lib/ai/chat-events";
+import type { ChatStreamEvent } from "@/lib/ai/chat-events";
 import { toast } from "sonner";
 import {
   Send,
@@ -33,13 +37,22 @@ const SUGGESTED_QUESTIONS = [
 ];
 
 export default function ChatPage() {
-  const { apiKey, model, isKeySet, isLoaded } = useApiKey();
+  const { apiKey, model, fallbackChains, isKeySet, isLoaded } = useApiKey();
   const [messages, setMessages] = useState<ChatMessage[]>([]);
   const [input, setInput] = useState("");
   const [isStreaming, setIsStreaming] = useState(false);
   const messagesEndRef = useRef<HTMLDivElement>(null);
   const messagesRef = useRef<ChatMessage[]>([]);
   const textareaRef = useRef<HTMLTextAreaElement>(null);
+  // Lets the server reuse this conversation's client-book context across turns
+  const [conversationId] = useState(() => crypto.randomUUID());
+  // Rolling summary of turns older than the verbatim window
+  const summaryRef = useRef<HistorySummary | null>(null);
+  const summarizingRef = useRef(false);
+  const [summarizedCount, setSummarizedCount] = useState(0);
+  const [lastUsage, setLastUsage] = useState<Extract<ChatStreamEvent, { type: "usage" }> | null>(
+    null
+  );
 
   const scrollToBottom = useCallback(() => {
     messagesEndRef.current?.scrollIntoView({ behavior: "smooth" });
@@ -81,63 +94,59 @@ export default function ChatPage() {
     setIsStreaming(true);
 
     try {
-      const aiMessages = [...messagesRef.current]
-        .filter((m) => m.content)
-        .map((m) => ({ role: m.role, content: m.content }));
+      const history = compactHistory(messagesRef.current, summaryRef.current);
 
       const res = await fetch("/api/ai/chat", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ apiKey, messages: aiMessages, model }),
+        body: JSON.stringify({
+          apiKey,
+          messages: history.messages,
+          historySummary: history.summary,
+          model,
+          fallbackModels: fallbackChains?.chat,
+          conversationId,
+        }),
       });
 
-      if (!res.ok) {
-        const errData = await res.json();
-        if (errData.isQuota) {
-          toast.error(errData.error, {
-            description: "Try a different model in Settings.",
-            duration: 8000,
-          });
-          updateAssistantMessage(assistantMsg.id, "⚠️ " + errData.error);
-          return;
-        }
-        throw new Error(errData.error || "Chat request failed");
-      }
-
-      const reader = res.body?.getReader();
-      if (!reader) throw new Error("No response stream");
-
-      const decoder = new TextDecoder();
+      // Deltas accumulate here; React sees at most one update per frame
       let accumulated = "";
+      let frame: number | null = null;
+      const flush = () => {
+        frame = null;
+        updateAssistantMessage(assistantMsg.id, accumulated);
+      };
+      const outcome: { error: { error: string; isQuota: boolean } | null } = { error: null };
 
-      while (true) {
-        const { done, value } = await reader.read();
-        if (done) break;
-
-        const chunk = decoder.decode(value, { stream: true });
-        accumulated += chunk;
-
-        // Detect mid-stream errors from the server
-        const errorIdx = accumulated.indexOf("[STREAM_ERROR]");
-        if (errorIdx !== -1) {
-          const errorMsg = accumulated.slice(errorIdx + "[STREAM_ERROR]".length).trim();
-          const cleanContent = accumulated.slice(0, errorIdx).trim();
-          toast.error(errorMsg || "AI request failed", {
-            description: "Try a different model in Settings.",
-            duration: 8000,
-          });
-          updateAssistantMessage(
-            assistantMsg.id,
-            cleanContent || "⚠️ " + (errorMsg || "Request failed.")
-          );
-          break;
+      await readChatEvents(res, (event) => {
+        switch (event.type) {
+          case "delta":
+            accumulated += event.text;
+            if (frame === null) frame = requestAnimationFrame(flush);
+            break;
+          case "fallback":
+            toast.info(`Switched to ${event.model}`, {
+              description: "The selected model is out of quota or unavailable.",
+            });
+            break;
+          case "usage":
+            setLastUsage(event);
+            break;
+          case "error":
+            outcome.error = event;
+            break;
         }
+      });
+      if (frame !== null) cancelAnimationFrame(frame);
 
-        updateAssistantMessage(assistantMsg.id, accumulated);
-      }
-
-      // Final update with complete content
-      if (accumulated && !accumulated.includes("[STREAM_ERROR]")) {
+      if (outcome.error) {
+        const { error, isQuota } = outcome.error;
+        toast.error(error, {
+          description: isQuota ? "Try a different model in Settings." : undefined,
+          duration: 8000,
+        });
+        updateAssistantMessage(assistantMsg.id, accumulated.trim() || "⚠️ " + error);
+      } else {
         updateAssistantMessage(assistantMsg.id, accumulated);
       }
     } catch (error) {
@@ -150,9 +159,38 @@ export default function ChatPage() {
       );
     } finally {
       setIsStreaming(false);
+      compactOlderTurns();
     }
   }
 
+  /** Folds turns outside the verbatim window into the summary, off the send path. */
+  function compactOlderTurns() {
+    if (summarizingRef.current) return;
+    const conversation = messagesRef.current;
+    const range = nextSummaryRange(conversation, summaryRef.current);
+    if (!range) return;
+
+    summarizingRef.current = true;
+    summarizeHistory({
+      apiKey,
+      model,
+      fallbackModels: fallbackChains?.chat,
+      summary: summaryRef.current?.text,
+      messages: conversation.slice(range.start, range.end),
+    })
+      .then((text) => {
+        summaryRef.current = { text, coveredCount: range.end };
+        setSummarizedCount(range.end);
+      })
+      .catch((error) => {
+        // Older turns stay verbatim (within the token budget); retried next turn
+        console.warn("History summary failed:", error);
+      })
+      .finally(() => {
+        summarizingRef.current = false;
+      });
+  }
+
   function updateAssistantMessage(id: string, content: string) {
     const updated = messagesRef.current.map((m) =>
       m.id === id ? { ...m, content } : m
@@ -295,6 +333,9 @@ export default function ChatPage() {
                 <MessageSquare className="size-3 text-muted-foreground" />
                 <span className="text-[10px] text-muted-foreground">
                   {messages.filter((m) => m.role === "user").length} messages
+                  {summarizedCount > 0 && ` · ${summarizedCount / 2} earlier turns summarized`}
+                  {lastUsage?.inputTokens != null &&
+                    ` · last reply ${(lastUsage.inputTokens + (lastUsage.outputTokens ?? 0)).toLocaleString()} tokens`}
                 </span>
               </div>
               <Badge variant="outline" className="text-[10px]">
@@ -1,12 +1,12 @@
-import { createServerSupabaseClient } from "@/lib/supabase/server";
+import { getClientDetail } from "@/lib/cache/book-data";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
-import { formatCurrency, formatDate, formatDueDate } from "@/lib/utils/formatters";
-import { RISK_TOLERANCE_COLORS, PRIORITY_COLORS, STATUS_COLORS } from "@/lib/constants";
+import { ClientHistoryCard } from "@/components/clients/client-history";
+import { formatCurrency } from "@/lib/utils/formatters";
+import { RISK_TOLERANCE_COLORS } from "@/lib/constants";
 import { ArrowLeft, Mail, Phone, DollarSign } from "lucide-react";
 import Link from "next/link";
 import { notFound } from "next/navigation";
-import type { Client, Meeting, Task } from "@/types/database";
 
 interface Props {
   params: Promise<{ id: string }>;
@@ -14,26 +14,9 @@ interface Props {
 
 export default async function ClientDetailPage({ params }: Props) {
   const { id } = await params;
-  const supabase = await createServerSupabaseClient();
-
-  const [clientRes, meetingsRes, tasksRes] = await Promise.all([
-    supabase.from("clients").select("*").eq("id", id).single(),
-    supabase
-      .from("meetings")
-      .select("*")
-      .eq("client_id", id)
-      .order("created_at", { ascending: false }),
-    supabase
-      .from("tasks")
-      .select("*")
-      .eq("client_id", id)
-      .order("created_at", { ascending: false }),
-  ]);
-
-  if (!clientRes.data) notFound();
-  const client = clientRes.data as Client;
-  const meetings = (meetingsRes.data || []) as Meeting[];
-  const tasks = (tasksRes.data || []) as Task[];
+  const detail = await getClientDetail(id);
+  if (!detail) notFound();
+  const { client, meetings, tasks } = detail;
 
   return (
     <div className="space-y-6">
@@ -113,74 +96,8 @@ export default async function ClientDetailPage({ params }: Props) {
       )}
 
       <div className="grid gap-6 lg:grid-cols-2">
-        <Card>
-          <CardHeader>
-            <CardTitle className="text-base">
-              Meetings ({meetings.length})
-            </CardTitle>
-          </CardHeader>
-          <CardContent>
-            {meetings.length === 0 ? (
-              <p className="text-sm text-muted-foreground">No meetings yet.</p>
-            ) : (
-              <div className="space-y-3">
-                {meetings.map((m) => (
-                  <Link
-                    key={m.id}
-                    href={`/dashboard/meetings/${m.id}`}
-                    className="flex items-center justify-between rounded-lg border p-3 transition-colors hover:bg-accent"
-                  >
-                    <div>
-                      <p className="text-sm font-medium">{m.title}</p>
-                      <p className="text-xs text-muted-foreground">
-                        {formatDate(m.created_at)}
-                      </p>
-                    </div>
-                    <Badge
-                      variant="secondary"
-                      className={`text-xs ${STATUS_COLORS[m.status] || ""}`}
-                    >
-                      {m.status.replace("_", " ")}
-                    </Badge>
-                  </Link>
-                ))}
-              </div>
-            )}
-          </CardContent>
-        </Card>
-
-        <Card>
-          <CardHeader>
-            <CardTitle className="text-base">Tasks ({tasks.length})</CardTitle>
-          </CardHeader>
-          <CardContent>
-            {tasks.length === 0 ? (
-              <p className="text-sm text-muted-foreground">No tasks.</p>
-            ) : (
-              <div className="space-y-3">
-                {tasks.map((t) => (
-                  <div
-                    key={t.id}
-                    className="flex items-start justify-between rounded-lg border p-3"
-                  >
-                    <div>
-                      <p className="text-sm">{t.description}</p>
-                      <p className="text-xs text-muted-foreground">
-                        {formatDueDate(t.due_date)}
-                      </p>
-                    </div>
-                    <Badge
-                      variant="secondary"
-                      className={`text-xs ${PRIORITY_COLORS[t.priority] || ""}`}
-                    >
-                      {t.priority}
-                    </Badge>
-                  </div>
-                ))}
-              </div>
-            )}
-          </CardContent>
-        </Card>
+        <ClientHistoryCard clientId={client.id} kind="meetings" initialPage={meetings} />
+        <ClientHistoryCard clientId={client.id} kind="tasks" initialPage={tasks} />
       </div>
     </div>
   );
@@ -0,0 +1,9 @@
+import { Loader2 } from "lucide-react";
+
+export default function MeetingWorkbenchLoading() {
+  return (
+    <div className="flex items-center justify-center py-20">
+      <Loader2 className="size-6 animate-spin text-muted-foreground" />
+    </div>
+  );
+}
@@ -0,0 +1,594 @@
+"use client";
+
+import { useState, useEffect, useMemo, useRef } from "react";
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
+import { Button } from "@/components/ui/button";
+import { Badge } from "@/components/ui/badge";
+import { Label } from "@/components/ui/label";
+import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
+import {
+  Table,
+  TableBody,
+  TableCell,
+  TableHead,
+  TableHeader,
+  TableRow,
+} from "@/components/ui/table";
+import { useApiKey } from "@/hooks/use-api-key";
+import { createClient } from "@/lib/supabase/client";
+import { readBatchEvents, readJobEvents } from "@/lib/jobs/meeting-job-events";
+import type { MeetingJobEvent } from "@/lib/jobs/meeting-job-events";
+import { readZipEntries } from "@/lib/utils/zip";
+import { toast } from "sonner";
+import {
+  FolderUp,
+  FileArchive,
+  Loader2,
+  RotateCcw,
+  ShieldAlert,
+  Trash2,
+  Upload,
+} from "lucide-react";
+import type { Client, MeetingJobStatus } from "@/types/database";
+import Link from "next/link";
+
+const TEXT_EXTENSIONS = [".txt", ".md", ".csv"];
+const MAX_TRANSCRIPT_BYTES = 2 * 1024 * 1024;
+// Items and bytes per create request (the route's MAX_BATCH_ITEMS and
+// MAX_BATCH_BYTES).
+const CREATE_CHUNK_SIZE = 100;
+// Leaves room for the request envelope.
+const CREATE_CHUNK_BYTES = 4 * 1024 * 1024 - 16 * 1024;
+// Pause between consecutive runs of the same batch.
+const RUN_INTERVAL_MS = 2000;
+
+interface ImportItem {
+  path: string;
+  title: string;
+  transcript: string;
+  clientId: string;
+  jobId: string | null;
+  status: MeetingJobStatus | "new";
+  description: string | null;
+  meetingId: string | null;
+}
+
+const STATUS_BADGES: Record<ImportItem["status"], { label: string; className: string }> = {
+  new: { label: "Not started", className: "" },
+  queued: { label: "Queued", className: "" },
+  running: { label: "Processing", className: "bg-blue-100 text-blue-800 dark:bg-blue-900/30 dark:text-blue-300" },
+  succeeded: { label: "Ready", className: "bg-green-100 text-green-800 dark:bg-green-900/30 dark:text-green-300" },
+  failed: { label: "Failed", className: "bg-red-100 text-red-800 dark:bg-red-900/30 dark:text-red-300" },
+};
+
+function isTranscriptFile(path: string): boolean {
+  const ext = "." + path.split(".").pop()?.toLowerCase();
+  return TEXT_EXTENSIONS.includes(ext) && !path.split("/").some((p) => p.startsWith("."));
+}
+
+function normalizeName(value: string): string {
+  return value.toLowerCase().replace(/[^a-z0-9]+/g, " ").trim();
+}
+
+// A folder named after the client wins (e.g. "Jane Doe/2024-03-review.txt"),
+// then a client name inside the file name. Unmatched files use the default.
+function matchClient(path: string, clients: Client[]): string {
+  const parts = path.split("/").map(normalizeName);
+  const fileName = parts.pop() ?? "";
+  for (const folder of parts.reverse()) {
+    const match = clients.find((c) => normalizeName(c.name) === folder);
+    if (match) return match.id;
+  }
+  return clients.find((c) => fileName.includes(normalizeName(c.name)))?.id ?? "";
+}
+
+export default function ImportMeetingsPage() {
+  const { apiKey, model, fallbackChains, isKeySet, isLoaded } = useApiKey();
+  const [clients, setClients] = useState<Client[]>([]);
+  const [defaultClientId, setDefaultClientId] = useState("");
+  const [items, setItems] = useState<ImportItem[]>([]);
+  const [batchId, setBatchId] = useState<string | null>(null);
+  const [isReading, setIsReading] = useState(false);
+  const [isRunning, setIsRunning] = useState(false);
+  const folderInputRef = useRef<HTMLInputElement>(null);
+  const zipInputRef = useRef<HTMLInputElement>(null);
+  const quotaNotified = useRef(false);
+
+  useEffect(() => {
+    async function loadClients() {
+      const supabase = createClient();
+      const { data } = await supabase
+        .from("clients")
+        .select("*")
+        .order("name");
+      setClients((data || []) as Client[]);
+    }
+    loadClients();
+  }, []);
+
+  // React has no typed prop for directory pickers
+  useEffect(() => {
+    folderInputRef.current?.setAttribute("webkitdirectory", "");
+  }, []);
+
+  const counts = useMemo(() => {
+    const result = { total: items.length, succeeded: 0, failed: 0, queued: 0, unassigned: 0 };
+    for (const item of items) {
+      if (item.status === "succeeded") result.succeeded++;
+      if (item.jobId && item.status === "queued") result.queued++;
+      if (item.status === "failed") result.failed++;
+      if (!item.jobId && !item.clientId && !defaultClientId) result.unassigned++;
+    }
+    return result;
+  }, [items, defaultClientId]);
+
+  async function addFiles(files: FileList | null) {
+    if (!files?.length) return;
+    setIsReading(true);
+    const sources: { path: string; size: number; read: () => Promise<Blob> }[] = [];
+    try {
+      for (const file of Array.from(files)) {
+        if (file.name.toLowerCase().endsWith(".zip")) {
+          sources.push(...(await readZipEntries(file)));
+        } else {
+          sources.push({
+            path: file.webkitRelativePath || file.name,
+            size: file.size,
+            read: async () => file,
+          });
+        }
+      }
+
+      const known = new Set(items.map((i) => i.path));
+      const added: ImportItem[] = [];
+      let skipped = 0;
+      for (const source of sources) {
+        if (!isTranscriptFile(source.path) || known.has(source.path)) continue;
+        if (source.size > MAX_TRANSCRIPT_BYTES) {
+          skipped++;
+          continue;
+        }
+        const transcript = (await (await source.read()).text()).trim();
+        if (!transcript) {
+          skipped++;
+          continue;
+        }
+        known.add(source.path);
+        added.push({
+          path: source.path,
+          title: source.path.split("/").pop()!.replace(/\.[^/.]+$/, ""),
+          transcript,
+          clientId: matchClient(source.path, clients),
+          jobId: null,
+          status: "new",
+          description: null,
+          meetingId: null,
+        });
+      }
+
+      setItems((prev) => [...prev, ...added]);
+      if (added.length === 0) {
+        toast.error(`No transcripts found. Accepted: ${TEXT_EXTENSIONS.join(", ")}`);
+      } else {
+        toast.success(
+          `${added.length} transcript${added.length !== 1 ? "s" : ""} added` +
+            (skipped ? ` (${skipped} empty or over 2 MB skipped)` : "")
+        );
+      }
+    } catch (error) {
+      toast.error(error instanceof Error ? error.message : "Could not read files");
+    } finally {
+      setIsReading(false);
+    }
+  }
+
+  function updateItem(jobId: string, update: Partial<ImportItem>) {
+    setItems((prev) => prev.map((i) => (i.jobId === jobId ? { ...i, ...update } : i)));
+  }
+
+  function applyJobEvent(jobId: string, event: MeetingJobEvent) {
+    switch (event.type) {
+      case "step":
+        if (event.status !== "error") {
+          updateItem(jobId, { status: "running", description: event.description ?? null });
+        }
+        break;
+      case "done":
+        updateItem(jobId, {
+          status: "succeeded",
+          description: "Ready for review",
+          meetingId: event.meetingId,
+        });
+        break;
+      case "error":
+        updateItem(jobId, { status: "failed", description: event.error });
+        if (event.isQuota && !quotaNotified.current) {
+          quotaNotified.current = true;
+          toast.error(event.error, {
+            description: "Go to Settings → switch to Google Gemini (free).",
+            duration: 8000,
+          });
+        }
+        break;
+    }
+  }
+
+  // Starts runs until no jobs are left queued; each run ends after a time
+  // budget on the server. Stops early if a run makes no progress (e.g. the
+  // server cannot claim jobs), rather than retrying it in a loop.
+  async function runBatch(id: string, retryFailed: boolean) {
+    setIsRunning(true);
+    quotaNotified.current = false;
+    if (retryFailed) {
+      setItems((prev) =>
+        prev.map((i) => (i.status === "failed" ? { ...i, status: "queued", description: null } : i))
+      );
+    }
+    try {
+      let previousQueued = Infinity;
+      for (let first = true; ; first = false) {
+        if (!first) await new Promise((resolve) => setTimeout(resolve, RUN_INTERVAL_MS));
+        const run: { queued: number | null } = { queued: null };
+        const res = await fetch(`/api/meetings/batches/${id}`, {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({
+            apiKey,
+            model,
+            fallbackChains,
+            retryFailed: retryFailed && first,
+          }),
+        });
+        await readBatchEvents(res, (event) => {
+          if (event.type === "item") applyJobEvent(event.jobId, event.event);
+          else run.queued = event.counts.queued;
+        });
+        if (!run.queued) break;
+        if (run.queued >= previousQueued) {
+          toast.error("The import stopped making progress", {
+            description: `${run.queued} transcript${run.queued !== 1 ? "s are" : " is"} still queued. Resume to continue.`,
+          });
+          break;
+        }
+        previousQueued = run.queued;
+      }
+    } catch (error) {
+      console.error("Import run error:", error);
+      toast.error(error instanceof Error ? error.message : "Import was interrupted");
+    } finally {
+      setIsRunning(false);
+    }
+  }
+
+  // Serialized items grouped into create requests within the route's item
+  // and byte limits.
+  function createChunks(pending: ImportItem[]) {
+    const encoder = new TextEncoder();
+    const chunks: { item: ImportItem; json: string }[][] = [];
+    let current: { item: ImportItem; json: string }[] = [];
+    let bytes = 0;
+    for (const item of pending) {
+      const json = JSON.stringify({
+        clientId: item.clientId || defaultClientId,
+        title: item.title,
+        transcript: item.transcript,
+        sourceFileName: item.path,
+      });
+      const size = encoder.encode(json).byteLength;
+      if (
+        current.length > 0 &&
+        (current.length >= CREATE_CHUNK_SIZE || bytes + size > CREATE_CHUNK_BYTES)
+      ) {
+        chunks.push(current);
+        current = [];
+        bytes = 0;
+      }
+      current.push({ item, json });
+      bytes += size;
+    }
+    if (current.length > 0) chunks.push(current);
+    return chunks;
+  }
+
+  async function handleImport() {
+    if (!isKeySet) {
+      toast.error("Please configure your API key in Settings");
+      return;
+    }
+    const pending = items.filter((i) => !i.jobId && (i.clientId || defaultClientId));
+    if (pending.length === 0) {
+      toast.error("Assign a client to the transcripts first");
+      return;
+    }
+
+    setIsRunning(true);
+    let id = batchId;
+    try {
+      for (const chunk of createChunks(pending)) {
+        const res = await fetch("/api/meetings/batches", {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: `{"batchId":${JSON.stringify(id ?? null)},"items":[${chunk.map((c) => c.json).join(",")}]}`,
+        });
+        const data = await res.json();
+        if (!res.ok) throw new Error(data.error || "Failed to create import");
+
+        id = data.data.batchId as string;
+        const jobIds = new Map(
+          chunk.map(({ item }, j) => [item.path, data.data.jobIds[j] as string])
+        );
+        setBatchId(id);
+        setItems((prev) =>
+          prev.map((item) =>
+            jobIds.has(item.path)
+              ? { ...item, jobId: jobIds.get(item.path)!, status: "queued" }
+              : item
+          )
+        );
+      }
+    } catch (error) {
+      console.error("Import error:", error);
+      toast.error(error instanceof Error ? error.message : "Failed to create import");
+      setIsRunning(false);
+      if (!id) return;
+    }
+
+    await runBatch(id as string, false);
+  }
+
+  async function handleRetryItem(jobId: string) {
+    updateItem(jobId, { status: "queued", description: null });
+    try {
+      const res = await fetch(`/api/meetings/jobs/${jobId}`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ apiKey, model, fallbackChains }),
+      });
+      await readJobEvents(res, (event) => applyJobEvent(jobId, event));
+    } catch (error) {
+      updateItem(jobId, {
+        status: "failed",
+        description: error instanceof Error ? error.message : "Retry failed",
+      });
+    }
+  }
+
+  if (!isLoaded) return null;
+
+  const started = items.some((i) => i.jobId);
+  const finished = counts.succeeded + counts.failed;
+
+  return (
+    <div className="mx-auto max-w-5xl space-y-6">
+      <div>
+        <h1 className="text-2xl font-semibold tracking-tight">Import Meetings</h1>
+        <p className="text-sm text-muted-foreground">
+          Process a backlog of transcripts — redaction, analysis and compliance run for each one.
+        </p>
+      </div>
+
+      {!isKeySet && (
+        <div className="flex items-center gap-3 rounded-lg border border-orange-200 bg-orange-50 p-4 dark:border-orange-900/50 dark:bg-orange-950/20">
+          <ShieldAlert className="size-5 text-orange-600" />
+          <div className="flex-1">
+            <p className="text-sm font-medium text-orange-800 dark:text-orange-300">
+              API Key Required
+            </p>
+            <p className="text-xs text-orange-700 dark:text-orange-400">
+              Configure your API key to use AI features.
+            </p>
+          </div>
+          <Link href="/dashboard/settings">
+            <Button variant="outline" size="sm">
+              Configure
+            </Button>
+          </Link>
+        </div>
+      )}
+
+      <Card>
+        <CardHeader>
+          <CardTitle className="text-base">Transcripts</CardTitle>
+          <CardDescription>
+            Add a folder or zip of {TEXT_EXTENSIONS.join(", ")} files. Files inside a folder
+            named after a client are assigned to that client.
+          </CardDescription>
+        </CardHeader>
+        <CardContent className="space-y-4">
+          <div className="flex flex-wrap items-center gap-2">
+            <input
+              ref={folderInputRef}
+              type="file"
+              multiple
+              className="hidden"
+              onChange={(e) => {
+                addFiles(e.target.files);
+                e.target.value = "";
+              }}
+            />
+            <input
+              ref={zipInputRef}
+              type="file"
+              multiple
+              accept={[".zip", ...TEXT_EXTENSIONS].join(",")}
+              className="hidden"
+              onChange={(e) => {
+                addFiles(e.target.files);
+                e.target.value = "";
+              }}
+            />
+            <Button
+              variant="outline"
+              size="sm"
+              disabled={isReading || isRunning}
+              onClick={() => folderInputRef.current?.click()}
+            >
+              <FolderUp className="size-4" />
+              Choose folder
+            </Button>
+            <Button
+              variant="outline"
+              size="sm"
+              disabled={isReading || isRunning}
+              onClick={() => zipInputRef.current?.click()}
+            >
+              <FileArchive className="size-4" />
+              Choose zip or files
+            </Button>
+            {isReading && <Loader2 className="size-4 animate-spin text-muted-foreground" />}
+            {items.length > 0 && !started && (
+              <Button variant="ghost" size="sm" onClick={() => setItems([])}>
+                <Trash2 className="size-4" />
+                Clear
+              </Button>
+            )}
+          </div>
+
+          <div className="space-y-2">
+            <Label>Default client</Label>
+            <Select value={defaultClientId} onValueChange={setDefaultClientId}>
+              <SelectTrigger className="w-full sm:w-72">
+                <SelectValue placeholder="For files without a matching client..." />
+              </SelectTrigger>
+              <SelectContent>
+                {clients.map((c) => (
+                  <SelectItem key={c.id} value={c.id}>
+                    {c.name}
+                  </SelectItem>
+                ))}
+              </SelectContent>
+            </Select>
+          </div>
+        </CardContent>
+      </Card>
+
+      {items.length > 0 && (
+        <Card>
+          <CardHeader>
+            <div className="flex items-center justify-between gap-4">
+              <div>
+                <CardTitle className="text-base">
+                  {started ? `${finished} of ${counts.total} processed` : `${counts.total} transcripts`}
+                </CardTitle>
+                <CardDescription>
+                  {counts.failed > 0
+                    ? `${counts.succeeded} ready, ${counts.failed} failed`
+                    : counts.unassigned > 0
+                    ? `${counts.unassigned} without a client`
+                    : "Throughput follows your provider's rate limits."}
+                </CardDescription>
+              </div>
+              <div className="flex gap-2">
+                {batchId && (counts.failed > 0 || (counts.queued > 0 && !isRunning)) && (
+                  <Button
+                    variant="outline"
+                    size="sm"
+                    disabled={isRunning}
+                    onClick={() => runBatch(batchId, counts.failed > 0)}
+                  >
+                    <RotateCcw className="size-4" />
+                    {counts.failed > 0 ? "Retry failed" : "Resume"}
+                  </Button>
+                )}
+                <Button
+                  size="sm"
+                  disabled={isRunning || !isKeySet || items.every((i) => i.jobId)}
+                  onClick={handleImport}
+                >
+                  {isRunning ? (
+                    <Loader2 className="size-4 animate-spin" />
+                  ) : (
+                    <Upload className="size-4" />
+                  )}
+                  Import & process
+                </Button>
+              </div>
+            </div>
+            {started && (
+              <div className="h-2 w-full overflow-hidden rounded-full bg-muted">
+                <div
+                  className="h-full bg-primary transition-all"
+                  style={{ width: `${(finished / counts.total) * 100}%` }}
+                />
+              </div>
+            )}
+          </CardHeader>
+          <CardContent>
+            <Table>
+              <TableHeader>
+                <TableRow>
+                  <TableHead>File</TableHead>
+                  <TableHead>Client</TableHead>
+                  <TableHead>Status</TableHead>
+                  <TableHead className="w-24" />
+                </TableRow>
+              </TableHeader>
+              <TableBody>
+                {items.map((item) => (
+                  <TableRow key={item.path}>
+                    <TableCell className="max-w-64">
+                      <p className="truncate text-sm font-medium">{item.title}</p>
+                      <p className="truncate text-xs text-muted-foreground">{item.path}</p>
+                    </TableCell>
+                    <TableCell>
+                      <Select
+                        value={item.clientId || defaultClientId}
+                        disabled={item.jobId !== null}
+                        onValueChange={(clientId) =>
+                          setItems((prev) =>
+                            prev.map((i) => (i.path === item.path ? { ...i, clientId } : i))
+                          )
+                        }
+                      >
+                        <SelectTrigger className="h-8 w-48">
+                          <SelectValue placeholder="Select client..." />
+                        </SelectTrigger>
+                        <SelectContent>
+                          {clients.map((c) => (
+                            <SelectItem key={c.id} value={c.id}>
+                              {c.name}
+                            </SelectItem>
+                          ))}
+                        </SelectContent>
+                      </Select>
+                    </TableCell>
+                    <TableCell className="max-w-64">
+                      <Badge variant="secondary" className={`text-xs ${STATUS_BADGES[item.status].className}`}>
+                        {STATUS_BADGES[item.status].label}
+                      </Badge>
+                      {item.description && (
+                        <p className="mt-1 truncate text-xs text-muted-foreground">
+                          {item.description}
+                        </p>
+                      )}
+                    </TableCell>
+                    <TableCell className="text-right">
+                      {item.status === "succeeded" && item.meetingId && (
+                        <Link href={`/dashboard/meetings/${item.meetingId}`}>
+                          <Button variant="ghost" size="sm">
+                            Review
+                          </Button>
+                        </Link>
+                      )}
+                      {item.status === "failed" && item.jobId && (
+                        <Button
+                          variant="ghost"
+                          size="sm"
+                          disabled={isRunning}
+                          onClick={() => handleRetryItem(item.jobId!)}
+                        >
+                          <RotateCcw className="size-4" />
+                          Retry
+                        </Button>
+                      )}
+                    </TableCell>
+                  </TableRow>
+                ))}
+              </TableBody>
+            </Table>
+          </CardContent>
+        </Card>
+      )}
+    </div>
+  );
+}
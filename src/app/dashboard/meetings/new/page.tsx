@@ -1,6 +1,6 @@
 "use client";
 
-import { useState, useEffect, useCallback } from "react";
+import { useState, useEffect, useCallback, useMemo } from "react";
 import { useRouter } from "next/navigation";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
@@ -12,7 +12,16 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
 import { useApiKey } from "@/hooks/use-api-key";
 import { createClient } from "@/lib/supabase/client";
-import { redactPII, getPIISummary } from "@/lib/utils/pii-redaction";
+import { getTranscriptWorker } from "@/lib/workers/transcript-client";
+import { postTranscription, transcribeAudio } from "@/lib/ai/transcribe-upload";
+import type { TranscriptionOutcome } from "@/lib/ai/transcribe-upload";
+import {
+  deleteSpooledRecording,
+  pruneSpooledRecordings,
+  readSpooledRecording,
+} from "@/lib/audio/recording-spool";
+import { readJobEvents } from "@/lib/jobs/meeting-job-events";
+import type { MeetingJobEvent } from "@/lib/jobs/meeting-job-events";
 import { SAMPLE_TRANSCRIPTS } from "@/data/sample-transcripts";
 import { FileUploadZone } from "@/components/meeting/file-upload-zone";
 import type { UploadedFile } from "@/components/meeting/file-upload-zone";
@@ -23,8 +32,10 @@ import {
 import type { PipelineStep } from "@/components/meeting/processing-pipeline";
 import { AudioRecorder } from "@/components/meeting/audio-recorder";
 import { useAudioRecorder } from "@/hooks/use-audio-recorder";
+import { usePIIPreview } from "@/hooks/use-pii-preview";
 import { toast } from "sonner";
 import {
+  RotateCcw,
   Loader2,
   Shield,
   ShieldAlert,
@@ -36,24 +47,41 @@ import {
   ClipboardPaste,
   Radio,
   Video,
+  FolderUp,
 } from "lucide-react";
 import type { Client, MeetingSourceType } from "@/types/database";
 import Link from "next/link";
 
 type InputMode = "paste" | "audio" | "file" | "record";
 
+// Spooled recordings that were never processed are cleared after a week
+const SPOOL_MAX_AGE_MS = 7 * 24 * 60 * 60 * 1000;
+
 export default function NewMeetingPage() {
   const router = useRouter();
-  const { apiKey, model, isKeySet, isLoaded } = useApiKey();
+  const { apiKey, model, fallbackChains, isKeySet, isLoaded } = useApiKey();
   const [clients, setClients] = useState<Client[]>([]);
   const [selectedClientId, setSelectedClientId] = useState("");
   const [title, setTitle] = useState("");
   const [transcript, setTranscript] = useState("");
   const [inputMode, setInputMode] = useState<InputMode>("paste");
   const [uploadedFile, setUploadedFile] = useState<UploadedFile | null>(null);
+  const [failedJobId, setFailedJobId] = useState<string | null>(null);
+  const [spooledRecordingId, setSpooledRecordingId] = useState<string | null>(
+    null
+  );
   const [isProcessing, setIsProcessing] = useState(false);
   const [pipelineSteps, setPipelineSteps] = useState<PipelineStep[]>([]);
-  const recorder = useAudioRecorder();
+  const liveTranscription = useMemo(
+    () =>
+      apiKey
+        ? { apiKey, model, fallbackModels: fallbackChains?.transcription }
+        : null,
+    [apiKey, model, fallbackChains]
+  );
+  const recorder = useAudioRecorder(null, { liveTranscription });
+  const { entities: piiEntities, summary: piiSummary } =
+    usePIIPreview(transcript);
 
   // Load clients
   useEffect(() => {
@@ -68,40 +96,45 @@ export default function NewMeetingPage() {
     loadClients();
   }, []);
 
-  // Pick up recording from online meeting room via sessionStorage
+  // Pick up recording from online meeting room via the IndexedDB spool
   useEffect(() => {
     if (typeof window === "undefined") return;
-    const params = new URLSearchParams(window.location.search);
-    if (params.get("source") !== "room") return;
-
-    const stored = sessionStorage.getItem("meeting-recording");
-    if (!stored) return;
+    pruneSpooledRecordings(SPOOL_MAX_AGE_MS).catch(() => {});
 
-    try {
-      const data = JSON.parse(stored) as {
-        base64: string;
-        mimeType: string;
-        duration: number;
-      };
-      // Synthesize an UploadedFile-like object for the audio tab flow
-      setUploadedFile({
-        file: new File([], "online-meeting-recording.webm"),
-        base64: data.base64,
-        mimeType: data.mimeType,
-        preview: {
-          name: `online-meeting-recording.webm`,
-          size: `${Math.round((data.base64.length * 3) / 4 / 1024)} KB`,
-          type: "audio",
-        },
+    const params = new URLSearchParams(window.location.search);
+    const recordingId = params.get("recording");
+    if (params.get("source") !== "room" || !recordingId) return;
+
+    readSpooledRecording(recordingId)
+      .then((recording) => {
+        if (!recording) {
+          toast.error("Recording not found", {
+            description: "It may have been discarded in the meeting room.",
+          });
+          return;
+        }
+        // The File wraps the disk-backed spool blob; nothing is copied
+        const fileName = "online-meeting-recording.webm";
+        setUploadedFile({
+          file: new File([recording.blob], fileName, {
+            type: recording.meta.mimeType,
+          }),
+          mimeType: recording.meta.mimeType,
+          preview: {
+            name: fileName,
+            size: `${Math.round(recording.meta.bytes / 1024)} KB`,
+            type: "audio",
+          },
+        });
+        setSpooledRecordingId(recordingId);
+        setInputMode("audio");
+        setTitle((current) => current || "Online Meeting Recording");
+        toast.info("Recording loaded from online meeting room");
+      })
+      .catch(() => {
+        console.error("Failed to load meeting recording from IndexedDB");
       });
-      setInputMode("audio");
-      if (!title) setTitle("Online Meeting Recording");
-      sessionStorage.removeItem("meeting-recording");
-      toast.info("Recording loaded from online meeting room");
-    } catch {
-      console.error("Failed to load meeting recording from sessionStorage");
-    }
-  }, [title]);
+  }, []);
 
   const updateStep = useCallback(
     (stepId: string, status: PipelineStep["status"], description?: string) => {
@@ -132,6 +165,7 @@ export default function NewMeetingPage() {
 
   function handleFileReady(uploaded: UploadedFile) {
     setUploadedFile(uploaded);
+    setSpooledRecordingId(null);
     if (!title) {
       const nameWithoutExt = uploaded.preview.name.replace(/\.[^/.]+$/, "");
       setTitle(nameWithoutExt);
@@ -140,6 +174,7 @@ export default function NewMeetingPage() {
 
   function handleFileClear() {
     setUploadedFile(null);
+    setSpooledRecordingId(null);
     if (inputMode !== "paste") setTranscript("");
   }
 
@@ -161,10 +196,95 @@ export default function NewMeetingPage() {
 
   function hasValidInput(): boolean {
     if (inputMode === "paste") return transcript.trim().length > 0;
-    if (inputMode === "record") return recorder.base64Data !== null;
+    if (inputMode === "record") return recorder.audioBlob !== null;
     return uploadedFile !== null;
   }
 
+  // Applies a meeting job's progress stream to the pipeline view and
+  // navigates to the meeting once it is ready. Failed jobs keep their ID so
+  // they can be resumed from the last completed step.
+  async function followMeetingJob(res: Response) {
+    const outcome: {
+      jobId: string | null;
+      meetingId: string | null;
+      failure: Extract<MeetingJobEvent, { type: "error" }> | null;
+    } = { jobId: null, meetingId: null, failure: null };
+    const spooledId =
+      inputMode === "record" ? recorder.recordingId : spooledRecordingId;
+
+    await readJobEvents(res, (event) => {
+      switch (event.type) {
+        case "job":
+          outcome.jobId = event.jobId;
+          break;
+        case "meeting":
+          // The transcript is persisted; the spooled audio is no longer needed
+          if (spooledId) deleteSpooledRecording(spooledId).catch(() => {});
+          break;
+        case "step":
+          updateStep(event.step, event.status, event.description);
+          break;
+        case "done":
+          outcome.meetingId = event.meetingId;
+          break;
+        case "error":
+          outcome.failure = event;
+          break;
+      }
+    });
+
+    if (outcome.failure || !outcome.meetingId) {
+      setFailedJobId(outcome.jobId);
+      const failure = outcome.failure;
+      if (failure?.isQuota) {
+        toast.error(failure.error, {
+          description: "Go to Settings → switch to Google Gemini (free).",
+          duration: 8000,
+        });
+      } else {
+        toast.error(failure?.error || "Processing was interrupted");
+      }
+      setPipelineSteps((prev) =>
+        prev.map((s) =>
+          s.status === "running"
+            ? { ...s, status: "error" as const, description: "Failed" }
+            : s
+        )
+      );
+      return;
+    }
+
+    toast.success("Meeting processed successfully!");
+    // Brief pause to show the completed pipeline before navigating
+    await new Promise((r) => setTimeout(r, 800));
+    router.push(`/dashboard/meetings/${outcome.meetingId}`);
+  }
+
+  async function handleRetryJob() {
+    if (!failedJobId) return;
+    setIsProcessing(true);
+    setPipelineSteps((prev) =>
+      prev.map((s) =>
+        s.status === "error" ? { ...s, status: "pending" as const } : s
+      )
+    );
+    try {
+      const res = await fetch(`/api/meetings/jobs/${failedJobId}`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ apiKey, model, fallbackChains }),
+      });
+      await followMeetingJob(res);
+    } catch (error) {
+      console.error("Retry error:", error);
+      toast.error(
+        error instanceof Error ? error.message : "Failed to resume processing"
+      );
+    } finally {
+      setIsProcessing(false);
+    }
+  }
+
   async function handleProcess() {
     if (!selectedClientId) {
       toast.error("Please select a client");
@@ -183,8 +303,7 @@ export default function NewMeetingPage() {
       return;
     }
 
-    const client = clients.find((c) => c.id === selectedClientId);
-    if (!client) return;
+    if (!clients.some((c) => c.id === selectedClientId)) return;
 
     setIsProcessing(true);
 
@@ -192,50 +311,90 @@ export default function NewMeetingPage() {
     const steps = createPipelineSteps(inputMode);
     setPipelineSteps(steps);
 
-    const supabase = createClient();
+    setFailedJobId(null);
+    const transcriptWorker = getTranscriptWorker();
     let workingTranscript = transcript;
 
+    async function countWords(text: string): Promise<number> {
+      const { words } = await transcriptWorker.stats(text, {
+        key: "pipeline-stats",
+      });
+      return words;
+    }
+
+    const reportSegmentProgress = (completed: number, total: number) =>
+      updateStep(
+        "transcribe",
+        "running",
+        `Transcribed ${completed} of ${total} segments...`
+      );
+
+    const handleTranscriptionQuota = (
+      failure: Extract<TranscriptionOutcome, { ok: false }>
+    ) => {
+      if (!failure.isQuota) return false;
+      toast.error(failure.error, {
+        description: "Go to Settings → switch to Google Gemini (free).",
+        duration: 8000,
+      });
+      updateStep("transcribe", "error", "Quota exceeded");
+      return true;
+    };
+
+    const describeTranscription = async (
+      result: Extract<TranscriptionOutcome, { ok: true }>
+    ) => {
+      const words = await countWords(result.transcript);
+      return result.segments.length > 1
+        ? `${words} words transcribed from ${result.segments.length} segments`
+        : `${words} words transcribed`;
+    };
+
     try {
       // ── Step: Upload + Transcribe (for audio/file/record modes) ──
-      if (inputMode === "record" && recorder.base64Data) {
+      if (inputMode === "record" && recorder.audioBlob) {
         updateStep("upload", "running", "Preparing recording...");
         await new Promise((r) => setTimeout(r, 300));
         updateStep("upload", "complete", "Recording ready");
 
-        updateStep("transcribe", "running", "AI is transcribing recording...");
-        const transcribeRes = await fetch("/api/ai/transcribe", {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({
+        // Most of the recording was already transcribed while it was being
+        // captured; only fall back to a full pass if live transcription failed.
+        const liveResult = recorder.getLiveTranscription();
+        updateStep(
+          "transcribe",
+          "running",
+          liveResult
+            ? "Finishing live transcription..."
+            : "AI is transcribing recording..."
+        );
+        let transcription = liveResult ? await liveResult : null;
+        if (transcription && !transcription.ok) {
+          if (handleTranscriptionQuota(transcription)) return;
+          console.warn("Live transcription failed:", transcription.error);
+        }
+        if (!transcription?.ok) {
+          updateStep("transcribe", "running", "AI is transcribing recording...");
+          transcription = await transcribeAudio({
             apiKey,
-            fileData: recorder.base64Data,
+            model,
+            fallbackModels: fallbackChains?.transcription,
+            file: recorder.audioBlob,
             mimeType: recorder.mimeType,
             fileName: `recording-${new Date().toISOString().slice(0, 10)}.webm`,
-            model,
-            mode: "audio",
-          }),
-        });
-
-        if (!transcribeRes.ok) {
-          const errData = await transcribeRes.json();
-          if (errData.isQuota) {
-            toast.error(errData.error, {
-              description: "Go to Settings → switch to Google Gemini (free).",
-              duration: 8000,
-            });
-            updateStep("transcribe", "error", "Quota exceeded");
-            return;
-          }
-          throw new Error(errData.error || "Transcription failed");
+            onProgress: reportSegmentProgress,
+          });
+        }
+        if (!transcription.ok) {
+          if (handleTranscriptionQuota(transcription)) return;
+          throw new Error(transcription.error);
         }
 
-        const { data: recTranscribeData } = await transcribeRes.json();
-        workingTranscript = recTranscribeData.transcript;
+        workingTranscript = transcription.transcript;
         setTranscript(workingTranscript);
         updateStep(
           "transcribe",
           "complete",
-          `${workingTranscript.split(/\s+/).length} words transcribed`
+          await describeTranscription(transcription)
         );
       } else if (inputMode === "audio" && uploadedFile) {
         updateStep("upload", "running", "Reading audio file...");
@@ -244,53 +403,36 @@ export default function NewMeetingPage() {
         updateStep("upload", "complete", `${uploadedFile.preview.name} ready`);
 
         updateStep("transcribe", "running", "AI is transcribing audio...");
-        const transcribeRes = await fetch("/api/ai/transcribe", {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({
-            apiKey,
-            fileData: uploadedFile.base64,
-            mimeType: uploadedFile.mimeType,
-            fileName: uploadedFile.preview.name,
-            model,
-            mode: "audio",
-          }),
+        const transcription = await transcribeAudio({
+          apiKey,
+          model,
+          fallbackModels: fallbackChains?.transcription,
+          mimeType: uploadedFile.mimeType,
+          fileName: uploadedFile.preview.name,
+          file: uploadedFile.file,
+          onProgress: reportSegmentProgress,
         });
-
-        if (!transcribeRes.ok) {
-          const errData = await transcribeRes.json();
-          if (errData.isQuota) {
-            toast.error(errData.error, {
-              description: "Go to Settings → switch to Google Gemini (free).",
-              duration: 8000,
-            });
-            updateStep("transcribe", "error", "Quota exceeded");
-            return;
-          }
-          throw new Error(errData.error || "Transcription failed");
+        if (!transcription.ok) {
+          if (handleTranscriptionQuota(transcription)) return;
+          throw new Error(transcription.error);
         }
 
-        const { data: transcribeData } = await transcribeRes.json();
-        workingTranscript = transcribeData.transcript;
+        workingTranscript = transcription.transcript;
         setTranscript(workingTranscript);
         updateStep(
           "transcribe",
           "complete",
-          `${workingTranscript.split(/\s+/).length} words transcribed`
+          await describeTranscription(transcription)
         );
       } else if (inputMode === "file" && uploadedFile) {
         updateStep("upload", "running", "Extracting text content...");
-        const transcribeRes = await fetch("/api/ai/transcribe", {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({
-            apiKey,
-            fileData: uploadedFile.base64,
-            mimeType: uploadedFile.mimeType,
-            fileName: uploadedFile.preview.name,
-            model,
-            mode: "text",
-          }),
+        const transcribeRes = await postTranscription({
+          apiKey,
+          model,
+          mode: "text",
+          file: uploadedFile.file,
+          mimeType: uploadedFile.mimeType,
+          fileName: uploadedFile.preview.name,
         });
 
         if (!transcribeRes.ok) {
@@ -304,162 +446,26 @@ export default function NewMeetingPage() {
         updateStep(
           "upload",
           "complete",
-          `${workingTranscript.split(/\s+/).length} words extracted`
+          `${await countWords(workingTranscript)} words extracted`
         );
       }
 
-      // ── Step: PII Redaction ──
-      updateStep("pii", "running", "Scanning for sensitive data...");
-      const { redactedText, entities } = redactPII(workingTranscript);
-      updateStep(
-        "pii",
-        "complete",
-        entities.length > 0
-          ? `${entities.length} PII item${entities.length !== 1 ? "s" : ""} redacted`
-          : "No PII detected"
-      );
-
-      // ── Create meeting record ──
-      const { data: meeting, error: meetingError } = await supabase
-        .from("meetings")
-        .insert({
-          client_id: selectedClientId,
-          title: title || "Untitled Meeting",
-          transcript_text: workingTranscript,
-          transcript_redacted: redactedText,
-          pii_entities: entities,
-          source_type: getSourceType(),
-          source_file_name: uploadedFile?.preview.name || null,
-          status: "processing",
-        })
-        .select()
-        .single();
-
-      if (meetingError) throw meetingError;
-
-      // ── Step: AI Analysis ──
-      updateStep("ai", "running", "Generating summary, tasks & email...");
-      const aiRes = await fetch("/api/ai/process-meeting", {
+      // ── Steps: PII → AI → Compliance, run server-side as one job ──
+      const jobRes = await fetch("/api/meetings/jobs", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({
           apiKey,
-          transcript: redactedText,
-          clientName: client.name,
-          riskTolerance: client.risk_tolerance,
-          aumValue: Number(client.aum_value),
-          model,
-        }),
-      });
-
-      if (!aiRes.ok) {
-        const errData = await aiRes.json();
-        if (errData.isQuota) {
-          await supabase.from("meetings").delete().eq("id", meeting.id);
-          toast.error(errData.error, {
-            description: "Go to Settings → switch to Google Gemini (free).",
-            duration: 8000,
-          });
-          updateStep("ai", "error", "Quota exceeded");
-          return;
-        }
-        throw new Error(errData.error || "AI processing failed");
-      }
-
-      const { data: aiOutput } = await aiRes.json();
-      updateStep(
-        "ai",
-        "complete",
-        `${aiOutput.tasks?.length || 0} tasks extracted`
-      );
-
-      // Save meeting output
-      const { data: output, error: outputError } = await supabase
-        .from("meeting_outputs")
-        .insert({
-          meeting_id: meeting.id,
-          summary_text: aiOutput.summary,
-          key_topics: aiOutput.key_topics,
-          client_email_draft: aiOutput.email_draft,
-        })
-        .select()
-        .single();
-
-      if (outputError) throw outputError;
-
-      // Save tasks
-      if (aiOutput.tasks && aiOutput.tasks.length > 0) {
-        const taskInserts = aiOutput.tasks.map(
-          (t: {
-            description: string;
-            priority: string;
-            due_date_suggestion: string | null;
-          }) => ({
-            meeting_id: meeting.id,
-            client_id: selectedClientId,
-            description: t.description,
-            priority: t.priority,
-            due_date: t.due_date_suggestion,
-          })
-        );
-        await supabase.from("tasks").insert(taskInserts);
-      }
-
-      // ── Step: Compliance Scan ──
-      updateStep("compliance", "running", "Running FINRA & SEC review...");
-      const complianceRes = await fetch("/api/ai/compliance-check", {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({
-          apiKey,
-          emailDraft: aiOutput.email_draft,
-          clientRiskTolerance: client.risk_tolerance,
           model,
+          fallbackChains,
+          clientId: selectedClientId,
+          title: title || "Untitled Meeting",
+          transcript: workingTranscript,
+          sourceType: getSourceType(),
+          sourceFileName: uploadedFile?.preview.name || null,
         }),
       });
-
-      if (complianceRes.ok) {
-        const { data: complianceData } = await complianceRes.json();
-        if (complianceData.flags && complianceData.flags.length > 0) {
-          const flagInserts = complianceData.flags.map(
-            (f: {
-              flagged_text: string;
-              risk_category: string;
-              severity: string;
-              explanation: string;
-            }) => ({
-              meeting_output_id: output.id,
-              flagged_text: f.flagged_text,
-              risk_category: f.risk_category,
-              severity: f.severity,
-              explanation: f.explanation,
-            })
-          );
-          await supabase.from("compliance_flags").insert(flagInserts);
-          updateStep(
-            "compliance",
-            "complete",
-            `${complianceData.flags.length} flag${complianceData.flags.length !== 1 ? "s" : ""} found`
-          );
-        } else {
-          updateStep("compliance", "complete", "No compliance issues");
-        }
-      } else {
-        updateStep("compliance", "complete", "Scan complete");
-      }
-
-      // ── Step: Complete ──
-      await supabase
-        .from("meetings")
-        .update({ status: "review_needed" })
-        .eq("id", meeting.id);
-
-      updateStep("done", "complete", "Meeting ready for review");
-      toast.success("Meeting processed successfully!");
-
-      // Brief pause to show the completed pipeline before navigating
-      await new Promise((r) => setTimeout(r, 800));
-      router.push(`/dashboard/meetings/${meeting.id}`);
+      await followMeetingJob(jobRes);
     } catch (error) {
       console.error("Processing error:", error);
       toast.error(
@@ -482,13 +488,21 @@ export default function NewMeetingPage() {
 
   return (
     <div className="mx-auto max-w-4xl space-y-6">
-      <div>
-        <h1 className="text-2xl font-semibold tracking-tight">
-          Process Meeting
-        </h1>
-        <p className="text-sm text-muted-foreground">
-          Record, paste, or upload — AI handles the rest.
-        </p>
+      <div className="flex items-start justify-between gap-4">
+        <div>
+          <h1 className="text-2xl font-semibold tracking-tight">
+            Process Meeting
+          </h1>
+          <p className="text-sm text-muted-foreground">
+            Record, paste, or upload — AI handles the rest.
+          </p>
+        </div>
+        <Link href="/dashboard/meetings/import">
+          <Button variant="outline" size="sm">
+            <FolderUp className="size-4" />
+            Batch import
+          </Button>
+        </Link>
       </div>
 
       {!isKeySet && (
@@ -606,7 +620,7 @@ export default function NewMeetingPage() {
                 <TabsContent value="audio" className="mt-4 space-y-3">
                   <FileUploadZone
                     accept="audio/*,.mp3,.wav,.m4a,.webm,.ogg"
-                    maxSizeMB={20}
+                    maxSizeMB={200}
                     fileType="audio"
                     onFileReady={handleFileReady}
                     onFileClear={handleFileClear}
@@ -618,8 +632,9 @@ export default function NewMeetingPage() {
                       <strong>How it works:</strong> Your audio file is sent to
                       the AI model for transcription. The transcript is then
                       processed through our full pipeline — PII redaction, AI
-                      analysis, and compliance scan. Supports MP3, WAV, M4A,
-                      WebM, and OGG formats up to 20MB.
+                      analysis, and compliance scan. Long recordings are split
+                      into segments and transcribed in parallel. Supports MP3,
+                      WAV, M4A, WebM, and OGG formats up to 200MB.
                     </p>
                   </div>
                   {transcript && inputMode === "audio" && (
@@ -652,11 +667,22 @@ export default function NewMeetingPage() {
                   <div className="rounded-md border bg-muted/30 p-3">
                     <p className="text-xs text-muted-foreground leading-relaxed">
                       <strong>How it works:</strong> Record directly from your
-                      device microphone. When you stop, the recording is sent
-                      to AI for transcription, then processed through the full
-                      pipeline. Ideal for in-person meetings.
+                      device microphone. The recording is transcribed by AI in
+                      one-minute windows while you speak, so the transcript is
+                      nearly ready when you stop, then processed through the
+                      full pipeline. Ideal for in-person meetings.
                     </p>
                   </div>
+                  {!transcript &&
+                    recorder.liveTranscript &&
+                    recorder.state !== "idle" && (
+                      <div className="space-y-1.5">
+                        <Label className="text-xs">Live Transcript</Label>
+                        <div className="max-h-[200px] overflow-y-auto rounded-md border bg-muted/20 p-3 font-mono text-xs whitespace-pre-wrap text-muted-foreground">
+                          {recorder.liveTranscript}
+                        </div>
+                      </div>
+                    )}
                   {transcript && inputMode === "record" && (
                     <div className="space-y-1.5">
                       <Label className="text-xs">Transcribed Text</Label>
@@ -718,11 +744,24 @@ export default function NewMeetingPage() {
                 <CardDescription>
                   {isProcessing
                     ? "AI is analyzing your meeting..."
+                    : failedJobId
+                    ? "Processing stopped — completed steps are saved"
                     : "Pipeline complete"}
                 </CardDescription>
               </CardHeader>
-              <CardContent>
+              <CardContent className="space-y-3">
                 <ProcessingPipeline steps={pipelineSteps} />
+                {failedJobId && !isProcessing && (
+                  <Button
+                    variant="outline"
+                    size="sm"
+                    className="w-full gap-1.5"
+                    onClick={handleRetryJob}
+                  >
+                    <RotateCcw className="size-3.5" />
+                    Retry from failed step
+                  </Button>
+                )}
               </CardContent>
             </Card>
           )}
@@ -740,41 +779,36 @@ export default function NewMeetingPage() {
             </CardHeader>
             <CardContent>
               {transcript.trim() ? (
-                (() => {
-                  const { entities } = redactPII(transcript);
-                  return (
-                    <div className="space-y-2">
-                      <div className="flex items-center gap-2">
-                        <Shield className="size-4 text-green-600" />
-                        <span className="text-sm font-medium">
-                          {entities.length === 0
-                            ? "No PII detected"
-                            : `${entities.length} item${entities.length !== 1 ? "s" : ""} to redact`}
-                        </span>
-                      </div>
-                      {entities.length > 0 && (
-                        <div className="space-y-1.5">
-                          <p className="text-xs text-muted-foreground">
-                            {getPIISummary(entities)}
-                          </p>
-                          {entities.map((e, i) => (
-                            <div
-                              key={i}
-                              className="flex items-center justify-between rounded-md border bg-muted/50 px-2.5 py-1.5 text-xs"
-                            >
-                              <code className="text-red-600 dark:text-red-400 line-through">
-                                {e.original}
-                              </code>
-                              <Badge variant="secondary" className="text-[10px]">
-                                {e.replacement}
-                              </Badge>
-                            </div>
-                          ))}
+                <div className="space-y-2">
+                  <div className="flex items-center gap-2">
+                    <Shield className="size-4 text-green-600" />
+                    <span className="text-sm font-medium">
+                      {piiEntities.length === 0
+                        ? "No PII detected"
+                        : `${piiEntities.length} item${piiEntities.length !== 1 ? "s" : ""} to redact`}
+                    </span>
+                  </div>
+                  {piiEntities.length > 0 && (
+                    <div className="space-y-1.5">
+                      <p className="text-xs text-muted-foreground">
+                        {piiSummary}
+                      </p>
+                      {piiEntities.map((e, i) => (
+                        <div
+                          key={i}
+                          className="flex items-center justify-between rounded-md border bg-muted/50 px-2.5 py-1.5 text-xs"
+                        >
+                          <code className="text-red-600 dark:text-red-400 line-through">
+                            {e.original}
+                          </code>
+                          <Badge variant="secondary" className="text-[10px]">
+                            {e.replacement}
+                          </Badge>
                         </div>
-                      )}
+                      ))}
                     </div>
-                  );
-                })()
+                  )}
+                </div>
               ) : (
                 <p className="text-sm text-muted-foreground">
                   {inputMode === "paste"
@@ -1,69 +1,37 @@
-import { createServerSupabaseClient } from "@/lib/supabase/server";
+import { getDashboardData } from "@/lib/cache/book-data";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { DollarSign, Users, FileText, CheckSquare, AlertTriangle } from "lucide-react";
 import { formatCurrencyCompact, formatDate, formatDueDate } from "@/lib/utils/formatters";
 import { STATUS_COLORS, PRIORITY_COLORS } from "@/lib/constants";
 import Link from "next/link";
-import type { Client, MeetingWithClient, TaskWithClient } from "@/types/database";
-
-async function getDashboardData() {
-  const supabase = await createServerSupabaseClient();
-
-  const [clientsRes, meetingsRes, tasksRes, flagsRes] = await Promise.all([
-    supabase.from("clients").select("*").order("aum_value", { ascending: false }),
-    supabase
-      .from("meetings")
-      .select("*, clients(id, name, risk_tolerance, aum_value)")
-      .order("created_at", { ascending: false })
-      .limit(5),
-    supabase
-      .from("tasks")
-      .select("*, clients(id, name)")
-      .eq("status", "pending")
-      .order("due_date", { ascending: true })
-      .limit(8),
-    supabase.from("compliance_flags").select("id").eq("is_resolved", false),
-  ]);
-
-  const clients = (clientsRes.data || []) as Client[];
-  const totalAum = clients.reduce((sum, c) => sum + Number(c.aum_value), 0);
-
-  return {
-    totalAum,
-    clientCount: clients.length,
-    meetings: (meetingsRes.data || []) as MeetingWithClient[],
-    tasks: (tasksRes.data || []) as TaskWithClient[],
-    unresolvedFlags: flagsRes.data?.length || 0,
-  };
-}
 
 export default async function DashboardPage() {
-  const { totalAum, clientCount, meetings, tasks, unresolvedFlags } =
-    await getDashboardData();
+  const { stats, meetings, tasks } = await getDashboardData();
+  const unresolvedFlags = stats.complianceFlags;
 
-  const stats = [
+  const kpis = [
     {
       label: "Total AUM",
-      value: formatCurrencyCompact(totalAum),
+      value: formatCurrencyCompact(stats.totalAum),
       icon: DollarSign,
       description: "Across all clients",
     },
     {
       label: "Active Clients",
-      value: clientCount.toString(),
+      value: stats.clientCount.toString(),
       icon: Users,
       description: "In your book",
     },
     {
-      label: "Recent Meetings",
-      value: meetings.length.toString(),
+      label: "Meetings",
+      value: stats.meetingsThisMonth.toString(),
       icon: FileText,
-      description: "Last 30 days",
+      description: "This month",
     },
     {
       label: "Pending Tasks",
-      value: tasks.length.toString(),
+      value: stats.pendingTasks.toString(),
       icon: CheckSquare,
       description: "Action items",
     },
@@ -89,7 +57,7 @@ export default async function DashboardPage() {
       )}
 
       <div className="grid gap-4 md:grid-cols-2 lg:grid-cols-4">
-        {stats.map((stat) => (
+        {kpis.map((stat) => (
           <Card key={stat.label}>
             <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
               <CardTitle className="text-sm font-medium text-muted-foreground">
@@ -5,21 +5,30 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/com
 import { Input } from "@/components/ui/input";
 import { Button } from "@/components/ui/button";
 import { Label } from "@/components/ui/label";
+import { Badge } from "@/components/ui/badge";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { useApiKey } from "@/hooks/use-api-key";
 import { PROVIDERS } from "@/lib/constants";
 import type { ProviderOption } from "@/lib/constants";
-import { fetchModels, DEFAULT_MODELS } from "@/lib/ai/models";
-import type { AIModel } from "@/lib/ai/models";
+import {
+  fetchModels,
+  getCachedModels,
+  recommendFallbackChains,
+  AI_TASKS,
+  DEFAULT_MODELS,
+} from "@/lib/ai/models";
+import type { AIModel, AITask } from "@/lib/ai/models";
 import { toast } from "sonner";
 import {
   Key, Eye, EyeOff, CheckCircle2, XCircle, Loader2,
-  RefreshCw,
+  RefreshCw, X,
 } from "lucide-react";
 
 export default function SettingsPage() {
-  const { apiKey, model, provider, setApiKey, setModel, setProvider, clearApiKey, isKeySet } =
-    useApiKey();
+  const {
+    apiKey, model, provider, fallbackChains,
+    setApiKey, setModel, setProvider, setFallbackChains, clearApiKey, isKeySet,
+  } = useApiKey();
   const [keyInput, setKeyInput] = useState("");
   const [showKey, setShowKey] = useState(false);
   const [isValidating, setIsValidating] = useState(false);
@@ -28,19 +37,28 @@ export default function SettingsPage() {
 
   const activeProvider = PROVIDERS.find((p) => p.id === provider) || PROVIDERS[0];
 
+  // Renders from the cached catalogue right away and revalidates it in the
+  // background when stale; `force` (the refresh button) always refetches.
   const loadModels = useCallback(
-    async (prov: ProviderOption, key: string) => {
+    async (prov: ProviderOption, key: string, force = false) => {
       if (!key) {
         setAvailableModels([]);
         return;
       }
+      const cached = force ? null : await getCachedModels(prov, key);
+      if (cached) {
+        setAvailableModels(cached.models);
+        if (!cached.stale) return;
+      }
       setIsLoadingModels(true);
       try {
         const models = await fetchModels(prov, key);
         setAvailableModels(models);
       } catch {
-        setAvailableModels([]);
-        toast.error("Could not fetch models. Your key may be invalid.");
+        if (!cached) {
+          setAvailableModels([]);
+          toast.error("Could not fetch models. Your key may be invalid.");
+        }
       } finally {
         setIsLoadingModels(false);
       }
@@ -54,9 +72,22 @@ export default function SettingsPage() {
     }
   }, [isKeySet, apiKey, provider, loadModels]);
 
+  // First time models are known, start from the recommended chains
+  useEffect(() => {
+    if (!fallbackChains && availableModels.length > 0 && model) {
+      setFallbackChains(recommendFallbackChains(availableModels, model));
+    }
+  }, [fallbackChains, availableModels, model, setFallbackChains]);
+
+  function updateChain(task: AITask, chain: string[]) {
+    if (!fallbackChains) return;
+    setFallbackChains({ ...fallbackChains, [task]: chain });
+  }
+
   function handleProviderChange(newProvider: ProviderOption) {
     setProvider(newProvider);
     setModel(DEFAULT_MODELS[newProvider] || "");
+    setFallbackChains(null);
     setAvailableModels([]);
     if (isKeySet) {
       clearApiKey();
@@ -239,7 +270,7 @@ export default function SettingsPage() {
                 variant="ghost"
                 size="icon"
                 className="size-8"
-                onClick={() => loadModels(provider, apiKey)}
+                onClick={() => loadModels(provider, apiKey, true)}
                 disabled={isLoadingModels}
               >
                 <RefreshCw
@@ -254,7 +285,7 @@ export default function SettingsPage() {
             <p className="text-sm text-muted-foreground">
               Enter your API key above to load available models.
             </p>
-          ) : isLoadingModels ? (
+          ) : isLoadingModels && availableModels.length === 0 ? (
             <div className="flex items-center gap-2 text-sm text-muted-foreground">
               <Loader2 className="size-4 animate-spin" />
               Fetching models...
@@ -279,6 +310,91 @@ export default function SettingsPage() {
           )}
         </CardContent>
       </Card>
+
+      <Card>
+        <CardHeader>
+          <div className="flex items-center justify-between">
+            <div>
+              <CardTitle className="text-base">Automatic Fallback</CardTitle>
+              <CardDescription>
+                When the selected model runs out of quota or is unavailable, each task
+                retries with these models in order.
+              </CardDescription>
+            </div>
+            {isKeySet && availableModels.length > 0 && (
+              <Button
+                variant="ghost"
+                size="sm"
+                onClick={() =>
+                  setFallbackChains(recommendFallbackChains(availableModels, model))
+                }
+              >
+                Reset
+              </Button>
+            )}
+          </div>
+        </CardHeader>
+        <CardContent className="space-y-4">
+          {!isKeySet || !fallbackChains ? (
+            <p className="text-sm text-muted-foreground">
+              Connect your API key above to configure fallback models.
+            </p>
+          ) : (
+            <>
+              {AI_TASKS.map((task) => {
+                const chain = fallbackChains[task.id] || [];
+                const addable = availableModels.filter(
+                  (m) => m.id !== model && !chain.includes(m.id)
+                );
+                return (
+                  <div key={task.id} className="space-y-1.5">
+                    <Label>{task.label}</Label>
+                    <div className="flex flex-wrap items-center gap-1.5">
+                      <Badge variant="secondary">{model}</Badge>
+                      {chain.map((id) => (
+                        <Badge key={id} variant="outline" className="gap-1">
+                          {id}
+                          <button
+                            type="button"
+                            aria-label={`Remove ${id}`}
+                            onClick={() =>
+                              updateChain(task.id, chain.filter((c) => c !== id))
+                            }
+                          >
+                            <X className="size-3" />
+                          </button>
+                        </Badge>
+                      ))}
+                      {addable.length > 0 && (
+                        <Select
+                          value=""
+                          onValueChange={(id) => updateChain(task.id, [...chain, id])}
+                        >
+                          <SelectTrigger className="h-7 w-auto text-xs">
+                            <SelectValue placeholder="Add fallback..." />
+                          </SelectTrigger>
+                          <SelectContent>
+                            {addable.map((m) => (
+                              <SelectItem key={m.id} value={m.id}>
+                                {m.name}
+                              </SelectItem>
+                            ))}
+                          </SelectContent>
+                        </Select>
+                      )}
+                    </div>
+                  </div>
+                );
+              })}
+              <p className="text-xs text-muted-foreground">
+                Slow meeting processing, compliance and transcription calls are also
+                hedged: once a call runs past the model&apos;s usual (p95) latency, the
+                next model starts in parallel and the first answer wins.
+              </p>
+            </>
+          )}
+        </CardContent>
+      </Card>
     </div>
   );
 }
@@ -392,7 +392,7 @@ export default function MeetingRoomPage() {
           {/* Process recording (host only, after recording stopped) */}
           {selectedRole === "host" &&
             recorder.state === "stopped" &&
-            recorder.base64Data && (
+            recorder.recordingId && (
               <Card className="border-primary/30 bg-primary/5">
                 <CardContent className="pt-6">
                   <div className="flex items-center justify-between">
@@ -408,16 +408,12 @@ export default function MeetingRoomPage() {
                     <Button
                       className="gap-1.5 shrink-0"
                       onClick={() => {
-                        // Store recording data in sessionStorage for the process page
-                        sessionStorage.setItem(
-                          "meeting-recording",
-                          JSON.stringify({
-                            base64: recorder.base64Data,
-                            mimeType: recorder.mimeType,
-                            duration: recorder.duration,
-                          })
+                        // The recording is already spooled in IndexedDB; the
+                        // process page loads it by ID.
+                        window.open(
+                          `/dashboard/meetings/new?source=room&recording=${recorder.recordingId}`,
+                          "_blank"
                         );
-                        window.open("/dashboard/meetings/new?source=room", "_blank");
                       }}
                       disabled={!isKeySet}
                     >
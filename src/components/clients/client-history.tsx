@@ -0,0 +1,135 @@
+"use client";
+
+import { useState } from "react";
+import Link from "next/link";
+import { toast } from "sonner";
+import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
+import { Badge } from "@/components/ui/badge";
+import { Button } from "@/components/ui/button";
+import { formatDate, formatDueDate } from "@/lib/utils/formatters";
+import { PRIORITY_COLORS, STATUS_COLORS } from "@/lib/constants";
+import type {
+  ClientHistoryKind,
+  ClientHistoryPage,
+  ClientMeetingItem,
+  ClientTaskItem,
+} from "@/lib/clients/history-query";
+import { Loader2 } from "lucide-react";
+
+const TITLES: Record<ClientHistoryKind, string> = { meetings: "Meetings", tasks: "Tasks" };
+const EMPTY: Record<ClientHistoryKind, string> = { meetings: "No meetings yet.", tasks: "No tasks." };
+
+interface ClientHistoryCardProps {
+  clientId: string;
+  kind: ClientHistoryKind;
+  initialPage: ClientHistoryPage;
+}
+
+// One history list on the client detail page. The first page is rendered on
+// the server; older entries are appended on demand.
+export function ClientHistoryCard({ clientId, kind, initialPage }: ClientHistoryCardProps) {
+  const [history, setHistory] = useState({
+    source: initialPage,
+    items: initialPage.items,
+    nextCursor: initialPage.nextCursor,
+  });
+  const [isLoading, setIsLoading] = useState(false);
+
+  // A fresh server render (e.g. after the cache was purged) starts over
+  if (history.source !== initialPage) {
+    setHistory({
+      source: initialPage,
+      items: initialPage.items,
+      nextCursor: initialPage.nextCursor,
+    });
+  }
+
+  async function loadOlder() {
+    const { source, nextCursor } = history;
+    if (!nextCursor || isLoading) return;
+    setIsLoading(true);
+    try {
+      const params = new URLSearchParams({ kind, cursor: nextCursor });
+      const res = await fetch(`/api/clients/${clientId}/history?${params}`);
+      const json = await res.json();
+      if (!res.ok) throw new Error(json.error || `Failed to load ${kind}`);
+      const page = json.data as ClientHistoryPage;
+      setHistory((prev) =>
+        prev.source === source && prev.nextCursor === nextCursor
+          ? { source, items: [...prev.items, ...page.items], nextCursor: page.nextCursor }
+          : prev
+      );
+    } catch (error) {
+      toast.error(error instanceof Error ? error.message : `Failed to load ${kind}`);
+    } finally {
+      setIsLoading(false);
+    }
+  }
+
+  return (
+    <Card>
+      <CardHeader>
+        <CardTitle className="text-base">
+          {TITLES[kind]} ({initialPage.total ?? history.items.length})
+        </CardTitle>
+      </CardHeader>
+      <CardContent>
+        {history.items.length === 0 ? (
+          <p className="text-sm text-muted-foreground">{EMPTY[kind]}</p>
+        ) : (
+          <div className="space-y-3">
+            {kind === "meetings"
+              ? (history.items as ClientMeetingItem[]).map((m) => (
+                  <MeetingRow key={m.id} meeting={m} />
+                ))
+              : (history.items as ClientTaskItem[]).map((t) => <TaskRow key={t.id} task={t} />)}
+            {history.nextCursor && (
+              <Button
+                variant="outline"
+                size="sm"
+                className="w-full"
+                onClick={loadOlder}
+                disabled={isLoading}
+              >
+                {isLoading && <Loader2 className="size-4 animate-spin" />}
+                Load older
+              </Button>
+            )}
+          </div>
+        )}
+      </CardContent>
+    </Card>
+  );
+}
+
+// Links to the workbench, which is where the transcript is loaded.
+function MeetingRow({ meeting }: { meeting: ClientMeetingItem }) {
+  return (
+    <Link
+      href={`/dashboard/meetings/${meeting.id}`}
+      className="flex items-center justify-between rounded-lg border p-3 transition-colors hover:bg-accent"
+    >
+      <div>
+        <p className="text-sm font-medium">{meeting.title}</p>
+        <p className="text-xs text-muted-foreground">{formatDate(meeting.created_at)}</p>
+      </div>
+      <Badge variant="secondary" className={`text-xs ${STATUS_COLORS[meeting.status] || ""}`}>
+        {meeting.status.replace("_", " ")}
+      </Badge>
+    </Link>
+  );
+}
+
+function TaskRow({ task }: { task: ClientTaskItem }) {
+  return (
+    <div className="flex items-start justify-between rounded-lg border p-3">
+      <div>
+        <p className="text-sm">{task.description}</p>
+        <p className="text-xs text-muted-foreground">{formatDueDate(task.due_date)}</p>
+      </div>
+      <Badge variant="secondary" className={`text-xs ${PRIORITY_COLORS[task.priority] || ""}`}>
+        {task.priority}
+      </Badge>
+    </div>
+  );
+}
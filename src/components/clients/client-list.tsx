@@ -0,0 +1,232 @@
+"use client";
+
+import { useEffect, useRef, useState, useTransition } from "react";
+import { usePathname, useRouter } from "next/navigation";
+import Link from "next/link";
+import { Card } from "@/components/ui/card";
+import { Badge } from "@/components/ui/badge";
+import { Input } from "@/components/ui/input";
+import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
+import { useVirtualRows } from "@/hooks/use-virtual-rows";
+import {
+  CLIENT_SORTS,
+  CLIENT_STATUSES,
+  RISK_TOLERANCES,
+  clientListSearchParams,
+} from "@/lib/clients/list-query";
+import type {
+  ClientListFilters,
+  ClientListItem,
+  ClientListPage,
+  ClientListSort,
+} from "@/lib/clients/list-query";
+import { formatCurrencyCompact } from "@/lib/utils/formatters";
+import { RISK_TOLERANCE_COLORS } from "@/lib/constants";
+import { Loader2, Search, Users } from "lucide-react";
+
+const ROW_HEIGHT = 72;
+// Start fetching the next page this many rows before the end is in view.
+const PREFETCH_ROWS = 20;
+const SEARCH_DEBOUNCE_MS = 300;
+const ALL = "all";
+
+interface ClientListProps {
+  filters: ClientListFilters;
+  initialPage: ClientListPage;
+}
+
+// Filters live in the URL: changing one re-renders the page on the server
+// with a new first page, and later pages are fetched from /api/clients as
+// the list scrolls. Rows are virtualized, so the DOM stays the same size
+// however many pages have been loaded.
+export function ClientList({ filters, initialPage }: ClientListProps) {
+  const router = useRouter();
+  const pathname = usePathname();
+  const [isNavigating, startTransition] = useTransition();
+  const [query, setQuery] = useState(filters.q);
+  const [list, setList] = useState({
+    source: initialPage,
+    clients: initialPage.clients,
+    nextCursor: initialPage.nextCursor,
+  });
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  const loadingRef = useRef(false);
+
+  // A new first page (filters changed) replaces everything loaded so far
+  if (list.source !== initialPage) {
+    setList({
+      source: initialPage,
+      clients: initialPage.clients,
+      nextCursor: initialPage.nextCursor,
+    });
+  }
+
+  const { containerRef, start, end, offsetTop, totalHeight, scrollToTop } = useVirtualRows({
+    count: list.clients.length,
+    rowHeight: ROW_HEIGHT,
+  });
+
+  function applyFilters(update: Partial<ClientListFilters>) {
+    const params = clientListSearchParams({ ...filters, ...update });
+    scrollToTop();
+    startTransition(() => {
+      router.replace(`${pathname}${params.size ? `?${params}` : ""}`, { scroll: false });
+    });
+  }
+
+  useEffect(() => {
+    if (query.trim() === filters.q) return;
+    const timer = setTimeout(() => applyFilters({ q: query.trim() }), SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [query, filters.q]);
+
+  useEffect(() => {
+    const { nextCursor, source } = list;
+    if (!nextCursor || loadingRef.current) return;
+    if (end < list.clients.length - PREFETCH_ROWS) return;
+
+    loadingRef.current = true;
+    setIsLoadingMore(true);
+    fetch(`/api/clients?${clientListSearchParams(filters, nextCursor)}`)
+      .then((res) => res.json())
+      .then(({ data }: { data?: ClientListPage }) => {
+        if (!data) return;
+        setList((prev) =>
+          // Dropped if the filters changed while the page was loading
+          prev.source === source && prev.nextCursor === nextCursor
+            ? {
+                source,
+                clients: [...prev.clients, ...data.clients],
+                nextCursor: data.nextCursor,
+              }
+            : prev
+        );
+      })
+      .catch(() => {})
+      .finally(() => {
+        loadingRef.current = false;
+        setIsLoadingMore(false);
+      });
+  }, [end, list, filters]);
+
+  return (
+    <div className="space-y-4">
+      <div className="flex flex-wrap items-center gap-2">
+        <div className="relative w-full sm:w-64">
+          <Search className="absolute left-2.5 top-2.5 size-4 text-muted-foreground" />
+          <Input
+            value={query}
+            onChange={(e) => setQuery(e.target.value)}
+            placeholder="Search clients..."
+            className="pl-8"
+          />
+        </div>
+        <Select
+          value={filters.status ?? ALL}
+          onValueChange={(v) =>
+            applyFilters({ status: v === ALL ? null : (v as ClientListFilters["status"]) })
+          }
+        >
+          <SelectTrigger className="w-36">
+            <SelectValue />
+          </SelectTrigger>
+          <SelectContent>
+            <SelectItem value={ALL}>All statuses</SelectItem>
+            {CLIENT_STATUSES.map((s) => (
+              <SelectItem key={s} value={s}>
+                {s}
+              </SelectItem>
+            ))}
+          </SelectContent>
+        </Select>
+        <Select
+          value={filters.risk ?? ALL}
+          onValueChange={(v) =>
+            applyFilters({ risk: v === ALL ? null : (v as ClientListFilters["risk"]) })
+          }
+        >
+          <SelectTrigger className="w-40">
+            <SelectValue />
+          </SelectTrigger>
+          <SelectContent>
+            <SelectItem value={ALL}>All risk profiles</SelectItem>
+            {RISK_TOLERANCES.map((r) => (
+              <SelectItem key={r} value={r}>
+                {r}
+              </SelectItem>
+            ))}
+          </SelectContent>
+        </Select>
+        <Select
+          value={filters.sort}
+          onValueChange={(v) => applyFilters({ sort: v as ClientListSort })}
+        >
+          <SelectTrigger className="w-44">
+            <SelectValue />
+          </SelectTrigger>
+          <SelectContent>
+            {CLIENT_SORTS.map((s) => (
+              <SelectItem key={s.id} value={s.id}>
+                {s.label}
+              </SelectItem>
+            ))}
+          </SelectContent>
+        </Select>
+        {(isNavigating || isLoadingMore) && (
+          <Loader2 className="size-4 animate-spin text-muted-foreground" />
+        )}
+      </div>
+
+      <Card className="py-0">
+        {/* Always mounted so the scroll and resize listeners stay attached */}
+        <div ref={containerRef} className="h-[calc(100svh-16rem)] min-h-80 overflow-auto">
+          {list.clients.length === 0 ? (
+            <p className="p-6 text-sm text-muted-foreground">No clients match these filters.</p>
+          ) : (
+            <div style={{ height: totalHeight, position: "relative" }}>
+              <div style={{ transform: `translateY(${offsetTop}px)` }}>
+                {list.clients.slice(start, end).map((client) => (
+                  <ClientRow key={client.id} client={client} />
+                ))}
+              </div>
+            </div>
+          )}
+        </div>
+      </Card>
+    </div>
+  );
+}
+
+function ClientRow({ client }: { client: ClientListItem }) {
+  return (
+    <Link
+      href={`/dashboard/clients/${client.id}`}
+      className="flex items-center gap-3 border-b px-4 transition-colors hover:bg-accent/50"
+      style={{ height: ROW_HEIGHT }}
+    >
+      <div className="flex size-9 shrink-0 items-center justify-center rounded-full bg-primary/10 text-primary">
+        <Users className="size-4" />
+      </div>
+      <div className="min-w-0 flex-1">
+        <p className="truncate text-sm font-medium">{client.name}</p>
+        <p className="truncate text-xs text-muted-foreground">
+          {formatCurrencyCompact(Number(client.aum_value))} AUM
+          {client.notes ? ` · ${client.notes}` : ""}
+        </p>
+      </div>
+      <Badge
+        variant="secondary"
+        className={`text-xs ${RISK_TOLERANCE_COLORS[client.risk_tolerance] || ""}`}
+      >
+        {client.risk_tolerance}
+      </Badge>
+      <Badge
+        variant={client.status === "Active" ? "default" : "outline"}
+        className="hidden text-xs sm:inline-flex"
+      >
+        {client.status}
+      </Badge>
+    </Link>
+  );
+}
@@ -14,7 +14,6 @@ import {
 
 export interface UploadedFile {
   file: File;
-  base64: string;
   mimeType: string;
   preview: {
     name: string;
@@ -74,7 +73,7 @@ export function FileUploadZone({
   );
 
   const processFile = useCallback(
-    async (file: File) => {
+    (file: File) => {
       setError(null);
       const validationError = validateFile(file);
       if (validationError) {
@@ -82,30 +81,19 @@ export function FileUploadZone({
         return;
       }
 
-      try {
-        const arrayBuffer = await file.arrayBuffer();
-        const base64 = btoa(
-          new Uint8Array(arrayBuffer).reduce(
-            (data, byte) => data + String.fromCharCode(byte),
-            ""
-          )
-        );
-
-        const uploaded: UploadedFile = {
-          file,
-          base64,
-          mimeType: file.type || (fileType === "audio" ? "audio/mpeg" : "text/plain"),
-          preview: {
-            name: file.name,
-            size: formatFileSize(file.size),
-            type: fileType,
-          },
-        };
-
-        onFileReady(uploaded);
-      } catch {
-        setError("Failed to read file. Please try again.");
-      }
+      // The File is uploaded directly as the request body, so nothing is
+      // read into memory here.
+      const uploaded: UploadedFile = {
+        file,
+        mimeType: file.type || (fileType === "audio" ? "audio/mpeg" : "text/plain"),
+        preview: {
+          name: file.name,
+          size: formatFileSize(file.size),
+          type: fileType,
+        },
+      };
+
+      onFileReady(uploaded);
     },
     [validateFile, fileType, onFileReady]
   );
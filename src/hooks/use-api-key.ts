@@ -3,16 +3,29 @@
 import { useState, useEffect, useCallback } from "react";
 import {
   API_KEY_STORAGE_KEY,
+  FALLBACK_CHAINS_STORAGE_KEY,
   MODEL_STORAGE_KEY,
   PROVIDER_STORAGE_KEY,
 } from "@/lib/constants";
 import type { ProviderOption } from "@/lib/constants";
 import { DEFAULT_MODELS } from "@/lib/ai/models";
+import type { FallbackChains } from "@/lib/ai/models";
+
+function readFallbackChains(): FallbackChains | null {
+  try {
+    const stored = localStorage.getItem(FALLBACK_CHAINS_STORAGE_KEY);
+    return stored ? (JSON.parse(stored) as FallbackChains) : null;
+  } catch {
+    return null;
+  }
+}
 
 export function useApiKey() {
   const [apiKey, setApiKeyState] = useState<string>("");
   const [model, setModelState] = useState<string>("");
   const [provider, setProviderState] = useState<ProviderOption>("google");
+  // null until configured (Settings fills in recommended chains)
+  const [fallbackChains, setFallbackChainsState] = useState<FallbackChains | null>(null);
   const [isLoaded, setIsLoaded] = useState(false);
 
   useEffect(() => {
@@ -23,6 +36,7 @@ export function useApiKey() {
     setApiKeyState(storedKey);
     setModelState(storedModel || DEFAULT_MODELS[storedProvider] || "");
     setProviderState(storedProvider);
+    setFallbackChainsState(readFallbackChains());
     setIsLoaded(true);
   }, []);
 
@@ -45,6 +59,15 @@ export function useApiKey() {
     localStorage.setItem(PROVIDER_STORAGE_KEY, p);
   }, []);
 
+  const setFallbackChains = useCallback((chains: FallbackChains | null) => {
+    setFallbackChainsState(chains);
+    if (chains) {
+      localStorage.setItem(FALLBACK_CHAINS_STORAGE_KEY, JSON.stringify(chains));
+    } else {
+      localStorage.removeItem(FALLBACK_CHAINS_STORAGE_KEY);
+    }
+  }, []);
+
   const clearApiKey = useCallback(() => {
     setApiKeyState("");
     localStorage.removeItem(API_KEY_STORAGE_KEY);
@@ -54,9 +77,11 @@ export function useApiKey() {
     apiKey,
     model,
     provider,
+    fallbackChains,
     setApiKey,
     setModel,
     setProvider,
+    setFallbackChains,
     clearApiKey,
     isKeySet: isLoaded && apiKey.length > 0,
     isLoaded,
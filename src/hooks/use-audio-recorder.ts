@@ -1,6 +1,12 @@
 "use client";
 
 import { useState, useRef, useCallback, useEffect } from "react";
+import { createLiveTranscriber } from "@/lib/audio/live-transcriber";
+import type { LiveTranscriber } from "@/lib/audio/live-transcriber";
+import { capturePcm } from "@/lib/audio/pcm-capture";
+import { createRecordingSpool } from "@/lib/audio/recording-spool";
+import type { RecordingSpool } from "@/lib/audio/recording-spool";
+import type { TranscriptionOutcome } from "@/lib/ai/transcribe-upload";
 
 export type RecordingState = "idle" | "recording" | "paused" | "stopped";
 
@@ -9,10 +15,21 @@ export interface AudioRecorderResult {
   duration: number;
   audioBlob: Blob | null;
   audioUrl: string | null;
-  base64Data: string | null;
+  /**
+   * ID of the recording in the IndexedDB spool once stopped, or null when
+   * IndexedDB was unavailable and the recording only exists in memory.
+   */
+  recordingId: string | null;
   mimeType: string;
   error: string | null;
   analyserNode: AnalyserNode | null;
+  /** Stitched transcript of the windows transcribed so far (live mode only). */
+  liveTranscript: string;
+  /**
+   * Resolves with the full live transcript once the recording has stopped,
+   * or null when the recording was not transcribed live.
+   */
+  getLiveTranscription: () => Promise<TranscriptionOutcome> | null;
   startRecording: () => Promise<void>;
   pauseRecording: () => void;
   resumeRecording: () => void;
@@ -20,6 +37,18 @@ export interface AudioRecorderResult {
   resetRecording: () => void;
 }
 
+export interface AudioRecorderOptions {
+  /** When set, the recording is transcribed in windows while it is captured. */
+  liveTranscription?: {
+    apiKey: string;
+    model: string;
+    fallbackModels?: string[];
+  } | null;
+}
+
+// MediaRecorder timeslice.
+const CHUNK_MS = 250;
+
 function getSupportedMimeType(): string {
   const types = [
     "audio/webm;codecs=opus",
@@ -36,29 +65,47 @@ function getSupportedMimeType(): string {
 }
 
 export function useAudioRecorder(
-  externalStream?: MediaStream | null
+  externalStream?: MediaStream | null,
+  options: AudioRecorderOptions = {}
 ): AudioRecorderResult {
   const [state, setState] = useState<RecordingState>("idle");
   const [duration, setDuration] = useState(0);
   const [audioBlob, setAudioBlob] = useState<Blob | null>(null);
   const [audioUrl, setAudioUrl] = useState<string | null>(null);
-  const [base64Data, setBase64Data] = useState<string | null>(null);
+  const [recordingId, setRecordingId] = useState<string | null>(null);
   const [mimeType, setMimeType] = useState("audio/webm");
   const [error, setError] = useState<string | null>(null);
   const [analyserNode, setAnalyserNode] = useState<AnalyserNode | null>(null);
+  const [liveTranscript, setLiveTranscript] = useState("");
 
   const mediaRecorderRef = useRef<MediaRecorder | null>(null);
   const chunksRef = useRef<Blob[]>([]);
+  const spoolRef = useRef<RecordingSpool | null>(null);
   const timerRef = useRef<ReturnType<typeof setInterval> | null>(null);
   const streamRef = useRef<MediaStream | null>(null);
   const audioContextRef = useRef<AudioContext | null>(null);
   const startTimeRef = useRef<number>(0);
   const pausedDurationRef = useRef<number>(0);
+  const liveTranscriberRef = useRef<LiveTranscriber | null>(null);
+  const stopCaptureRef = useRef<(() => void) | null>(null);
+  const liveResultRef = useRef<Promise<TranscriptionOutcome> | null>(null);
+  const liveOptionsRef = useRef(options.liveTranscription);
+
+  useEffect(() => {
+    liveOptionsRef.current = options.liveTranscription;
+  }, [options.liveTranscription]);
+
+  const stopCapture = useCallback(() => {
+    stopCaptureRef.current?.();
+    stopCaptureRef.current = null;
+  }, []);
 
   // Cleanup on unmount
   useEffect(() => {
     return () => {
       if (timerRef.current) clearInterval(timerRef.current);
+      stopCapture();
+      liveTranscriberRef.current?.cancel();
       if (audioContextRef.current?.state !== "closed") {
         audioContextRef.current?.close();
       }
@@ -68,7 +115,7 @@ export function useAudioRecorder(
       }
       if (audioUrl) URL.revokeObjectURL(audioUrl);
     };
-  }, [externalStream, audioUrl]);
+  }, [externalStream, audioUrl, stopCapture]);
 
   const startTimer = useCallback(() => {
     startTimeRef.current = Date.now() - pausedDurationRef.current * 1000;
@@ -84,27 +131,19 @@ export function useAudioRecorder(
     }
   }, []);
 
-  const blobToBase64 = useCallback((blob: Blob): Promise<string> => {
-    return new Promise((resolve, reject) => {
-      const reader = new FileReader();
-      reader.onloadend = () => {
-        const dataUrl = reader.result as string;
-        // Strip the data:audio/...;base64, prefix
-        const base64 = dataUrl.split(",")[1];
-        resolve(base64);
-      };
-      reader.onerror = reject;
-      reader.readAsDataURL(blob);
-    });
-  }, []);
-
   const startRecording = useCallback(async () => {
     setError(null);
     setAudioBlob(null);
     setAudioUrl(null);
-    setBase64Data(null);
+    setRecordingId(null);
+    setLiveTranscript("");
     chunksRef.current = [];
+    spoolRef.current = null;
     pausedDurationRef.current = 0;
+    stopCapture();
+    liveTranscriberRef.current?.cancel();
+    liveTranscriberRef.current = null;
+    liveResultRef.current = null;
 
     try {
       // Use external stream if provided, otherwise get mic
@@ -142,30 +181,69 @@ export function useAudioRecorder(
       });
       mediaRecorderRef.current = recorder;
 
+      // Spool chunks to IndexedDB so long recordings don't live in memory;
+      // fall back to an in-memory buffer where IndexedDB is unavailable.
+      const spool = await createRecordingSpool(mime).catch((err) => {
+        console.warn("Recording spool unavailable, buffering in memory:", err);
+        return null;
+      });
+      spoolRef.current = spool;
+
+      // Live transcription works on PCM tapped from the audio graph, so each
+      // window can be sent as a standalone WAV file. Without AudioWorklet
+      // support the recording is transcribed once it has stopped instead.
+      const live = liveOptionsRef.current;
+      let liveTranscriber: LiveTranscriber | null = null;
+      if (live) {
+        const transcriber = createLiveTranscriber({
+          ...live,
+          onPartialTranscript: setLiveTranscript,
+        });
+        try {
+          stopCaptureRef.current = await capturePcm(audioContext, source, (samples) => {
+            // Nothing is kept before start(), while paused, or after stop()
+            if (recorder.state === "recording") transcriber.push(samples);
+          });
+          liveTranscriber = transcriber;
+        } catch (err) {
+          console.warn("Live transcription unavailable, transcribing after recording:", err);
+          transcriber.cancel();
+        }
+      }
+      liveTranscriberRef.current = liveTranscriber;
+
       recorder.ondataavailable = (e) => {
         if (e.data.size > 0) {
-          chunksRef.current.push(e.data);
+          if (spool) spool.append(e.data);
+          else chunksRef.current.push(e.data);
         }
       };
 
       recorder.onstop = async () => {
-        const blob = new Blob(chunksRef.current, { type: mime });
-        setAudioBlob(blob);
-        const url = URL.createObjectURL(blob);
-        setAudioUrl(url);
+        // Transcribe the last window straight away rather than waiting for
+        // the advisor to hit Process.
+        if (liveTranscriber) liveResultRef.current = liveTranscriber.finish();
 
+        let blob: Blob;
         try {
-          const b64 = await blobToBase64(blob);
-          setBase64Data(b64);
-        } catch {
-          console.error("Failed to convert recording to base64");
+          blob = spool
+            ? await spool.finish()
+            : new Blob(chunksRef.current, { type: mime });
+        } catch (err) {
+          console.error("Failed to read recording from spool:", err);
+          setError("Failed to save the recording. Please try again.");
+          setState("idle");
+          return;
         }
-
+        setAudioBlob(blob);
+        setRecordingId(spool?.id ?? null);
+        const url = URL.createObjectURL(blob);
+        setAudioUrl(url);
         setState("stopped");
       };
 
       // Collect data every 250ms for responsive stopping
-      recorder.start(250);
+      recorder.start(CHUNK_MS);
       setState("recording");
       setDuration(0);
       startTimer();
@@ -179,7 +257,7 @@ export function useAudioRecorder(
       setError(message);
       setState("idle");
     }
-  }, [externalStream, blobToBase64, startTimer]);
+  }, [externalStream, startTimer, stopCapture]);
 
   const pauseRecording = useCallback(() => {
     if (mediaRecorderRef.current?.state === "recording") {
@@ -206,6 +284,7 @@ export function useAudioRecorder(
     ) {
       mediaRecorderRef.current.stop();
     }
+    stopCapture();
     // Only stop our own stream, not external
     if (!externalStream && streamRef.current) {
       streamRef.current.getTracks().forEach((t) => t.stop());
@@ -214,7 +293,7 @@ export function useAudioRecorder(
       audioContextRef.current?.close();
       setAnalyserNode(null);
     }
-  }, [externalStream, stopTimer]);
+  }, [externalStream, stopTimer, stopCapture]);
 
   const resetRecording = useCallback(() => {
     stopTimer();
@@ -224,6 +303,7 @@ export function useAudioRecorder(
     ) {
       mediaRecorderRef.current.stop();
     }
+    stopCapture();
     if (!externalStream && streamRef.current) {
       streamRef.current.getTracks().forEach((t) => t.stop());
     }
@@ -232,25 +312,38 @@ export function useAudioRecorder(
       setAnalyserNode(null);
     }
     if (audioUrl) URL.revokeObjectURL(audioUrl);
+    const spool = spoolRef.current;
+    spoolRef.current = null;
+    spool?.discard().catch((err) => {
+      console.error("Failed to discard spooled recording:", err);
+    });
     setAudioBlob(null);
     setAudioUrl(null);
-    setBase64Data(null);
+    setRecordingId(null);
+    setLiveTranscript("");
     setDuration(0);
     setError(null);
+    liveTranscriberRef.current?.cancel();
+    liveTranscriberRef.current = null;
+    liveResultRef.current = null;
     chunksRef.current = [];
     pausedDurationRef.current = 0;
     setState("idle");
-  }, [externalStream, audioUrl, stopTimer]);
+  }, [externalStream, audioUrl, stopTimer, stopCapture]);
+
+  const getLiveTranscription = useCallback(() => liveResultRef.current, []);
 
   return {
     state,
     duration,
     audioBlob,
     audioUrl,
-    base64Data,
+    recordingId,
     mimeType,
     error,
     analyserNode,
+    liveTranscript,
+    getLiveTranscription,
     startRecording,
     pauseRecording,
     resumeRecording,
@@ -0,0 +1,29 @@
+"use client";
+
+import { useState, useEffect } from "react";
+import { getTranscriptWorker, isStaleRequest } from "@/lib/workers/transcript-client";
+import type { PIIScan } from "@/lib/workers/transcript-client";
+
+const EMPTY_SCAN: PIIScan = { entities: [], summary: "No PII detected" };
+
+/**
+ * Live PII scan for an editable transcript. Scanning runs in the transcript
+ * worker and each change rescans only the region around the edit; results for
+ * superseded transcripts are dropped.
+ */
+export function usePIIPreview(transcript: string): PIIScan {
+  const [scan, setScan] = useState<PIIScan>(EMPTY_SCAN);
+
+  useEffect(() => {
+    const controller = new AbortController();
+    getTranscriptWorker()
+      .preview(transcript, { key: "pii-vault", signal: controller.signal })
+      .then(setScan)
+      .catch((error) => {
+        if (!isStaleRequest(error)) console.error("PII preview failed:", error);
+      });
+    return () => controller.abort();
+  }, [transcript]);
+
+  return scan;
+}
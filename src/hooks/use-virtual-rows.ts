@@ -0,0 +1,67 @@
+"use client";
+
+import { useCallback, useEffect, useRef, useState } from "react";
+
+interface VirtualRowsOptions {
+  count: number;
+  rowHeight: number;
+  /** Rows mounted beyond each edge of the viewport. */
+  overscan?: number;
+}
+
+/**
+ * Windowing for a fixed-row-height list inside its own scroll container:
+ * only the rows in view (plus overscan) are mounted. Attach `containerRef`
+ * to the scroll container and render rows [start, end) offset by
+ * `offsetTop` inside a spacer of `totalHeight`.
+ */
+export function useVirtualRows({ count, rowHeight, overscan = 8 }: VirtualRowsOptions) {
+  const containerRef = useRef<HTMLDivElement>(null);
+  const [viewport, setViewport] = useState({ scrollTop: 0, height: 0 });
+
+  const measure = useCallback(() => {
+    const el = containerRef.current;
+    if (el) setViewport({ scrollTop: el.scrollTop, height: el.clientHeight });
+  }, []);
+
+  useEffect(() => {
+    const el = containerRef.current;
+    if (!el) return;
+    let frame: number | null = null;
+    const onScroll = () => {
+      if (frame !== null) return;
+      frame = requestAnimationFrame(() => {
+        frame = null;
+        measure();
+      });
+    };
+    const observer = new ResizeObserver(measure);
+    observer.observe(el);
+    el.addEventListener("scroll", onScroll, { passive: true });
+    measure();
+    return () => {
+      observer.disconnect();
+      el.removeEventListener("scroll", onScroll);
+      if (frame !== null) cancelAnimationFrame(frame);
+    };
+  }, [measure]);
+
+  const start = Math.max(0, Math.floor(viewport.scrollTop / rowHeight) - overscan);
+  const end = Math.min(
+    count,
+    Math.ceil((viewport.scrollTop + viewport.height) / rowHeight) + overscan
+  );
+
+  const scrollToTop = useCallback(() => {
+    containerRef.current?.scrollTo({ top: 0 });
+  }, []);
+
+  return {
+    containerRef,
+    start,
+    end,
+    offsetTop: start * rowHeight,
+    totalHeight: count * rowHeight,
+    scrollToTop,
+  };
+}
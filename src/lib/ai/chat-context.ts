@@ -0,0 +1,266 @@
+import { retrieveBookRecords } from "@/lib/retrieval/book-index";
+import type { BookRecordKind } from "@/lib/retrieval/book-index";
+import type { createServerSupabaseClient } from "@/lib/supabase/server";
+
+// Client-book context for the chat system prompt, cached per section and per
+// conversation. Every write to clients/meetings/tasks bumps that table's
+// counter in `table_versions` (statement-level triggers), so a turn costs
+// one small version query and sections are only rebuilt when their source
+// tables actually changed. Conversations keep the exact same context string
+// between turns while nothing changes, which keeps the prompt prefix stable.
+//
+// Large books are not sent whole: past RETRIEVAL_MIN_RECORDS the context is a
+// fixed-size overview plus the top-k records retrieved for the current
+// question from the semantic index (src/lib/retrieval), so prompt size stays
+// flat as the book grows.
+
+type ServerSupabase = Awaited<ReturnType<typeof createServerSupabaseClient>>;
+
+type VersionedTable = "clients" | "meetings" | "tasks" | "meeting_outputs";
+type TableVersions = Record<VersionedTable, number>;
+type ContextSection = "overview" | "clients" | "meetings" | "tasks";
+
+// Tables each section reads (meetings and tasks join client names).
+const SECTION_TABLES: Record<ContextSection, VersionedTable[]> = {
+  overview: ["clients", "tasks", "meeting_outputs"],
+  clients: ["clients"],
+  meetings: ["meetings", "clients"],
+  tasks: ["tasks", "clients"],
+};
+// Tables behind the retrieval index (client notes, summaries, tasks).
+const RETRIEVAL_TABLES: VersionedTable[] = ["clients", "meetings", "meeting_outputs", "tasks"];
+
+const RECENT_MEETINGS_LIMIT = 10;
+const PENDING_TASKS_LIMIT = 100;
+// Without the version table (migration not applied), fall back to a short TTL.
+const UNVERSIONED_TTL_MS = 15_000;
+const MAX_CONVERSATIONS = 200;
+// Book size (clients + pending tasks + meeting summaries) above which the
+// context switches from the full book to retrieval.
+const RETRIEVAL_MIN_RECORDS = 150;
+const RETRIEVAL_TOP_K = 12;
+
+interface CachedSection {
+  version: string;
+  text: string;
+  builtAt: number;
+}
+
+const sectionCache = new Map<ContextSection, CachedSection>();
+// Record count from the last overview build, used to pick the context mode.
+let bookSize = 0;
+const conversationCache = new Map<string, { version: string; context: string }>();
+
+type ClientName = { name: string } | null;
+
+function countBy<T>(rows: T[], key: (row: T) => string): string {
+  const counts = new Map<string, number>();
+  for (const row of rows) counts.set(key(row), (counts.get(key(row)) ?? 0) + 1);
+  return [...counts].map(([name, count]) => `${name} ${count}`).join(", ");
+}
+
+async function buildOverviewSection(supabase: ServerSupabase): Promise<string> {
+  const [clients, pendingTasks, summaries] = await Promise.all([
+    supabase.from("clients").select("aum_value, risk_tolerance, status"),
+    supabase.from("tasks").select("id", { count: "exact", head: true }).eq("status", "pending"),
+    supabase.from("meeting_outputs").select("id", { count: "exact", head: true }),
+  ]);
+  const rows = clients.data || [];
+  const totalAum = rows.reduce((sum, c) => sum + Number(c.aum_value), 0);
+  bookSize = rows.length + (pendingTasks.count ?? 0) + (summaries.count ?? 0);
+  return [
+    "## Book Overview",
+    `- ${rows.length} clients, total AUM $${totalAum.toLocaleString()}`,
+    `- Risk tolerance: ${countBy(rows, (c) => c.risk_tolerance)}`,
+    `- Status: ${countBy(rows, (c) => c.status)}`,
+    `- ${pendingTasks.count ?? 0} pending tasks, ${summaries.count ?? 0} meeting summaries`,
+  ].join("\n");
+}
+
+async function buildClientsSection(supabase: ServerSupabase): Promise<string> {
+  const { data } = await supabase
+    .from("clients")
+    .select("name, aum_value, risk_tolerance, status, notes")
+    .order("name");
+  const lines = ["## Client Book"];
+  for (const c of data || []) {
+    lines.push(
+      `- **${c.name}**: AUM $${Number(c.aum_value).toLocaleString()}, Risk: ${c.risk_tolerance}, Status: ${c.status}` +
+        (c.notes ? `, Notes: ${c.notes}` : "")
+    );
+  }
+  return lines.join("\n");
+}
+
+async function buildMeetingsSection(supabase: ServerSupabase): Promise<string> {
+  const { data } = await supabase
+    .from("meetings")
+    .select("title, status, created_at, clients(name)")
+    .order("created_at", { ascending: false })
+    .limit(RECENT_MEETINGS_LIMIT);
+  const lines = ["## Recent Meetings"];
+  for (const m of data || []) {
+    const clientName = (m.clients as unknown as ClientName)?.name || "Unknown";
+    lines.push(
+      `- "${m.title}" with ${clientName} (${m.status}) — ${new Date(m.created_at).toLocaleDateString()}`
+    );
+  }
+  return lines.join("\n");
+}
+
+async function buildTasksSection(supabase: ServerSupabase): Promise<string> {
+  const { data } = await supabase
+    .from("tasks")
+    .select("description, priority, due_date, clients(name)")
+    .eq("status", "pending")
+    .order("due_date", { ascending: true })
+    .limit(PENDING_TASKS_LIMIT);
+  const lines = ["## Pending Tasks"];
+  for (const t of data || []) {
+    const clientName = (t.clients as unknown as ClientName)?.name || "Unknown";
+    lines.push(
+      `- [${t.priority}] ${t.description} — for ${clientName}` +
+        (t.due_date ? ` (due ${new Date(t.due_date).toLocaleDateString()})` : "")
+    );
+  }
+  return lines.join("\n");
+}
+
+const SECTION_BUILDERS: Record<
+  ContextSection,
+  (supabase: ServerSupabase) => Promise<string>
+> = {
+  overview: buildOverviewSection,
+  clients: buildClientsSection,
+  meetings: buildMeetingsSection,
+  tasks: buildTasksSection,
+};
+
+async function fetchTableVersions(supabase: ServerSupabase): Promise<TableVersions | null> {
+  const { data, error } = await supabase
+    .from("table_versions")
+    .select("table_name, version");
+  if (error || !data) return null;
+  const versions: TableVersions = { clients: 0, meetings: 0, tasks: 0, meeting_outputs: 0 };
+  for (const row of data) {
+    if (row.table_name in versions) {
+      versions[row.table_name as VersionedTable] = Number(row.version);
+    }
+  }
+  return versions;
+}
+
+function sectionVersion(section: ContextSection, versions: TableVersions | null): string {
+  if (!versions) return "unversioned";
+  return SECTION_TABLES[section].map((t) => `${t}:${versions[t]}`).join(",");
+}
+
+async function getSection(
+  supabase: ServerSupabase,
+  section: ContextSection,
+  version: string
+): Promise<string> {
+  const cached = sectionCache.get(section);
+  if (
+    cached &&
+    cached.version === version &&
+    (version !== "unversioned" || Date.now() - cached.builtAt < UNVERSIONED_TTL_MS)
+  ) {
+    return cached.text;
+  }
+  const text = await SECTION_BUILDERS[section](supabase);
+  sectionCache.set(section, { version, text, builtAt: Date.now() });
+  return text;
+}
+
+const RECORD_LABELS: Record<BookRecordKind, string> = {
+  client: "Client",
+  meeting: "Meeting",
+  task: "Task",
+};
+
+export interface ChatRetrievalOptions {
+  apiKey: string;
+  model: string;
+  /** Recent user text the records are retrieved for. */
+  query: string;
+}
+
+/**
+ * Overview plus the records most relevant to `query`. If retrieval fails
+ * (e.g. no embedding access for the key, or the index is still being built)
+ * it falls back to the bounded recent meetings and pending tasks sections
+ * rather than the full client list.
+ */
+async function getRetrievalContext(
+  supabase: ServerSupabase,
+  versions: TableVersions | null,
+  overview: string,
+  { apiKey, model, query }: ChatRetrievalOptions
+): Promise<string> {
+  try {
+    const records = await retrieveBookRecords(supabase, {
+      apiKey,
+      model,
+      query,
+      version: versions ? RETRIEVAL_TABLES.map((t) => `${t}:${versions[t]}`).join(",") : null,
+      k: RETRIEVAL_TOP_K,
+    });
+    const lines = [
+      "## Relevant Records",
+      "Retrieved for the current question by semantic search; the rest of the book is not shown.",
+      ...records.map((r) => `- [${RECORD_LABELS[r.kind]}] ${r.text}`),
+    ];
+    return `${overview}\n\n${lines.join("\n")}\n`;
+  } catch (error) {
+    console.warn("Chat retrieval failed:", error instanceof Error ? error.message : error);
+    const sections = (["meetings", "tasks"] as const).map((s) =>
+      getSection(supabase, s, sectionVersion(s, versions))
+    );
+    return [overview, ...(await Promise.all(sections))].join("\n\n") + "\n";
+  }
+}
+
+/**
+ * Returns the Markdown client-book context for a chat turn. Sections whose
+ * source tables are unchanged come from cache; with a `conversationId` the
+ * assembled string is reused verbatim across the conversation's turns.
+ * Books larger than RETRIEVAL_MIN_RECORDS use retrieval when `retrieval` is
+ * given.
+ */
+export async function getChatClientContext(
+  supabase: ServerSupabase,
+  {
+    conversationId,
+    retrieval,
+  }: { conversationId?: string; retrieval?: ChatRetrievalOptions } = {}
+): Promise<string> {
+  const versions = await fetchTableVersions(supabase);
+  const overview = await getSection(supabase, "overview", sectionVersion("overview", versions));
+  if (retrieval && bookSize > RETRIEVAL_MIN_RECORDS) {
+    return getRetrievalContext(supabase, versions, overview, retrieval);
+  }
+
+  const sections: ContextSection[] = ["clients", "meetings", "tasks"];
+  const sectionVersions = sections.map((s) => sectionVersion(s, versions));
+  const version = sectionVersions.join("|");
+
+  const conversation = conversationId ? conversationCache.get(conversationId) : undefined;
+  if (conversation && versions && conversation.version === version) {
+    return conversation.context;
+  }
+
+  const texts = await Promise.all(
+    sections.map((s, i) => getSection(supabase, s, sectionVersions[i]))
+  );
+  const context = texts.join("\n\n") + "\n";
+
+  if (conversationId) {
+    conversationCache.delete(conversationId);
+    conversationCache.set(conversationId, { version, context });
+    while (conversationCache.size > MAX_CONVERSATIONS) {
+      conversationCache.delete(conversationCache.keys().next().value as string);
+    }
+  }
+  return context;
+}
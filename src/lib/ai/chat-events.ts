@@ -0,0 +1,38 @@
+import { encodeEvent, readEventStream } from "@/lib/utils/event-stream";
+
+// Events streamed (as Server-Sent Events) by /api/ai/chat. A response ends
+// with exactly one `done` or `error` event; `usage` precedes `done` when the
+// provider reports token counts. `fallback` announces that the answer comes
+// from a fallback model.
+
+export type ChatStreamEvent =
+  | { type: "delta"; text: string }
+  | { type: "fallback"; model: string }
+  | { type: "usage"; inputTokens: number | null; outputTokens: number | null }
+  | { type: "error"; error: string; isQuota: boolean }
+  | { type: "done" };
+
+export function encodeChatEvent(event: ChatStreamEvent): Uint8Array {
+  return encodeEvent(event);
+}
+
+/**
+ * Reads a chat event stream until it closes, calling `onEvent` for each event.
+ * Non-stream (JSON error) responses are surfaced as a single error event.
+ */
+export async function readChatEvents(
+  res: Response,
+  onEvent: (event: ChatStreamEvent) => void
+): Promise<void> {
+  if (!res.ok || !res.body) {
+    const data = await res.json().catch(() => ({}));
+    onEvent({
+      type: "error",
+      error: data.error || "Chat request failed",
+      isQuota: Boolean(data.isQuota),
+    });
+    return;
+  }
+
+  await readEventStream(res.body, onEvent);
+}
@@ -0,0 +1,99 @@
+import { estimateMessageTokens, estimateTokens } from "@/lib/utils/token-estimate";
+
+// Conversation-history compaction for chat requests. The last KEEP_TURNS
+// turns are sent verbatim; older turns are folded into a rolling summary,
+// produced in the background by /api/ai/chat/summarize, that the server
+// appends to the system prompt. Every request is also capped at
+// HISTORY_TOKEN_BUDGET (local estimate), so per-turn cost stays flat over
+// long sessions instead of growing with the whole transcript.
+
+export interface HistoryMessage {
+  role: "user" | "assistant";
+  content: string;
+}
+
+export interface HistorySummary {
+  text: string;
+  /** Number of leading conversation messages folded into `text`. */
+  coveredCount: number;
+}
+
+export const KEEP_TURNS = 6;
+// Older turns are summarized in batches, not one per turn.
+export const SUMMARIZE_BATCH_TURNS = 4;
+export const HISTORY_TOKEN_BUDGET = 6000;
+
+/**
+ * Messages (and summary) to send for the next request: everything after the
+ * summary, trimmed from the oldest end to fit `budget`. The latest message is
+ * always kept, and the window starts on a user turn.
+ */
+export function compactHistory(
+  messages: HistoryMessage[],
+  summary: HistorySummary | null,
+  budget = HISTORY_TOKEN_BUDGET
+): { messages: HistoryMessage[]; summary?: string; droppedCount: number } {
+  const pending = messages
+    .slice(summary?.coveredCount ?? 0)
+    .filter((m) => m.content)
+    .map((m) => ({ role: m.role, content: m.content }));
+
+  let used = summary ? estimateTokens(summary.text) : 0;
+  let start = pending.length;
+  while (start > 0) {
+    const cost = estimateMessageTokens(pending[start - 1]);
+    if (start < pending.length && used + cost > budget) break;
+    used += cost;
+    start--;
+  }
+  while (start < pending.length - 1 && pending[start].role !== "user") start++;
+
+  return {
+    messages: pending.slice(start),
+    summary: summary?.text,
+    droppedCount: start,
+  };
+}
+
+/**
+ * The slice of `messages` to fold into the summary next, or null while fewer
+ * than SUMMARIZE_BATCH_TURNS turns sit outside the verbatim window.
+ */
+export function nextSummaryRange(
+  messages: HistoryMessage[],
+  summary: HistorySummary | null
+): { start: number; end: number } | null {
+  const start = summary?.coveredCount ?? 0;
+  const end = messages.length - KEEP_TURNS * 2;
+  if (end - start < SUMMARIZE_BATCH_TURNS * 2) return null;
+  return { start, end };
+}
+
+export async function summarizeHistory({
+  apiKey,
+  model,
+  fallbackModels,
+  summary,
+  messages,
+}: {
+  apiKey: string;
+  model: string;
+  fallbackModels?: string[];
+  summary: string | undefined;
+  messages: HistoryMessage[];
+}): Promise<string> {
+  const res = await fetch("/api/ai/chat/summarize", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({
+      apiKey,
+      model,
+      fallbackModels,
+      summary,
+      messages: messages.filter((m) => m.content),
+    }),
+  });
+  const data = await res.json().catch(() => ({}));
+  if (!res.ok) throw new Error(data.error || "Summarization failed");
+  return data.data.summary;
+}
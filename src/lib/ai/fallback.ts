@@ -0,0 +1,138 @@
+import { detectProvider, isFallbackError, parseAIError } from "@/lib/ai/provider";
+import type { AITask } from "@/lib/ai/models";
+
+// Model fallback chains with optional hedging. A call runs on the selected
+// model; if that fails on quota or availability the next model in the task's
+// chain is tried. With hedging, a call that has been running longer than the
+// model's observed p95 latency for the task also starts the next model in
+// parallel; whichever succeeds first wins and the other is aborted.
+
+export interface FallbackOptions {
+  model: string;
+  /** Models to try after `model`, in order (the user's chain for the task). */
+  fallbackModels?: string[];
+}
+
+export interface FallbackResult<T> {
+  value: T;
+  model: string;
+}
+
+type Attempt<T> = (model: string, signal: AbortSignal, isLast: boolean) => Promise<T>;
+
+const LATENCY_SAMPLES = 50;
+// Hedging needs enough history for a meaningful p95.
+const HEDGE_MIN_SAMPLES = 10;
+
+const latencies = new Map<string, number[]>();
+
+function recordLatency(task: AITask, model: string, ms: number) {
+  const key = `${task}:${model}`;
+  const samples = latencies.get(key) ?? [];
+  samples.push(ms);
+  if (samples.length > LATENCY_SAMPLES) samples.shift();
+  latencies.set(key, samples);
+}
+
+function hedgeDelay(task: AITask, model: string): number | null {
+  const samples = latencies.get(`${task}:${model}`);
+  if (!samples || samples.length < HEDGE_MIN_SAMPLES) return null;
+  const sorted = [...samples].sort((a, b) => a - b);
+  return sorted[Math.floor(sorted.length * 0.95)];
+}
+
+/** The selected model followed by its fallbacks from the same provider. */
+export function fallbackChain(model: string, fallbackModels: string[] = []): string[] {
+  const provider = detectProvider(model);
+  const chain = [model];
+  for (const m of fallbackModels) {
+    if (typeof m === "string" && detectProvider(m) === provider && !chain.includes(m)) {
+      chain.push(m);
+    }
+  }
+  return chain;
+}
+
+/**
+ * Runs `attempt` down the fallback chain until one model succeeds. Errors
+ * that another model would not fix (invalid key, bad input) are thrown
+ * straight away; otherwise the last model's error is thrown.
+ */
+export function runWithFallback<T>(
+  task: AITask,
+  { model, fallbackModels }: FallbackOptions,
+  attempt: Attempt<T>,
+  { hedge = false }: { hedge?: boolean } = {}
+): Promise<FallbackResult<T>> {
+  const chain = fallbackChain(model, fallbackModels);
+  const controllers: AbortController[] = [];
+  let next = 0;
+  let running = 0;
+  let settled = false;
+  let hedgeTimer: ReturnType<typeof setTimeout> | null = null;
+
+  return new Promise((resolve, reject) => {
+    const clearHedge = () => {
+      if (hedgeTimer) clearTimeout(hedgeTimer);
+      hedgeTimer = null;
+    };
+
+    const finish = (winner: AbortController | null) => {
+      settled = true;
+      clearHedge();
+      for (const c of controllers) if (c !== winner) c.abort();
+    };
+
+    const launch = (): boolean => {
+      if (settled || next >= chain.length) return false;
+      const index = next++;
+      const current = chain[index];
+      const controller = new AbortController();
+      controllers.push(controller);
+      const startedAt = Date.now();
+      running++;
+
+      // Only the first model is hedged, and only once it has a latency profile.
+      const delay = hedge && index === 0 && chain.length > 1 ? hedgeDelay(task, current) : null;
+      if (delay !== null) {
+        hedgeTimer = setTimeout(() => {
+          hedgeTimer = null;
+          // Only while the first model is the sole attempt in flight.
+          if (next !== 1 || running !== 1) return;
+          if (launch()) console.info(`Hedging ${task} on ${chain[1]} after ${delay}ms`);
+        }, delay);
+      }
+
+      attempt(current, controller.signal, index === chain.length - 1).then(
+        (value) => {
+          running--;
+          if (settled) return;
+          recordLatency(task, current, Date.now() - startedAt);
+          finish(controller);
+          if (index > 0) console.info(`${task} served by fallback model ${current}`);
+          resolve({ value, model: current });
+        },
+        (error) => {
+          running--;
+          if (settled) return;
+          // The first model failed, so there is nothing left to hedge.
+          if (index === 0) clearHedge();
+          if (isFallbackError(error)) {
+            console.warn(`${task} failed on ${current}:`, parseAIError(error).message);
+            // A hedged attempt still in flight is the fallback; when it fails
+            // it moves on down the chain itself.
+            if (running > 0) return;
+            if (launch()) return;
+          }
+          // Let a hedged attempt that is still running finish.
+          if (running > 0) return;
+          finish(null);
+          reject(error);
+        }
+      );
+      return true;
+    };
+
+    launch();
+  });
+}
@@ -0,0 +1,227 @@
+import { createAIProvider } from "@/lib/ai/provider";
+import {
+  COMPLIANCE_SENTINEL_PROMPT,
+  getMeetingProcessorPrompt,
+} from "@/lib/ai/prompts";
+import {
+  ComplianceFlagSchema,
+  MeetingOutputSchema,
+  MeetingOutputStreamSchema,
+} from "@/lib/ai/schemas";
+import type { ComplianceFlagType, MeetingOutputType } from "@/lib/ai/schemas";
+import type { AICacheKeyParts } from "@/lib/ai/result-cache";
+import { runWithFallback } from "@/lib/ai/fallback";
+import type { FallbackResult } from "@/lib/ai/fallback";
+import { RATE_LIMIT_RETRIES, scheduleAICall } from "@/lib/ai/scheduler";
+import type { AIPriority } from "@/lib/ai/scheduler";
+import { generateObject, streamObject } from "ai";
+import { z } from "zod";
+
+// Server-side AI calls shared by the standalone routes and the meeting job
+// pipeline. Calls go through the per-key scheduler (batch priority unless the
+// input says otherwise) and fall back along `fallbackModels` on quota or
+// availability errors; the blocking calls are also hedged. Errors are thrown
+// as-is; callers map them with parseAIError().
+
+export interface MeetingAnalysisInput {
+  apiKey: string;
+  model?: string;
+  transcript: string;
+  clientName?: string;
+  riskTolerance?: string;
+  aumValue?: number;
+  priority?: AIPriority;
+  fallbackModels?: string[];
+}
+
+export interface ComplianceReviewInput {
+  apiKey: string;
+  model?: string;
+  emailDraft: string;
+  riskTolerance?: string;
+  priority?: AIPriority;
+  fallbackModels?: string[];
+}
+
+function fallbackOptions(input: { model?: string; fallbackModels?: string[] }) {
+  return { model: input.model || "gemini-2.0-flash", fallbackModels: input.fallbackModels };
+}
+
+// Rate-limit retries are left to the last model; earlier ones fall through
+// to the next model instead of waiting out the cooldown.
+function scheduleOptions(priority: AIPriority | undefined, model: string, isLast: boolean) {
+  return { priority, model, retries: isLast ? RATE_LIMIT_RETRIES : 0 };
+}
+
+function meetingAnalysisPrompt({
+  transcript,
+  clientName,
+  riskTolerance,
+  aumValue,
+}: MeetingAnalysisInput) {
+  return {
+    system: getMeetingProcessorPrompt(
+      clientName || "Client",
+      riskTolerance || "Balanced",
+      aumValue || 0
+    ),
+    prompt: `Process this meeting transcript:\n\n${transcript}`,
+  };
+}
+
+function meetingAnalysisRequest(input: MeetingAnalysisInput) {
+  return {
+    model: createAIProvider(input.apiKey, input.model || "gemini-2.0-flash"),
+    ...meetingAnalysisPrompt(input),
+  };
+}
+
+function compliancePrompt({ emailDraft, riskTolerance }: ComplianceReviewInput) {
+  return {
+    system: COMPLIANCE_SENTINEL_PROMPT,
+    prompt: `Client risk tolerance: ${riskTolerance || "Balanced"}\n\nReview this email draft for compliance issues:\n\n${emailDraft}`,
+  };
+}
+
+const schemaFingerprints = new Map<z.ZodType, string>();
+
+function schemaFingerprint(schema: z.ZodType): string {
+  let fingerprint = schemaFingerprints.get(schema);
+  if (!fingerprint) {
+    fingerprint = JSON.stringify(z.toJSONSchema(schema));
+    schemaFingerprints.set(schema, fingerprint);
+  }
+  return fingerprint;
+}
+
+// Streamed and blocking analyses produce the same object, so they share
+// cache entries (keyed on MeetingOutputSchema).
+export function meetingAnalysisCacheKey(input: MeetingAnalysisInput): AICacheKeyParts {
+  return {
+    task: "meeting-analysis",
+    model: input.model || "gemini-2.0-flash",
+    ...meetingAnalysisPrompt(input),
+    schema: schemaFingerprint(MeetingOutputSchema),
+  };
+}
+
+export function complianceCacheKey(input: ComplianceReviewInput): AICacheKeyParts {
+  return {
+    task: "compliance-review",
+    model: input.model || "gemini-2.0-flash",
+    ...compliancePrompt(input),
+    schema: schemaFingerprint(ComplianceFlagSchema),
+  };
+}
+
+/** The analysis and the model that produced it (a fallback, if one served). */
+export async function analyzeMeeting(
+  input: MeetingAnalysisInput
+): Promise<FallbackResult<MeetingOutputType>> {
+  const { value, model } = await runWithFallback(
+    "processing",
+    fallbackOptions(input),
+    (model, signal, isLast) =>
+      scheduleAICall(
+        input.apiKey,
+        () =>
+          generateObject({
+            ...meetingAnalysisRequest({ ...input, model }),
+            schema: MeetingOutputSchema,
+            abortSignal: signal,
+          }),
+        scheduleOptions(input.priority, model, isLast)
+      ),
+    { hedge: true }
+  );
+  return { value: value.object, model };
+}
+
+/**
+ * Starts a streamed analysis. Fields arrive in MeetingOutputStreamSchema
+ * order, i.e. the email draft first. Not scheduled by itself: callers hold a
+ * scheduler slot for the lifetime of the stream.
+ */
+export function startMeetingAnalysisStream(
+  input: MeetingAnalysisInput,
+  onError?: (error: unknown) => void,
+  onFinish?: () => void,
+  abortSignal?: AbortSignal
+) {
+  return streamObject({
+    ...meetingAnalysisRequest(input),
+    schema: MeetingOutputStreamSchema,
+    abortSignal,
+    onError: ({ error }) => onError?.(error),
+    onFinish: () => onFinish?.(),
+  });
+}
+
+/**
+ * Runs a streamed analysis to completion. The email draft is handed to
+ * `onEmailDraft` as soon as it is final, so callers can start the compliance
+ * scan while summary, topics and tasks are still being generated.
+ */
+export async function streamMeetingAnalysis(
+  input: MeetingAnalysisInput,
+  onEmailDraft: (draft: string) => void
+): Promise<FallbackResult<MeetingOutputType>> {
+  // Not hedged: two concurrent streams would both report an email draft.
+  return runWithFallback(
+    "processing",
+    fallbackOptions(input),
+    (model, _signal, isLast) =>
+      scheduleAICall(
+        input.apiKey,
+        () => runMeetingAnalysisStream({ ...input, model }, onEmailDraft),
+        scheduleOptions(input.priority, model, isLast)
+      )
+  );
+}
+
+async function runMeetingAnalysisStream(
+  input: MeetingAnalysisInput,
+  onEmailDraft: (draft: string) => void
+): Promise<MeetingOutputType> {
+  let streamError: unknown;
+  let draftSent = false;
+  const result = startMeetingAnalysisStream(input, (error) => {
+    streamError = error;
+  });
+
+  for await (const partial of result.partialObjectStream) {
+    // A later field has started, so the draft will not change any more.
+    if (!draftSent && partial.summary !== undefined && partial.email_draft) {
+      draftSent = true;
+      onEmailDraft(partial.email_draft);
+    }
+  }
+  if (streamError) throw streamError;
+
+  const object = await result.object;
+  if (!draftSent) onEmailDraft(object.email_draft);
+  return object;
+}
+
+export async function reviewCompliance(
+  input: ComplianceReviewInput
+): Promise<FallbackResult<ComplianceFlagType>> {
+  const { value, model } = await runWithFallback(
+    "compliance",
+    fallbackOptions(input),
+    (model, signal, isLast) =>
+      scheduleAICall(
+        input.apiKey,
+        () =>
+          generateObject({
+            model: createAIProvider(input.apiKey, model),
+            schema: ComplianceFlagSchema,
+            ...compliancePrompt(input),
+            abortSignal: signal,
+          }),
+        scheduleOptions(input.priority, model, isLast)
+      ),
+    { hedge: true }
+  );
+  return { value: value.object, model };
+}
@@ -1,7 +1,10 @@
+import { MODEL_CATALOGUE_STORAGE_KEY } from "@/lib/constants";
+
 export interface AIModel {
   id: string;
   name: string;
   provider: "google" | "openai";
+  requiresBilling: boolean;
 }
 
 // Models known to have free tier quota on Google AI Studio
@@ -15,6 +18,24 @@ const GOOGLE_FREE_TIER_MODELS = new Set([
   "gemini-2.0-flash-thinking-exp",
 ]);
 
+const collator = new Intl.Collator();
+
+// Sorts by precomputed [rank, name] keys instead of re-deriving them in the
+// comparator on every comparison.
+function sortModels(models: AIModel[], rank: (m: AIModel) => number): AIModel[] {
+  return models
+    .map((m) => ({ m, rank: rank(m) }))
+    .sort((a, b) => a.rank - b.rank || collator.compare(a.m.name, b.m.name))
+    .map(({ m }) => m);
+}
+
+// gemini-2.5-flash first, then the rest of 2.5, then free-tier, then alphabetical
+function googleRank(m: AIModel): number {
+  if (m.id === "gemini-2.5-flash") return 0;
+  if (m.id.startsWith("gemini-2.5")) return 1;
+  return m.requiresBilling ? 3 : 2;
+}
+
 export async function fetchGoogleModels(apiKey: string): Promise<AIModel[]> {
   const res = await fetch(
     `https://generativelanguage.googleapis.com/v1beta/models?key=${apiKey}`
@@ -47,24 +68,11 @@ export async function fetchGoogleModels(apiKey: string): Promise<AIModel[]> {
       id,
       name: (m.displayName || id) + (isFree ? "" : " (may require billing)"),
       provider: "google",
+      requiresBilling: !isFree,
     });
   }
 
-  // Sort: gemini-2.5-flash first, then free-tier, then alphabetical
-  models.sort((a, b) => {
-    const aIs25Flash = a.id === "gemini-2.5-flash";
-    const bIs25Flash = b.id === "gemini-2.5-flash";
-    if (aIs25Flash !== bIs25Flash) return aIs25Flash ? -1 : 1;
-    const aIs25 = a.id.startsWith("gemini-2.5");
-    const bIs25 = b.id.startsWith("gemini-2.5");
-    if (aIs25 !== bIs25) return aIs25 ? -1 : 1;
-    const aFree = !a.name.includes("may require billing");
-    const bFree = !b.name.includes("may require billing");
-    if (aFree !== bFree) return aFree ? -1 : 1;
-    return a.name.localeCompare(b.name);
-  });
-
-  return models;
+  return sortModels(models, googleRank);
 }
 
 export async function fetchOpenAIModels(apiKey: string): Promise<AIModel[]> {
@@ -87,22 +95,138 @@ export async function fetchOpenAIModels(apiKey: string): Promise<AIModel[]> {
       id,
       name: id,
       provider: "openai",
+      requiresBilling: false,
     });
   }
 
-  models.sort((a, b) => a.name.localeCompare(b.name));
-  return models;
+  return sortModels(models, () => 0);
+}
+
+// Model catalogue cache. The sorted list is kept in localStorage per provider
+// and key fingerprint (a SHA-256 prefix, never the key itself). Entries
+// younger than CATALOGUE_FRESH_MS are used as-is; older ones are shown
+// immediately and revalidated in the background, up to CATALOGUE_MAX_AGE_MS.
+const CATALOGUE_VERSION = 1;
+const CATALOGUE_FRESH_MS = 60 * 60 * 1000;
+const CATALOGUE_MAX_AGE_MS = 7 * 24 * 60 * 60 * 1000;
+
+interface CatalogueEntry {
+  version: number;
+  fetchedAt: number;
+  models: AIModel[];
+}
+
+export interface CachedModels {
+  models: AIModel[];
+  /** Past the fresh window; the caller should revalidate. */
+  stale: boolean;
+}
+
+async function catalogueKey(provider: "google" | "openai", apiKey: string): Promise<string | null> {
+  if (typeof window === "undefined" || !window.crypto?.subtle) return null;
+  const digest = await crypto.subtle.digest("SHA-256", new TextEncoder().encode(apiKey));
+  const fingerprint = Array.from(new Uint8Array(digest).slice(0, 8))
+    .map((b) => b.toString(16).padStart(2, "0"))
+    .join("");
+  return `${MODEL_CATALOGUE_STORAGE_KEY}:${provider}:${fingerprint}`;
+}
+
+function readCatalogue(key: string): CatalogueEntry | null {
+  try {
+    const entry = JSON.parse(localStorage.getItem(key) || "null") as CatalogueEntry | null;
+    if (!entry || entry.version !== CATALOGUE_VERSION) return null;
+    if (Date.now() - entry.fetchedAt > CATALOGUE_MAX_AGE_MS) return null;
+    return entry;
+  } catch {
+    return null;
+  }
+}
+
+function writeCatalogue(key: string, models: AIModel[]) {
+  try {
+    // Drop expired entries, e.g. from keys that have since been replaced.
+    for (let i = localStorage.length - 1; i >= 0; i--) {
+      const k = localStorage.key(i);
+      if (k?.startsWith(`${MODEL_CATALOGUE_STORAGE_KEY}:`) && k !== key && !readCatalogue(k)) {
+        localStorage.removeItem(k);
+      }
+    }
+    const entry: CatalogueEntry = { version: CATALOGUE_VERSION, fetchedAt: Date.now(), models };
+    localStorage.setItem(key, JSON.stringify(entry));
+  } catch {
+    // Storage full or unavailable; the catalogue is refetched next time.
+  }
+}
+
+/** The cached catalogue for this provider and key, or null if there is none. */
+export async function getCachedModels(
+  provider: "google" | "openai",
+  apiKey: string
+): Promise<CachedModels | null> {
+  const key = await catalogueKey(provider, apiKey);
+  const entry = key ? readCatalogue(key) : null;
+  if (!entry) return null;
+  return { models: entry.models, stale: Date.now() - entry.fetchedAt > CATALOGUE_FRESH_MS };
 }
 
+const inflight = new Map<string, Promise<AIModel[]>>();
+
+/** Fetches the catalogue from the provider and refreshes the cache. */
 export async function fetchModels(
   provider: "google" | "openai",
   apiKey: string
 ): Promise<AIModel[]> {
-  if (provider === "google") return fetchGoogleModels(apiKey);
-  return fetchOpenAIModels(apiKey);
+  const key = await catalogueKey(provider, apiKey);
+  const pending = key ? inflight.get(key) : undefined;
+  if (pending) return pending;
+
+  const request = (provider === "google" ? fetchGoogleModels(apiKey) : fetchOpenAIModels(apiKey))
+    .then((models) => {
+      if (key) writeCatalogue(key, models);
+      return models;
+    })
+    .finally(() => {
+      if (key) inflight.delete(key);
+    });
+  if (key) inflight.set(key, request);
+  return request;
 }
 
 export const DEFAULT_MODELS: Record<string, string> = {
   google: "gemini-2.5-flash",
   openai: "gpt-4o",
 };
+
+// Tasks with their own fallback chain. Each chain lists the models tried, in
+// order, after the selected model fails on quota or availability.
+export type AITask = "transcription" | "processing" | "compliance" | "chat";
+export type FallbackChains = Record<AITask, string[]>;
+
+export const AI_TASKS: { id: AITask; label: string }[] = [
+  { id: "transcription", label: "Transcription" },
+  { id: "processing", label: "Meeting processing" },
+  { id: "compliance", label: "Compliance review" },
+  { id: "chat", label: "Chat" },
+];
+
+const FALLBACK_CHAIN_LENGTH = 2;
+
+/**
+ * Default chains from a ranked model list (fetchModels order): the first
+ * models other than the selected one that do not require billing.
+ */
+export function recommendFallbackChains(
+  models: AIModel[],
+  selectedModel: string
+): FallbackChains {
+  const chain = models
+    .filter((m) => m.id !== selectedModel && !m.requiresBilling)
+    .slice(0, FALLBACK_CHAIN_LENGTH)
+    .map((m) => m.id);
+  return {
+    transcription: [...chain],
+    processing: [...chain],
+    compliance: [...chain],
+    chat: [...chain],
+  };
+}
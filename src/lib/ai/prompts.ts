@@ -61,7 +61,23 @@ export const TRANSCRIPTION_PROMPT = `You are a professional transcription assist
 - Do NOT summarize — provide the full verbatim transcript
 - Do NOT add commentary or analysis — only the transcript text`;
 
-export function getChatSystemPrompt(clientContext: string): string {
+export function getSegmentTranscriptionPrompt(
+  index: number,
+  total: number
+): string {
+  return `${TRANSCRIPTION_PROMPT}
+
+## Segment
+This audio is part ${index + 1} of ${total} of a longer recording, cut at a fixed time rather than at a pause. It may start or end mid-sentence — transcribe exactly what is audible without completing cut-off words or adding a closing remark.`;
+}
+
+export function getChatSystemPrompt(
+  clientContext: string,
+  historySummary?: string
+): string {
+  const history = historySummary
+    ? `\n\n## Earlier in This Conversation\nOlder messages were condensed into this summary:\n${historySummary}`
+    : "";
   return `You are an AI assistant for a financial advisor at a wealth management firm. You have access to the advisor's client book and meeting history.
 
 ## Your Role
@@ -79,5 +95,15 @@ ${clientContext}
 - If asked about something not in your data, say so clearly
 - Never fabricate client information
 - Keep responses professional and concise
-- Use tables and lists for structured data when appropriate`;
+- Use tables and lists for structured data when appropriate${history}`;
 }
+
+export const CHAT_HISTORY_SUMMARY_PROMPT = `You maintain a running summary of a conversation between a financial advisor and their AI assistant. It replaces older messages in the assistant's context, so it must preserve everything needed to continue the conversation.
+
+## Instructions
+- Merge the existing summary (if any) with the new messages into one updated summary
+- Keep client names, figures, dates, decisions, open questions and anything the advisor asked to remember
+- Note which client or topic the conversation is currently focused on
+- Drop pleasantries and repeated information
+- Write compact bullet points, at most 250 words
+- Output only the summary`;
@@ -1,5 +1,8 @@
+import { createHash } from "crypto";
 import { createOpenAI } from "@ai-sdk/openai";
+import type { OpenAIProvider } from "@ai-sdk/openai";
 import { createGoogleGenerativeAI } from "@ai-sdk/google";
+import type { GoogleGenerativeAIProvider } from "@ai-sdk/google";
 
 export type AIProviderType = "openai" | "google";
 
@@ -8,22 +11,79 @@ export function detectProvider(model: string): AIProviderType {
   return "openai";
 }
 
+// Provider instances are pooled per (provider, API key) so back-to-back calls
+// (e.g. the pipeline's analysis and compliance steps) reuse one client and
+// its warm keep-alive connections from the runtime's shared fetch dispatcher.
+// Keys are hashed before use as pool keys; idle entries are evicted and the
+// pool is bounded, least recently used first.
+const PROVIDER_POOL_MAX = 64;
+const PROVIDER_IDLE_MS = 10 * 60 * 1000;
+
+type PooledProvider = GoogleGenerativeAIProvider | OpenAIProvider;
+
+const providerPool = new Map<string, { provider: PooledProvider; lastUsed: number }>();
+
+function getPooledProvider<T extends PooledProvider>(
+  providerType: AIProviderType,
+  apiKey: string,
+  create: () => T
+): T {
+  const now = Date.now();
+  // Map order is recency order, so idle entries are at the front.
+  for (const [key, entry] of providerPool) {
+    if (now - entry.lastUsed < PROVIDER_IDLE_MS) break;
+    providerPool.delete(key);
+  }
+
+  const key = createHash("sha256").update(`${providerType}:${apiKey}`).digest("hex");
+  const entry = providerPool.get(key);
+  providerPool.delete(key);
+  const provider = (entry?.provider as T | undefined) ?? create();
+  providerPool.set(key, { provider, lastUsed: now });
+  while (providerPool.size > PROVIDER_POOL_MAX) {
+    providerPool.delete(providerPool.keys().next().value as string);
+  }
+  return provider;
+}
+
+function googleProvider(apiKey: string) {
+  return getPooledProvider("google", apiKey, () => createGoogleGenerativeAI({ apiKey }));
+}
+
+function openaiProvider(apiKey: string) {
+  return getPooledProvider("openai", apiKey, () => createOpenAI({ apiKey }));
+}
+
 export function createAIProvider(apiKey: string, model: string) {
   const providerType = detectProvider(model);
 
   if (providerType === "google") {
-    const google = createGoogleGenerativeAI({ apiKey });
-    return google(model);
+    return googleProvider(apiKey)(model);
   }
 
-  const openai = createOpenAI({ apiKey });
-  return openai(model);
+  return openaiProvider(apiKey)(model);
 }
 
-export function parseAIError(error: unknown): { message: string; isQuota: boolean } {
-  const raw = error instanceof Error ? error.message : String(error);
-  const lower = raw.toLowerCase();
+// Embedding model used with each provider's key (chat retrieval index).
+export const EMBEDDING_MODELS: Record<AIProviderType, string> = {
+  google: "gemini-embedding-001",
+  openai: "text-embedding-3-small",
+};
+
+/** Embedding model from the same provider as the selected chat model. */
+export function createEmbeddingProvider(apiKey: string, model: string) {
+  const providerType = detectProvider(model);
+
+  if (providerType === "google") {
+    return googleProvider(apiKey).embeddingModel(EMBEDDING_MODELS.google);
+  }
 
+  return openaiProvider(apiKey).embeddingModel(EMBEDDING_MODELS.openai);
+}
+
+type AIErrorKind = "quota" | "auth" | "model" | "other";
+
+function classifyAIError(lower: string): AIErrorKind {
   if (
     lower.includes("insufficient_quota") ||
     lower.includes("exceeded your current quota") ||
@@ -32,26 +92,68 @@ export function parseAIError(error: unknown): { message: string; isQuota: boolea
     lower.includes("rate_limit") ||
     lower.includes("429")
   ) {
-    return {
-      message:
-        "Quota exceeded for this model. Try a different model (e.g. gemini-2.0-flash) or wait a minute and retry.",
-      isQuota: true,
-    };
+    return "quota";
   }
-
   if (lower.includes("invalid api key") || lower.includes("invalid_api_key") || lower.includes("api_key_invalid")) {
-    return {
-      message: "Invalid API key. Please check your key in Settings.",
-      isQuota: false,
-    };
+    return "auth";
   }
-
   if (lower.includes("model_not_found") || lower.includes("not found")) {
-    return {
-      message: "The selected model is not available. Try a different model.",
-      isQuota: false,
-    };
+    return "model";
   }
+  return "other";
+}
+
+function rawErrorMessage(error: unknown): string {
+  return error instanceof Error ? error.message : String(error);
+}
+
+export function parseAIError(error: unknown): { message: string; isQuota: boolean } {
+  const raw = rawErrorMessage(error);
+
+  switch (classifyAIError(raw.toLowerCase())) {
+    case "quota":
+      return {
+        message:
+          "Quota exceeded for this model. Try a different model (e.g. gemini-2.0-flash) or wait a minute and retry.",
+        isQuota: true,
+      };
+    case "auth":
+      return {
+        message: "Invalid API key. Please check your key in Settings.",
+        isQuota: false,
+      };
+    case "model":
+      return {
+        message: "The selected model is not available. Try a different model.",
+        isQuota: false,
+      };
+    default:
+      return { message: raw || "An unexpected AI error occurred.", isQuota: false };
+  }
+}
+
+/**
+ * Whether retrying the same call could succeed. Quota, invalid-key and
+ * unknown-model errors fail the same way every time.
+ */
+export function isRetryableAIError(error: unknown): boolean {
+  return classifyAIError(rawErrorMessage(error).toLowerCase()) === "other";
+}
+
+/**
+ * Whether the provider throttled the call (429 / RESOURCE_EXHAUSTED) and it
+ * may succeed after backing off. Exhausted billing quota is not transient.
+ */
+export function isRateLimitError(error: unknown): boolean {
+  const lower = rawErrorMessage(error).toLowerCase();
+  return classifyAIError(lower) === "quota" && !lower.includes("insufficient_quota");
+}
 
-  return { message: raw || "An unexpected AI error occurred.", isQuota: false };
+/**
+ * Whether another model could succeed where this one failed: the model is
+ * throttled, out of quota or unavailable for this key.
+ */
+export function isFallbackError(error: unknown): boolean {
+  const kind = classifyAIError(rawErrorMessage(error).toLowerCase());
+  return kind === "quota" || kind === "model";
 }
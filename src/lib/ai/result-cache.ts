@@ -0,0 +1,170 @@
+import { createHash } from "crypto";
+import type { createServerSupabaseClient } from "@/lib/supabase/server";
+
+// Content-addressed cache for structured AI results. The key is a hash of
+// everything that determines the output: task, model, the full system and
+// user prompts (which already embed the redacted input and the client's risk
+// context) and the output schema. Editing a prompt or schema therefore
+// changes every key — no manual version bumps needed. API keys are never
+// part of the key.
+//
+// Lookups go through an in-process LRU first, then the optional Postgres
+// table (`ai_result_cache`). Identical concurrent requests share one call.
+
+type ServerSupabase = Awaited<ReturnType<typeof createServerSupabaseClient>>;
+
+// Bump to invalidate every entry after a change to how values are stored.
+const CACHE_FORMAT_VERSION = 1;
+const DEFAULT_TTL_MS = 24 * 60 * 60 * 1000;
+const MEMORY_MAX_ENTRIES = 500;
+
+export type AICacheLayer = "memory" | "postgres";
+
+export interface AICacheBackend {
+  readonly layer: AICacheLayer;
+  get(key: string): Promise<unknown | undefined>;
+  set(key: string, task: string, value: unknown, ttlMs: number): Promise<void>;
+}
+
+export interface AICacheKeyParts {
+  task: string;
+  model: string;
+  system: string;
+  prompt: string;
+  /** Serialized output schema (see schemaFingerprint). */
+  schema: string;
+}
+
+/** A computed value and the model that actually produced it. */
+export interface AIComputedResult<T> {
+  value: T;
+  model: string;
+}
+
+export interface AICacheResult<T> {
+  value: T;
+  status: "hit" | "miss";
+  layer: AICacheLayer | null;
+}
+
+export function aiCacheKey({ task, model, system, prompt, schema }: AICacheKeyParts): string {
+  return createHash("sha256")
+    .update(JSON.stringify([CACHE_FORMAT_VERSION, task, model, system, prompt, schema]))
+    .digest("hex");
+}
+
+/** In-process LRU with per-entry expiry; Map order doubles as recency order. */
+export function createMemoryCache(maxEntries = MEMORY_MAX_ENTRIES): AICacheBackend {
+  const entries = new Map<string, { value: unknown; expiresAt: number }>();
+
+  return {
+    layer: "memory",
+    async get(key) {
+      const entry = entries.get(key);
+      if (!entry) return undefined;
+      if (entry.expiresAt <= Date.now()) {
+        entries.delete(key);
+        return undefined;
+      }
+      entries.delete(key);
+      entries.set(key, entry);
+      return entry.value;
+    },
+    async set(key, _task, value, ttlMs) {
+      entries.delete(key);
+      entries.set(key, { value, expiresAt: Date.now() + ttlMs });
+      while (entries.size > maxEntries) {
+        entries.delete(entries.keys().next().value as string);
+      }
+    },
+  };
+}
+
+/**
+ * Shared cache in the `ai_result_cache` table. Errors (e.g. the migration has
+ * not been applied) are logged and treated as misses.
+ */
+export function createPostgresCache(supabase: ServerSupabase): AICacheBackend {
+  return {
+    layer: "postgres",
+    async get(key) {
+      const { data, error } = await supabase
+        .from("ai_result_cache")
+        .select("value, expires_at")
+        .eq("key", key)
+        .maybeSingle();
+      if (error) {
+        console.warn("AI cache read failed:", error.message);
+        return undefined;
+      }
+      if (!data || new Date(data.expires_at).getTime() <= Date.now()) return undefined;
+      return data.value;
+    },
+    async set(key, task, value, ttlMs) {
+      const { error } = await supabase.from("ai_result_cache").upsert({
+        key,
+        task,
+        value,
+        expires_at: new Date(Date.now() + ttlMs).toISOString(),
+      });
+      if (error) console.warn("AI cache write failed:", error.message);
+    },
+  };
+}
+
+const memoryCache = createMemoryCache();
+const inFlight = new Map<string, Promise<AICacheResult<unknown>>>();
+
+/**
+ * Returns the cached value for `parts`, or runs `compute` and stores its
+ * result in every backend. The result is stored under the model that
+ * produced it, so an answer from a fallback model is never served as the
+ * requested model's. Failed computations are not cached.
+ */
+export async function cachedAIResult<T>(
+  parts: AICacheKeyParts,
+  compute: () => Promise<AIComputedResult<T>>,
+  {
+    supabase,
+    ttlMs = DEFAULT_TTL_MS,
+  }: { supabase?: ServerSupabase; ttlMs?: number } = {}
+): Promise<AICacheResult<T>> {
+  const key = aiCacheKey(parts);
+  const pending = inFlight.get(key);
+  if (pending) return pending as Promise<AICacheResult<T>>;
+
+  const backends: AICacheBackend[] = supabase
+    ? [memoryCache, createPostgresCache(supabase)]
+    : [memoryCache];
+
+  const lookup = (async (): Promise<AICacheResult<T>> => {
+    for (let i = 0; i < backends.length; i++) {
+      const cached = await backends[i].get(key);
+      if (cached !== undefined) {
+        // Promote to the faster layers
+        await Promise.all(
+          backends.slice(0, i).map((b) => b.set(key, parts.task, cached, ttlMs))
+        );
+        return { value: cached as T, status: "hit", layer: backends[i].layer };
+      }
+    }
+    const { value, model } = await compute();
+    const storeKey = model === parts.model ? key : aiCacheKey({ ...parts, model });
+    await Promise.all(backends.map((b) => b.set(storeKey, parts.task, value, ttlMs)));
+    return { value, status: "miss", layer: null };
+  })();
+
+  inFlight.set(key, lookup);
+  try {
+    return await lookup;
+  } finally {
+    inFlight.delete(key);
+  }
+}
+
+export function aiCacheHeaders(result: AICacheResult<unknown>): Record<string, string> {
+  return {
+    "X-AI-Cache": result.status === "hit" ? "HIT" : "MISS",
+    ...(result.layer && { "X-AI-Cache-Layer": result.layer }),
+  };
+}
@@ -0,0 +1,236 @@
+import { createHash } from "crypto";
+import { isRateLimitError } from "@/lib/ai/provider";
+
+// Per-key scheduler in front of every LLM call. Each API key gets a
+// concurrency window sized by AIMD: +1 slot per window of successful calls,
+// halved on a rate-limit error (429 / RESOURCE_EXHAUSTED), followed by an
+// exponential cooldown during which nothing new starts for that key. Waiting
+// calls are queued by priority so interactive chat overtakes batch work, and
+// rate-limited calls are retried transparently.
+//
+// Provider limits are per key (and per model) but not discoverable up front,
+// so the window is learned from 429s rather than configured. Passing `model`
+// gives that model its own window. State is per server instance.
+
+export type AIPriority = "interactive" | "batch";
+export type AICallOutcome = "ok" | "rate_limited" | "error";
+
+const INITIAL_LIMIT = 4;
+const MIN_LIMIT = 1;
+const MAX_LIMIT = 16;
+const COOLDOWN_BASE_MS = 1000;
+const COOLDOWN_MAX_MS = 30_000;
+// Batch calls waiting longer than this are served before new interactive ones.
+const BATCH_MAX_WAIT_MS = 15_000;
+export const RATE_LIMIT_RETRIES = 3;
+const KEY_IDLE_MS = 10 * 60 * 1000;
+const WAIT_SAMPLES = 200;
+
+interface Waiter {
+  enqueuedAt: number;
+  resolve: () => void;
+}
+
+interface KeyState {
+  id: string;
+  limit: number;
+  inFlight: number;
+  queues: Record<AIPriority, Waiter[]>;
+  cooldownUntil: number;
+  timer: ReturnType<typeof setTimeout> | null;
+  consecutiveRateLimits: number;
+  completed: number;
+  rateLimited: number;
+  lastUsed: number;
+}
+
+const keys = new Map<string, KeyState>();
+const waitSamples: Record<AIPriority, number[]> = { interactive: [], batch: [] };
+
+function keyState(apiKey: string, model: string | undefined): KeyState {
+  const now = Date.now();
+  for (const [key, state] of keys) {
+    const idle = state.inFlight === 0 && !state.queues.interactive.length && !state.queues.batch.length;
+    if (idle && now - state.lastUsed > KEY_IDLE_MS) keys.delete(key);
+  }
+
+  const hash = createHash("sha256").update(`${apiKey}\0${model ?? ""}`).digest("hex");
+  let state = keys.get(hash);
+  if (!state) {
+    state = {
+      id: hash.slice(0, 8),
+      limit: INITIAL_LIMIT,
+      inFlight: 0,
+      queues: { interactive: [], batch: [] },
+      cooldownUntil: 0,
+      timer: null,
+      consecutiveRateLimits: 0,
+      completed: 0,
+      rateLimited: 0,
+      lastUsed: now,
+    };
+    keys.set(hash, state);
+  }
+  state.lastUsed = now;
+  return state;
+}
+
+function recordWait(priority: AIPriority, ms: number) {
+  const samples = waitSamples[priority];
+  samples.push(ms);
+  if (samples.length > WAIT_SAMPLES) samples.shift();
+}
+
+function nextWaiter(state: KeyState): [AIPriority, Waiter] | null {
+  const { interactive, batch } = state.queues;
+  if (batch.length && Date.now() - batch[0].enqueuedAt > BATCH_MAX_WAIT_MS) {
+    return ["batch", batch.shift() as Waiter];
+  }
+  if (interactive.length) return ["interactive", interactive.shift() as Waiter];
+  if (batch.length) return ["batch", batch.shift() as Waiter];
+  return null;
+}
+
+function pump(state: KeyState) {
+  const now = Date.now();
+  if (now < state.cooldownUntil) {
+    if (!state.timer) {
+      state.timer = setTimeout(() => {
+        state.timer = null;
+        pump(state);
+      }, state.cooldownUntil - now);
+    }
+    return;
+  }
+  while (state.inFlight < Math.floor(state.limit)) {
+    const next = nextWaiter(state);
+    if (!next) return;
+    const [priority, waiter] = next;
+    state.inFlight++;
+    recordWait(priority, now - waiter.enqueuedAt);
+    waiter.resolve();
+  }
+}
+
+function release(state: KeyState, outcome: AICallOutcome) {
+  state.inFlight--;
+  state.lastUsed = Date.now();
+  if (outcome === "rate_limited") {
+    state.rateLimited++;
+    state.consecutiveRateLimits++;
+    state.limit = Math.max(MIN_LIMIT, state.limit / 2);
+    const backoff = Math.min(
+      COOLDOWN_MAX_MS,
+      COOLDOWN_BASE_MS * 2 ** (state.consecutiveRateLimits - 1)
+    );
+    state.cooldownUntil = Date.now() + backoff * (0.5 + Math.random() * 0.5);
+  } else {
+    state.completed++;
+    if (outcome === "ok") {
+      state.consecutiveRateLimits = 0;
+      state.limit = Math.min(MAX_LIMIT, state.limit + 1 / state.limit);
+    }
+  }
+  pump(state);
+}
+
+/**
+ * Waits for a slot for `apiKey` and returns the function that releases it.
+ * For streaming calls, which hold the slot until the stream ends; prefer
+ * scheduleAICall for request/response calls.
+ */
+export async function acquireAISlot(
+  apiKey: string,
+  priority: AIPriority,
+  model?: string
+): Promise<(outcome: AICallOutcome) => void> {
+  const state = keyState(apiKey, model);
+  await new Promise<void>((resolve) => {
+    state.queues[priority].push({ enqueuedAt: Date.now(), resolve });
+    pump(state);
+  });
+
+  let released = false;
+  return (outcome) => {
+    if (released) return;
+    released = true;
+    release(state, outcome);
+  };
+}
+
+export function callOutcome(error: unknown): AICallOutcome {
+  return isRateLimitError(error) ? "rate_limited" : "error";
+}
+
+/**
+ * Runs `fn` in a slot for `apiKey`, retrying up to `retries` times on
+ * rate-limit errors (each retry waits out the key's cooldown). Other errors
+ * are thrown immediately.
+ */
+export async function scheduleAICall<T>(
+  apiKey: string,
+  fn: () => Promise<T>,
+  {
+    priority = "batch",
+    retries = RATE_LIMIT_RETRIES,
+    model,
+  }: { priority?: AIPriority; retries?: number; model?: string } = {}
+): Promise<T> {
+  for (let attempt = 0; ; attempt++) {
+    const done = await acquireAISlot(apiKey, priority, model);
+    try {
+      const value = await fn();
+      done("ok");
+      return value;
+    } catch (error) {
+      const outcome = callOutcome(error);
+      done(outcome);
+      if (outcome !== "rate_limited" || attempt >= retries) throw error;
+    }
+  }
+}
+
+function percentile(sorted: number[], p: number): number {
+  if (sorted.length === 0) return 0;
+  return sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))];
+}
+
+export interface SchedulerMetrics {
+  keys: {
+    key: string;
+    limit: number;
+    inFlight: number;
+    queued: Record<AIPriority, number>;
+    cooldownMs: number;
+    completed: number;
+    rateLimited: number;
+  }[];
+  waitMs: Record<AIPriority, { p50: number; p95: number; max: number; samples: number }>;
+}
+
+/** Queue depth and wait-time snapshot. Keys are identified by a hash prefix. */
+export function getSchedulerMetrics(): SchedulerMetrics {
+  const now = Date.now();
+  const waitMs = {} as SchedulerMetrics["waitMs"];
+  for (const priority of ["interactive", "batch"] as const) {
+    const sorted = [...waitSamples[priority]].sort((a, b) => a - b);
+    waitMs[priority] = {
+      p50: percentile(sorted, 50),
+      p95: percentile(sorted, 95),
+      max: sorted.length ? sorted[sorted.length - 1] : 0,
+      samples: sorted.length,
+    };
+  }
+  return {
+    keys: [...keys.values()].map((s) => ({
+      key: s.id,
+      limit: Math.floor(s.limit),
+      inFlight: s.inFlight,
+      queued: { interactive: s.queues.interactive.length, batch: s.queues.batch.length },
+      cooldownMs: Math.max(0, s.cooldownUntil - now),
+      completed: s.completed,
+      rateLimited: s.rateLimited,
+    })),
+    waitMs,
+  };
+}
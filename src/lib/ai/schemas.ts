@@ -36,6 +36,16 @@ export const MeetingOutputSchema = z.object({
 
 export type MeetingOutputType = z.infer<typeof MeetingOutputSchema>;
 
+// Same fields with the email draft first, for streamed analysis: once the
+// model moves on to `summary` the draft is final and the compliance scan can
+// start while the rest of the object is still being generated.
+export const MeetingOutputStreamSchema = z.object({
+  email_draft: MeetingOutputSchema.shape.email_draft,
+  summary: MeetingOutputSchema.shape.summary,
+  key_topics: MeetingOutputSchema.shape.key_topics,
+  tasks: MeetingOutputSchema.shape.tasks,
+});
+
 export const ComplianceFlagSchema = z.object({
   flags: z.array(
     z.object({
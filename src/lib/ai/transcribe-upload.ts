@@ -0,0 +1,196 @@
+import { SEGMENT_SAMPLE_RATE, decodeToMono, segmentSamples } from "@/lib/audio/segment-audio";
+import { mapWithConcurrency } from "@/lib/utils/concurrency";
+import { stitchTranscripts } from "@/lib/utils/transcript-stitch";
+
+// Metadata headers for raw-body uploads to /api/ai/transcribe. The body is the
+// file itself, so everything the JSON mode carries in its payload moves here.
+export const TRANSCRIBE_HEADERS = {
+  apiKey: "x-api-key",
+  model: "x-ai-model",
+  mode: "x-transcribe-mode",
+  fileName: "x-file-name",
+  segment: "x-transcribe-segment",
+  /** Comma-separated fallback chain for the transcription task. */
+  fallbackModels: "x-ai-fallback-models",
+} as const;
+
+export type TranscribeMode = "audio" | "text";
+
+/** Position of a segment within a longer recording (0-based index). */
+export interface TranscribeSegment {
+  index: number;
+  total: number;
+}
+
+interface TranscribeUploadBase {
+  apiKey: string;
+  model: string;
+  mode: TranscribeMode;
+  fileName: string;
+  mimeType: string;
+  segment?: TranscribeSegment;
+  fallbackModels?: string[];
+  signal?: AbortSignal;
+}
+
+export type TranscribeUpload = TranscribeUploadBase & { file: Blob };
+
+/**
+ * Sends a file to the transcribe route as the raw request body. Disk-backed
+ * blobs (uploaded files, spooled recordings) are streamed by the browser
+ * without being read into memory first.
+ */
+export function postTranscription(upload: TranscribeUpload): Promise<Response> {
+  const { apiKey, model, mode, fileName, mimeType, segment, fallbackModels, signal } = upload;
+
+  return fetch("/api/ai/transcribe", {
+    method: "POST",
+    signal,
+    headers: {
+      "Content-Type": mimeType || "application/octet-stream",
+      [TRANSCRIBE_HEADERS.apiKey]: apiKey,
+      [TRANSCRIBE_HEADERS.model]: model,
+      [TRANSCRIBE_HEADERS.mode]: mode,
+      [TRANSCRIBE_HEADERS.fileName]: encodeURIComponent(fileName),
+      ...(segment && {
+        [TRANSCRIBE_HEADERS.segment]: `${segment.index + 1}/${segment.total}`,
+      }),
+      ...(fallbackModels?.length && {
+        [TRANSCRIBE_HEADERS.fallbackModels]: fallbackModels.join(","),
+      }),
+    },
+    body: upload.file,
+  });
+}
+
+/** Parses the `x-transcribe-segment` header ("3/12") back into a segment. */
+export function parseSegmentHeader(value: string | null): TranscribeSegment | null {
+  const match = value?.match(/^(\d+)\/(\d+)$/);
+  if (!match) return null;
+  const position = Number(match[1]);
+  const total = Number(match[2]);
+  if (position < 1 || position > total) return null;
+  return { index: position - 1, total };
+}
+
+// Recordings longer than one segment are transcribed as overlapping segments
+// in parallel instead of one long request, so no request outlives the
+// route's time limit. Size is a secondary limit: a recording above it is
+// segmented whatever its duration, and one the browser cannot decode is
+// only sent whole if it is below it.
+export const SINGLE_REQUEST_MAX_BYTES = 8 * 1024 * 1024;
+const SEGMENT_SECONDS = 300;
+const SEGMENT_OVERLAP_SECONDS = 15;
+const SEGMENT_CONCURRENCY = 4;
+
+export interface SegmentTiming {
+  index: number;
+  startSeconds: number;
+  endSeconds: number;
+  elapsedMs: number;
+}
+
+export type TranscriptionOutcome =
+  | { ok: true; transcript: string; segments: SegmentTiming[] }
+  | { ok: false; error: string; isQuota: boolean };
+
+export type AudioTranscriptionRequest = Omit<TranscribeUploadBase, "mode" | "segment"> & {
+  file: Blob;
+  /** Called as each segment finishes; only fires for segmented recordings. */
+  onProgress?: (completed: number, total: number) => void;
+};
+
+class TranscriptionFailure extends Error {
+  constructor(message: string, readonly isQuota: boolean) {
+    super(message);
+  }
+}
+
+async function readTranscript(res: Response): Promise<string> {
+  const data = await res.json();
+  if (!res.ok) {
+    throw new TranscriptionFailure(
+      data.error || "Transcription failed",
+      Boolean(data.isQuota)
+    );
+  }
+  return data.data.transcript as string;
+}
+
+/**
+ * Transcribes an audio recording. Recordings up to one segment long go to the
+ * route as a single request; longer ones are cut into overlapping windows, transcribed with
+ * bounded concurrency and stitched back together in order.
+ */
+export async function transcribeAudio(
+  request: AudioTranscriptionRequest
+): Promise<TranscriptionOutcome> {
+  const { onProgress, ...upload } = request;
+  try {
+    // Duration decides, so a long low-bitrate recording is still segmented.
+    const samples = await decodeToMono(upload.file).catch((error) => {
+      if (upload.file.size > SINGLE_REQUEST_MAX_BYTES) throw error;
+      return null;
+    });
+    if (
+      !samples ||
+      (samples.length <= SEGMENT_SECONDS * SEGMENT_SAMPLE_RATE &&
+        upload.file.size <= SINGLE_REQUEST_MAX_BYTES)
+    ) {
+      const startedAt = performance.now();
+      const transcript = await readTranscript(
+        await postTranscription({ ...upload, mode: "audio" })
+      );
+      return {
+        ok: true,
+        transcript,
+        segments: [
+          { index: 0, startSeconds: 0, endSeconds: 0, elapsedMs: performance.now() - startedAt },
+        ],
+      };
+    }
+
+    const { apiKey, model, fileName, fallbackModels } = upload;
+    const segments = segmentSamples(samples, {
+      segmentSeconds: SEGMENT_SECONDS,
+      overlapSeconds: SEGMENT_OVERLAP_SECONDS,
+    });
+    const timings: SegmentTiming[] = [];
+    let completed = 0;
+
+    const parts = await mapWithConcurrency(segments, SEGMENT_CONCURRENCY, async (segment) => {
+      const startedAt = performance.now();
+      const transcript = await readTranscript(
+        await postTranscription({
+          apiKey,
+          model,
+          mode: "audio",
+          fileName: `${fileName} (part ${segment.index + 1} of ${segments.length})`,
+          mimeType: "audio/wav",
+          file: segment.toBlob(),
+          segment: { index: segment.index, total: segments.length },
+          fallbackModels,
+        })
+      );
+      timings[segment.index] = {
+        index: segment.index,
+        startSeconds: segment.startSeconds,
+        endSeconds: segment.endSeconds,
+        elapsedMs: performance.now() - startedAt,
+      };
+      onProgress?.(++completed, segments.length);
+      return transcript;
+    });
+
+    return { ok: true, transcript: stitchTranscripts(parts), segments: timings };
+  } catch (error) {
+    if (error instanceof TranscriptionFailure) {
+      return { ok: false, error: error.message, isQuota: error.isQuota };
+    }
+    return {
+      ok: false,
+      error: error instanceof Error ? error.message : "Transcription failed",
+      isQuota: false,
+    };
+  }
+}
@@ -0,0 +1,156 @@
+import { postTranscription } from "@/lib/ai/transcribe-upload";
+import type { SegmentTiming, TranscriptionOutcome } from "@/lib/ai/transcribe-upload";
+import { SEGMENT_SAMPLE_RATE, encodeWav } from "@/lib/audio/segment-audio";
+import { stitchTranscripts } from "@/lib/utils/transcript-stitch";
+
+// Transcribes a recording while it is still in progress. The recorder feeds
+// 16 kHz mono PCM (see pcm-capture.ts), which is cut into overlapping
+// windows; each full window is encoded as a standalone WAV file and posted to
+// /api/ai/transcribe as soon as it is available, so only the final (partial)
+// window is left when the recording stops.
+
+export interface LiveTranscriberOptions {
+  apiKey: string;
+  model: string;
+  fallbackModels?: string[];
+  windowSeconds?: number;
+  overlapSeconds?: number;
+  /** Called with the stitched transcript of every window finished so far. */
+  onPartialTranscript?: (transcript: string) => void;
+}
+
+export interface LiveTranscriber {
+  /** Appends 16 kHz mono samples. */
+  push: (samples: Float32Array) => void;
+  /** Flushes the last window and resolves with the complete transcript. */
+  finish: () => Promise<TranscriptionOutcome>;
+  cancel: () => void;
+}
+
+const DEFAULT_WINDOW_SECONDS = 60;
+const DEFAULT_OVERLAP_SECONDS = 5;
+
+export function createLiveTranscriber({
+  apiKey,
+  model,
+  fallbackModels,
+  windowSeconds = DEFAULT_WINDOW_SECONDS,
+  overlapSeconds = DEFAULT_OVERLAP_SECONDS,
+  onPartialTranscript,
+}: LiveTranscriberOptions): LiveTranscriber {
+  const windowLength = windowSeconds * SEGMENT_SAMPLE_RATE;
+  const overlapLength = Math.min(windowLength - 1, overlapSeconds * SEGMENT_SAMPLE_RATE);
+  // The current window; `buffered` samples of it are filled, starting at
+  // absolute sample `windowStart`.
+  const buffer = new Float32Array(windowLength);
+  let buffered = 0;
+  let windowStart = 0;
+  // Samples at the start of the buffer already sent with the previous window.
+  let sentInBuffer = 0;
+  const parts: (string | undefined)[] = [];
+  const timings: SegmentTiming[] = [];
+  const pending: Promise<void>[] = [];
+  const controller = new AbortController();
+  let failure: Extract<TranscriptionOutcome, { ok: false }> | null = null;
+
+  function publishPartial() {
+    const done: string[] = [];
+    for (const part of parts) {
+      if (part === undefined) break;
+      done.push(part);
+    }
+    onPartialTranscript?.(stitchTranscripts(done));
+  }
+
+  function flush() {
+    const index = parts.length;
+    parts.push(undefined);
+    const file = encodeWav(buffer.subarray(0, buffered), SEGMENT_SAMPLE_RATE);
+    const startSeconds = windowStart / SEGMENT_SAMPLE_RATE;
+    const endSeconds = (windowStart + buffered) / SEGMENT_SAMPLE_RATE;
+    const startedAt = performance.now();
+
+    // Keep the tail as the overlap at the start of the next window.
+    const keep = Math.min(overlapLength, buffered);
+    buffer.copyWithin(0, buffered - keep, buffered);
+    windowStart += buffered - keep;
+    buffered = keep;
+    sentInBuffer = keep;
+
+    pending.push(
+      postTranscription({
+        apiKey,
+        model,
+        fallbackModels,
+        mode: "audio",
+        mimeType: "audio/wav",
+        fileName: `live-window-${index + 1}.wav`,
+        file,
+        signal: controller.signal,
+      })
+        .then(async (res) => {
+          const data = await res.json();
+          if (!res.ok) {
+            failure ??= {
+              ok: false,
+              error: data.error || "Transcription failed",
+              isQuota: Boolean(data.isQuota),
+            };
+            return;
+          }
+          parts[index] = data.data.transcript;
+          timings[index] = {
+            index,
+            startSeconds,
+            endSeconds,
+            elapsedMs: performance.now() - startedAt,
+          };
+          publishPartial();
+        })
+        .catch((error) => {
+          if (controller.signal.aborted) return;
+          failure ??= {
+            ok: false,
+            error: error instanceof Error ? error.message : "Transcription failed",
+            isQuota: false,
+          };
+        })
+    );
+  }
+
+  return {
+    push(samples) {
+      // Stop sending windows after a failure; finish() reports it.
+      if (controller.signal.aborted || failure) return;
+      let offset = 0;
+      while (offset < samples.length) {
+        const n = Math.min(samples.length - offset, windowLength - buffered);
+        buffer.set(samples.subarray(offset, offset + n), buffered);
+        buffered += n;
+        offset += n;
+        if (buffered === windowLength) flush();
+      }
+    },
+
+    async finish() {
+      if (controller.signal.aborted) {
+        return { ok: false, error: "Live transcription was cancelled", isQuota: false };
+      }
+      if (!failure && buffered > sentInBuffer) flush();
+      await Promise.all(pending);
+      if (failure) return failure;
+      if (parts.length === 0) {
+        return { ok: false, error: "No audio was captured", isQuota: false };
+      }
+      return {
+        ok: true,
+        transcript: stitchTranscripts(parts as string[]),
+        segments: timings,
+      };
+    },
+
+    cancel() {
+      controller.abort();
+    },
+  };
+}
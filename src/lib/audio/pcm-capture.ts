@@ -0,0 +1,102 @@
+import { SEGMENT_SAMPLE_RATE } from "@/lib/audio/segment-audio";
+
+// Taps raw audio from a Web Audio graph as 16 kHz mono PCM, the format the
+// segmenting code encodes as WAV. An AudioWorklet downmixes each render
+// quantum and posts it in batches; the main thread resamples to 16 kHz.
+
+const PROCESSOR_NAME = "pcm-capture";
+// Frames per message (~85 ms at 48 kHz) to keep port traffic low.
+const BATCH_FRAMES = 4096;
+
+const PROCESSOR_SOURCE = `
+class PcmCaptureProcessor extends AudioWorkletProcessor {
+  constructor() {
+    super();
+    this.batch = new Float32Array(${BATCH_FRAMES});
+    this.length = 0;
+  }
+  process(inputs) {
+    const channels = inputs[0];
+    if (!channels || channels.length === 0) return true;
+    const frames = channels[0].length;
+    for (let i = 0; i < frames; i++) {
+      let sum = 0;
+      for (let c = 0; c < channels.length; c++) sum += channels[c][i];
+      this.batch[this.length++] = sum / channels.length;
+      if (this.length === this.batch.length) {
+        this.port.postMessage(this.batch, [this.batch.buffer]);
+        this.batch = new Float32Array(${BATCH_FRAMES});
+        this.length = 0;
+      }
+    }
+    return true;
+  }
+}
+registerProcessor("${PROCESSOR_NAME}", PcmCaptureProcessor);
+`;
+
+const registered = new WeakSet<BaseAudioContext>();
+
+/**
+ * Streaming box-filter resampler: each output sample is the mean of the input
+ * samples it covers. Adequate for speech going down to 16 kHz.
+ */
+function createDownsampler(inputRate: number, outputRate: number) {
+  const step = inputRate / outputRate;
+  let consumed = 0;
+  let boundary = step;
+  let sum = 0;
+  let count = 0;
+
+  return (input: Float32Array): Float32Array => {
+    const output = new Float32Array(Math.ceil(input.length / step) + 1);
+    let written = 0;
+    for (let i = 0; i < input.length; i++) {
+      sum += input[i];
+      count++;
+      if (++consumed >= boundary) {
+        output[written++] = sum / count;
+        sum = 0;
+        count = 0;
+        boundary += step;
+      }
+    }
+    return output.subarray(0, written);
+  };
+}
+
+/**
+ * Starts delivering `source`'s audio to `onSamples` as 16 kHz mono PCM.
+ * Resolves with a function that stops the capture.
+ */
+export async function capturePcm(
+  context: AudioContext,
+  source: AudioNode,
+  onSamples: (samples: Float32Array) => void
+): Promise<() => void> {
+  if (!registered.has(context)) {
+    const url = URL.createObjectURL(
+      new Blob([PROCESSOR_SOURCE], { type: "application/javascript" })
+    );
+    try {
+      await context.audioWorklet.addModule(url);
+    } finally {
+      URL.revokeObjectURL(url);
+    }
+    registered.add(context);
+  }
+
+  // No outputs: the node is processed without being routed to the speakers.
+  const node = new AudioWorkletNode(context, PROCESSOR_NAME, { numberOfOutputs: 0 });
+  const downsample =
+    context.sampleRate === SEGMENT_SAMPLE_RATE
+      ? (input: Float32Array) => input
+      : createDownsampler(context.sampleRate, SEGMENT_SAMPLE_RATE);
+  node.port.onmessage = (e: MessageEvent<Float32Array>) => onSamples(downsample(e.data));
+  source.connect(node);
+
+  return () => {
+    node.port.onmessage = null;
+    source.disconnect(node);
+  };
+}
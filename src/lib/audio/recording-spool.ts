@@ -0,0 +1,188 @@
+// IndexedDB spool for recordings. MediaRecorder chunks are written to disk as
+// they arrive instead of accumulating in memory, and pages hand recordings to
+// each other by ID. Blobs read back from IndexedDB are disk-backed, so the
+// assembled recording can be played or uploaded without loading it into RAM.
+
+const DB_NAME = "advisor-recordings";
+const DB_VERSION = 1;
+const RECORDINGS_STORE = "recordings";
+const CHUNKS_STORE = "chunks";
+
+export interface SpooledRecordingMeta {
+  id: string;
+  mimeType: string;
+  createdAt: number;
+  bytes: number;
+  chunkCount: number;
+  complete: boolean;
+}
+
+export interface SpooledRecording {
+  meta: SpooledRecordingMeta;
+  blob: Blob;
+}
+
+export interface RecordingSpool {
+  id: string;
+  /** Queues a chunk; writes are batched and applied in order. */
+  append: (chunk: Blob) => void;
+  /** Waits for pending writes, marks the recording complete and reads it back. */
+  finish: () => Promise<Blob>;
+  discard: () => Promise<void>;
+}
+
+interface ChunkRecord {
+  recordingId: string;
+  seq: number;
+  blob: Blob;
+}
+
+let dbPromise: Promise<IDBDatabase> | null = null;
+
+function openDatabase(): Promise<IDBDatabase> {
+  if (!dbPromise) {
+    dbPromise = new Promise<IDBDatabase>((resolve, reject) => {
+      const req = indexedDB.open(DB_NAME, DB_VERSION);
+      req.onupgradeneeded = () => {
+        const db = req.result;
+        db.createObjectStore(RECORDINGS_STORE, { keyPath: "id" });
+        db.createObjectStore(CHUNKS_STORE, { keyPath: ["recordingId", "seq"] });
+      };
+      req.onsuccess = () => resolve(req.result);
+      req.onerror = () => reject(req.error);
+    }).catch((error) => {
+      dbPromise = null;
+      throw error;
+    });
+  }
+  return dbPromise;
+}
+
+function toPromise<T>(req: IDBRequest<T>): Promise<T> {
+  return new Promise((resolve, reject) => {
+    req.onsuccess = () => resolve(req.result);
+    req.onerror = () => reject(req.error);
+  });
+}
+
+function transactionDone(tx: IDBTransaction): Promise<void> {
+  return new Promise((resolve, reject) => {
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+    tx.onabort = () => reject(tx.error ?? new DOMException("Aborted", "AbortError"));
+  });
+}
+
+function chunkRange(id: string): IDBKeyRange {
+  return IDBKeyRange.bound([id, 0], [id, Infinity]);
+}
+
+export async function createRecordingSpool(mimeType: string): Promise<RecordingSpool> {
+  const db = await openDatabase();
+  const meta: SpooledRecordingMeta = {
+    id: crypto.randomUUID(),
+    mimeType,
+    createdAt: Date.now(),
+    bytes: 0,
+    chunkCount: 0,
+    complete: false,
+  };
+  const tx = db.transaction(RECORDINGS_STORE, "readwrite");
+  tx.objectStore(RECORDINGS_STORE).put(meta);
+  await transactionDone(tx);
+
+  let queue: Blob[] = [];
+  let writing: Promise<void> = Promise.resolve();
+  let writeError: unknown = null;
+
+  // Chunks that arrive while a transaction is in flight are written together
+  // in the next one, so a slow disk never builds up one transaction per chunk.
+  async function drain() {
+    while (queue.length > 0) {
+      const batch = queue;
+      queue = [];
+      const tx = db.transaction([RECORDINGS_STORE, CHUNKS_STORE], "readwrite");
+      const chunks = tx.objectStore(CHUNKS_STORE);
+      for (const blob of batch) {
+        const record: ChunkRecord = { recordingId: meta.id, seq: meta.chunkCount++, blob };
+        chunks.put(record);
+        meta.bytes += blob.size;
+      }
+      tx.objectStore(RECORDINGS_STORE).put(meta);
+      await transactionDone(tx);
+    }
+  }
+
+  return {
+    id: meta.id,
+
+    append(chunk) {
+      queue.push(chunk);
+      if (queue.length === 1) {
+        writing = writing.then(drain).catch((error) => {
+          writeError ??= error;
+        });
+      }
+    },
+
+    async finish() {
+      await writing;
+      if (writeError) throw writeError;
+      meta.complete = true;
+      const tx = db.transaction(RECORDINGS_STORE, "readwrite");
+      tx.objectStore(RECORDINGS_STORE).put(meta);
+      await transactionDone(tx);
+
+      const recording = await readSpooledRecording(meta.id);
+      if (!recording) throw new Error("Recording was removed from storage");
+      return recording.blob;
+    },
+
+    async discard() {
+      queue = [];
+      await writing;
+      await deleteSpooledRecording(meta.id);
+    },
+  };
+}
+
+export async function readSpooledRecording(id: string): Promise<SpooledRecording | null> {
+  const db = await openDatabase();
+  const tx = db.transaction([RECORDINGS_STORE, CHUNKS_STORE], "readonly");
+  const [meta, chunks] = await Promise.all([
+    toPromise(tx.objectStore(RECORDINGS_STORE).get(id)) as Promise<
+      SpooledRecordingMeta | undefined
+    >,
+    toPromise(tx.objectStore(CHUNKS_STORE).getAll(chunkRange(id))) as Promise<ChunkRecord[]>,
+  ]);
+  if (!meta) return null;
+  // getAll returns records in key order, i.e. by sequence number.
+  return {
+    meta,
+    blob: new Blob(
+      chunks.map((c) => c.blob),
+      { type: meta.mimeType }
+    ),
+  };
+}
+
+export async function deleteSpooledRecording(id: string): Promise<void> {
+  const db = await openDatabase();
+  const tx = db.transaction([RECORDINGS_STORE, CHUNKS_STORE], "readwrite");
+  tx.objectStore(RECORDINGS_STORE).delete(id);
+  tx.objectStore(CHUNKS_STORE).delete(chunkRange(id));
+  await transactionDone(tx);
+}
+
+/** Removes recordings left behind by closed tabs or abandoned handoffs. */
+export async function pruneSpooledRecordings(maxAgeMs: number): Promise<void> {
+  const db = await openDatabase();
+  const tx = db.transaction(RECORDINGS_STORE, "readonly");
+  const all = (await toPromise(
+    tx.objectStore(RECORDINGS_STORE).getAll()
+  )) as SpooledRecordingMeta[];
+  const cutoff = Date.now() - maxAgeMs;
+  await Promise.all(
+    all.filter((r) => r.createdAt < cutoff).map((r) => deleteSpooledRecording(r.id))
+  );
+}
@@ -0,0 +1,83 @@
+// Client-side audio segmentation for long recordings. Audio is decoded once,
+// downmixed to 16 kHz mono (plenty for speech) and cut into overlapping
+// windows that are each encoded as a standalone 16-bit WAV file.
+
+export const SEGMENT_SAMPLE_RATE = 16000;
+
+export interface AudioSegment {
+  index: number;
+  startSeconds: number;
+  endSeconds: number;
+  /** Encodes the window on demand so only in-flight segments hold a WAV copy. */
+  toBlob: () => Blob;
+}
+
+export interface SegmentOptions {
+  segmentSeconds: number;
+  overlapSeconds: number;
+}
+
+export async function decodeToMono(blob: Blob): Promise<Float32Array> {
+  const ctx = new OfflineAudioContext(1, 1, SEGMENT_SAMPLE_RATE);
+  const decoded = await ctx.decodeAudioData(await blob.arrayBuffer());
+  if (decoded.numberOfChannels === 1) return decoded.getChannelData(0);
+
+  const mono = new Float32Array(decoded.length);
+  for (let c = 0; c < decoded.numberOfChannels; c++) {
+    const channel = decoded.getChannelData(c);
+    for (let i = 0; i < channel.length; i++) mono[i] += channel[i];
+  }
+  for (let i = 0; i < mono.length; i++) mono[i] /= decoded.numberOfChannels;
+  return mono;
+}
+
+export function encodeWav(samples: Float32Array, sampleRate: number): Blob {
+  const buffer = new ArrayBuffer(44 + samples.length * 2);
+  const view = new DataView(buffer);
+  const writeString = (offset: number, value: string) => {
+    for (let i = 0; i < value.length; i++) view.setUint8(offset + i, value.charCodeAt(i));
+  };
+
+  writeString(0, "RIFF");
+  view.setUint32(4, 36 + samples.length * 2, true);
+  writeString(8, "WAVE");
+  writeString(12, "fmt ");
+  view.setUint32(16, 16, true); // PCM chunk size
+  view.setUint16(20, 1, true); // PCM format
+  view.setUint16(22, 1, true); // mono
+  view.setUint32(24, sampleRate, true);
+  view.setUint32(28, sampleRate * 2, true); // byte rate
+  view.setUint16(32, 2, true); // block align
+  view.setUint16(34, 16, true); // bits per sample
+  writeString(36, "data");
+  view.setUint32(40, samples.length * 2, true);
+
+  for (let i = 0; i < samples.length; i++) {
+    const s = Math.max(-1, Math.min(1, samples[i]));
+    view.setInt16(44 + i * 2, s < 0 ? s * 0x8000 : s * 0x7fff, true);
+  }
+  return new Blob([buffer], { type: "audio/wav" });
+}
+
+/** Splits decoded mono samples into overlapping windows. */
+export function segmentSamples(
+  samples: Float32Array,
+  { segmentSeconds, overlapSeconds }: SegmentOptions
+): AudioSegment[] {
+  const windowLength = segmentSeconds * SEGMENT_SAMPLE_RATE;
+  const step = (segmentSeconds - overlapSeconds) * SEGMENT_SAMPLE_RATE;
+  const segments: AudioSegment[] = [];
+
+  for (let start = 0; start < samples.length; start += step) {
+    const end = Math.min(samples.length, start + windowLength);
+    const slice = samples.subarray(start, end);
+    segments.push({
+      index: segments.length,
+      startSeconds: start / SEGMENT_SAMPLE_RATE,
+      endSeconds: end / SEGMENT_SAMPLE_RATE,
+      toBlob: () => encodeWav(slice, SEGMENT_SAMPLE_RATE),
+    });
+    if (end === samples.length) break;
+  }
+  return segments;
+}
@@ -0,0 +1,234 @@
+import { revalidateTag, unstable_cache } from "next/cache";
+import { createStaticSupabaseClient } from "@/lib/supabase/server";
+import type { BookTag } from "@/lib/cache/book-tags";
+import { CLIENT_PAGE_SIZE } from "@/lib/clients/list-query";
+import type { ClientListFilters, ClientListItem, ClientListPage } from "@/lib/clients/list-query";
+import { CLIENT_HISTORY_COLUMNS, CLIENT_HISTORY_PAGE_SIZE } from "@/lib/clients/history-query";
+import type {
+  ClientHistoryItems,
+  ClientHistoryKind,
+  ClientHistoryPage,
+} from "@/lib/clients/history-query";
+import type {
+  Client,
+  DashboardStats,
+  MeetingWithClient,
+  TaskWithClient,
+} from "@/types/database";
+
+// Cached reads behind the dashboard and client pages. Results live in the
+// Next.js data cache, tagged by the tables they read, and are purged when
+// those tables are written (meeting jobs, batch imports, the workbench), so
+// repeat navigations are served without touching Supabase. The TTL only
+// bounds staleness for writes made outside the app.
+
+const BOOK_CACHE_TTL_S = 300;
+
+export function revalidateBookData(...tags: BookTag[]) {
+  for (const tag of tags) {
+    try {
+      revalidateTag(tag, { expire: 0 });
+    } catch (error) {
+      // Outside a request scope (e.g. after the response was sent); the TTL
+      // still applies.
+      console.warn(`Could not revalidate ${tag}:`, error);
+    }
+  }
+}
+
+export const getDashboardData = unstable_cache(
+  async () => {
+    const supabase = createStaticSupabaseClient();
+
+    // KPIs come from one row maintained by triggers (get_dashboard_stats).
+    const [statsRes, meetingsRes, tasksRes] = await Promise.all([
+      supabase.rpc("get_dashboard_stats").single(),
+      supabase
+        .from("meetings")
+        .select("*, clients(id, name, risk_tolerance, aum_value)")
+        .order("created_at", { ascending: false })
+        .limit(5),
+      supabase
+        .from("tasks")
+        .select("*, clients(id, name)")
+        .eq("status", "pending")
+        .order("due_date", { ascending: true })
+        .limit(8),
+    ]);
+    const error = statsRes.error || meetingsRes.error || tasksRes.error;
+    if (error) throw new Error(error.message);
+
+    const row = statsRes.data as {
+      total_aum: number | string;
+      client_count: number;
+      meetings_this_month: number;
+      pending_tasks: number;
+      compliance_flags: number;
+    } | null;
+    const stats: DashboardStats = {
+      totalAum: Number(row?.total_aum ?? 0),
+      clientCount: Number(row?.client_count ?? 0),
+      meetingsThisMonth: Number(row?.meetings_this_month ?? 0),
+      pendingTasks: Number(row?.pending_tasks ?? 0),
+      complianceFlags: Number(row?.compliance_flags ?? 0),
+    };
+
+    return {
+      stats,
+      meetings: (meetingsRes.data || []) as MeetingWithClient[],
+      tasks: (tasksRes.data || []) as TaskWithClient[],
+    };
+  },
+  ["dashboard"],
+  { tags: ["clients", "meetings", "tasks", "flags"], revalidate: BOOK_CACHE_TTL_S }
+);
+
+// Keyset cursors are base64url JSON of [sort value, id] of the last row.
+function encodeCursor(value: string | number, id: string): string {
+  return Buffer.from(JSON.stringify([value, id])).toString("base64url");
+}
+
+function decodeCursor(cursor: string): [string | number, string] | null {
+  try {
+    const parsed = JSON.parse(Buffer.from(cursor, "base64url").toString());
+    if (Array.isArray(parsed) && parsed.length === 2 && typeof parsed[1] === "string") {
+      return parsed as [string | number, string];
+    }
+  } catch {
+    // Malformed cursors restart from the first page.
+  }
+  return null;
+}
+
+// Values inside PostgREST `or` filters are quoted so names with commas,
+// dots or parentheses do not break the expression.
+function quoteFilterValue(value: string | number): string {
+  return `"${String(value).replace(/["\\]/g, "\\$&")}"`;
+}
+
+/**
+ * One page of the client list. Filtering, search and sorting run in the
+ * database, backed by the indexes in the client_list migration.
+ */
+export const getClientPage = unstable_cache(
+  async (filters: ClientListFilters, cursor: string | null): Promise<ClientListPage> => {
+    const sortColumn = filters.sort === "name" ? "name" : "aum_value";
+    const ascending = filters.sort !== "aum_desc";
+    const after = cursor ? decodeCursor(cursor) : null;
+
+    let query = createStaticSupabaseClient()
+      .from("clients")
+      .select("id, name, aum_value, risk_tolerance, status, notes", {
+        count: after ? undefined : "exact",
+      })
+      .order(sortColumn, { ascending })
+      // Ties break on id in the same direction, so one index scan serves it.
+      .order("id", { ascending })
+      .limit(CLIENT_PAGE_SIZE);
+
+    if (filters.q) {
+      query = query.ilike("name", `%${filters.q.replace(/[\\%_]/g, "\\$&")}%`);
+    }
+    if (filters.status) query = query.eq("status", filters.status);
+    if (filters.risk) query = query.eq("risk_tolerance", filters.risk);
+    if (after) {
+      const [value, id] = after;
+      const op = ascending ? "gt" : "lt";
+      query = query.or(
+        `${sortColumn}.${op}.${quoteFilterValue(value)},` +
+          `and(${sortColumn}.eq.${quoteFilterValue(value)},id.${op}.${quoteFilterValue(id)})`
+      );
+    }
+
+    const { data, count, error } = await query;
+    if (error) throw new Error(error.message);
+
+    const clients = (data || []) as ClientListItem[];
+    const last = clients[clients.length - 1];
+    return {
+      clients,
+      nextCursor:
+        clients.length === CLIENT_PAGE_SIZE && last
+          ? encodeCursor(sortColumn === "name" ? last.name : Number(last.aum_value), last.id)
+          : null,
+      total: after ? null : count ?? null,
+    };
+  },
+  ["client-page"],
+  { tags: ["clients"], revalidate: BOOK_CACHE_TTL_S }
+);
+
+async function fetchClientHistoryPage<K extends ClientHistoryKind>(
+  clientId: string,
+  kind: K,
+  cursor: string | null
+): Promise<ClientHistoryPage<K>> {
+  const after = cursor ? decodeCursor(cursor) : null;
+
+  let query = createStaticSupabaseClient()
+    .from(kind)
+    .select(CLIENT_HISTORY_COLUMNS[kind], { count: after ? undefined : "exact" })
+    .eq("client_id", clientId)
+    .order("created_at", { ascending: false })
+    .order("id", { ascending: false })
+    .limit(CLIENT_HISTORY_PAGE_SIZE);
+
+  if (after) {
+    const [createdAt, id] = after;
+    query = query.or(
+      `created_at.lt.${quoteFilterValue(createdAt)},` +
+        `and(created_at.eq.${quoteFilterValue(createdAt)},id.lt.${quoteFilterValue(id)})`
+    );
+  }
+
+  const { data, count, error } = await query;
+  if (error) throw new Error(error.message);
+
+  const items = (data || []) as unknown as ClientHistoryItems[K][];
+  const last = items[items.length - 1];
+  return {
+    items,
+    nextCursor:
+      items.length === CLIENT_HISTORY_PAGE_SIZE && last
+        ? encodeCursor(last.created_at, last.id)
+        : null,
+    total: after ? null : count ?? null,
+  };
+}
+
+/** An older page of a client's meetings or tasks. */
+export const getClientHistoryPage = unstable_cache(
+  fetchClientHistoryPage,
+  ["client-history"],
+  { tags: ["meetings", "tasks"], revalidate: BOOK_CACHE_TTL_S }
+);
+
+/**
+ * The client with the first page of their meetings and tasks, or null if
+ * there is no such client.
+ */
+export const getClientDetail = unstable_cache(
+  async (id: string) => {
+    const supabase = createStaticSupabaseClient();
+    const [clientRes, meetings, tasks] = await Promise.allSettled([
+      supabase.from("clients").select("*").eq("id", id).maybeSingle(),
+      fetchClientHistoryPage(id, "meetings", null),
+      fetchClientHistoryPage(id, "tasks", null),
+    ]);
+    if (clientRes.status === "rejected") throw clientRes.reason;
+    // 22P02: the id is not a valid uuid
+    if (clientRes.value.error?.code === "22P02") return null;
+    if (clientRes.value.error) throw new Error(clientRes.value.error.message);
+    if (meetings.status === "rejected") throw meetings.reason;
+    if (tasks.status === "rejected") throw tasks.reason;
+    if (!clientRes.value.data) return null;
+
+    return {
+      client: clientRes.value.data as Client,
+      meetings: meetings.value,
+      tasks: tasks.value,
+    };
+  },
+  ["client-detail"],
+  { tags: ["clients", "meetings", "tasks"], revalidate: BOOK_CACHE_TTL_S }
+);
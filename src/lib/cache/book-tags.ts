@@ -0,0 +1,17 @@
+// Cache tags for server-rendered book data (see src/lib/cache/book-data.ts).
+// Every mutation of these tables purges its tag: server code through
+// revalidateBookData, browser code through invalidateBookData.
+
+export const BOOK_TAGS = ["clients", "meetings", "tasks", "flags"] as const;
+export type BookTag = (typeof BOOK_TAGS)[number];
+
+/** Purges cached pages after a write made from the browser. */
+export async function invalidateBookData(tags: BookTag[]): Promise<void> {
+  await fetch("/api/cache/revalidate", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ tags }),
+  }).catch(() => {
+    // The TTL on cached entries bounds staleness if this fails.
+  });
+}
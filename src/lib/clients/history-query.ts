@@ -0,0 +1,38 @@
+import type { Meeting, Task } from "@/types/database";
+
+// Meeting and task history on the client detail page. Only the columns the
+// lists render are selected (never transcripts or PII entities), newest
+// first, keyset-paginated on (created_at, id). The page renders the first
+// page of each list; older pages come from GET /api/clients/:id/history.
+
+export type ClientHistoryKind = "meetings" | "tasks";
+
+export type ClientMeetingItem = Pick<Meeting, "id" | "title" | "status" | "created_at">;
+
+export type ClientTaskItem = Pick<
+  Task,
+  "id" | "description" | "due_date" | "priority" | "status" | "created_at"
+>;
+
+export interface ClientHistoryItems {
+  meetings: ClientMeetingItem;
+  tasks: ClientTaskItem;
+}
+
+export interface ClientHistoryPage<K extends ClientHistoryKind = ClientHistoryKind> {
+  items: ClientHistoryItems[K][];
+  nextCursor: string | null;
+  /** Rows for the client; only computed for the first page. */
+  total: number | null;
+}
+
+export const CLIENT_HISTORY_PAGE_SIZE = 20;
+
+export const CLIENT_HISTORY_COLUMNS: Record<ClientHistoryKind, string> = {
+  meetings: "id, title, status, created_at",
+  tasks: "id, description, due_date, priority, status, created_at",
+};
+
+export function isClientHistoryKind(value: unknown): value is ClientHistoryKind {
+  return value === "meetings" || value === "tasks";
+}
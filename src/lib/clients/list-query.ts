@@ -0,0 +1,73 @@
+import type { Client } from "@/types/database";
+
+// Query parameters shared by the clients page (server render of the first
+// page) and GET /api/clients (later pages). Pages are keyset-paginated: the
+// opaque cursor holds the sort value and id of the last row returned.
+
+export type ClientListSort = "name" | "aum_desc" | "aum_asc";
+
+export interface ClientListFilters {
+  q: string;
+  status: Client["status"] | null;
+  risk: Client["risk_tolerance"] | null;
+  sort: ClientListSort;
+}
+
+export type ClientListItem = Pick<
+  Client,
+  "id" | "name" | "aum_value" | "risk_tolerance" | "status" | "notes"
+>;
+
+export interface ClientListPage {
+  clients: ClientListItem[];
+  nextCursor: string | null;
+  /** Matching clients; only computed for the first page. */
+  total: number | null;
+}
+
+export const CLIENT_PAGE_SIZE = 50;
+export const CLIENT_STATUSES: Client["status"][] = ["Active", "Prospect", "Inactive"];
+export const RISK_TOLERANCES: Client["risk_tolerance"][] = [
+  "Conservative",
+  "Balanced",
+  "Growth",
+  "Aggressive",
+];
+export const CLIENT_SORTS: { id: ClientListSort; label: string }[] = [
+  { id: "name", label: "Name" },
+  { id: "aum_desc", label: "AUM (high to low)" },
+  { id: "aum_asc", label: "AUM (low to high)" },
+];
+
+type ParamSource = URLSearchParams | Record<string, string | string[] | undefined>;
+
+function param(source: ParamSource, key: string): string {
+  const value = source instanceof URLSearchParams ? source.get(key) : source[key];
+  return (Array.isArray(value) ? value[0] : value) ?? "";
+}
+
+/** Filters from URL search params; unknown values fall back to defaults. */
+export function parseClientListFilters(source: ParamSource): ClientListFilters {
+  const status = param(source, "status") as Client["status"];
+  const risk = param(source, "risk") as Client["risk_tolerance"];
+  const sort = param(source, "sort") as ClientListSort;
+  return {
+    q: param(source, "q").trim().slice(0, 100),
+    status: CLIENT_STATUSES.includes(status) ? status : null,
+    risk: RISK_TOLERANCES.includes(risk) ? risk : null,
+    sort: CLIENT_SORTS.some((s) => s.id === sort) ? sort : "name",
+  };
+}
+
+export function clientListSearchParams(
+  filters: ClientListFilters,
+  cursor?: string | null
+): URLSearchParams {
+  const params = new URLSearchParams();
+  if (filters.q) params.set("q", filters.q);
+  if (filters.status) params.set("status", filters.status);
+  if (filters.risk) params.set("risk", filters.risk);
+  if (filters.sort !== "name") params.set("sort", filters.sort);
+  if (cursor) params.set("cursor", cursor);
+  return params;
+}
@@ -4,6 +4,8 @@ export const APP_DESCRIPTION = "AI Admin Assistant for Wealth Management";
 export const API_KEY_STORAGE_KEY = "admin-assistant-api-key";
 export const MODEL_STORAGE_KEY = "admin-assistant-model";
 export const PROVIDER_STORAGE_KEY = "admin-assistant-provider";
+export const FALLBACK_CHAINS_STORAGE_KEY = "admin-assistant-fallback-chains";
+export const MODEL_CATALOGUE_STORAGE_KEY = "admin-assistant-models";
 
 export type ProviderOption = "openai" | "google";
 
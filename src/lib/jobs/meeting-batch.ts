@@ -0,0 +1,147 @@
+import { revalidateBookData } from "@/lib/cache/book-data";
+import { claimMeetingJob, runMeetingJob, unwrap } from "@/lib/jobs/meeting-job";
+import type { JobCredentials, MeetingJobCheckpoint } from "@/lib/jobs/meeting-job";
+import type { MeetingBatchEvent } from "@/lib/jobs/meeting-job-events";
+import type { createServerSupabaseClient } from "@/lib/supabase/server";
+import { redactPII } from "@/lib/utils/pii-redaction";
+import type { MeetingJob, MeetingJobInput, MeetingJobStatus } from "@/types/database";
+
+// Batch transcript imports on top of meeting jobs. Creating a batch redacts
+// every transcript and bulk-inserts the meetings and their queued jobs; a run
+// then claims queued jobs and processes them through the normal job pipeline
+// with bounded concurrency. The AI calls go through the per-key scheduler at
+// batch priority, so the provider's rate limit (not this concurrency) sets
+// the actual throughput, and interactive chat is still served first.
+
+type ServerSupabase = Awaited<ReturnType<typeof createServerSupabaseClient>>;
+
+export interface MeetingBatchItem {
+  clientId: string;
+  title: string;
+  transcript: string;
+  sourceFileName: string | null;
+}
+
+export const MAX_BATCH_ITEMS = 100;
+// Request body limit for creating a batch; every transcript is redacted
+// within the request, so its size is bounded by bytes as well as items.
+export const MAX_BATCH_BYTES = 4 * 1024 * 1024;
+// Jobs run at once by one batch request.
+const BATCH_CONCURRENCY = 6;
+// A run stops claiming jobs after this long so in-flight jobs can finish
+// within the route's maxDuration; the client starts another run.
+const RUN_BUDGET_MS = 200_000;
+
+/**
+ * Adds `items` to a batch (a new one unless `batchId` is given) and returns
+ * the job IDs in item order. Meetings and jobs are written together in one
+ * transactional RPC (create_meeting_batch).
+ */
+export async function createMeetingBatch(
+  supabase: ServerSupabase,
+  items: MeetingBatchItem[],
+  batchId: string = crypto.randomUUID()
+): Promise<{ batchId: string; jobIds: string[] }> {
+  // IDs are generated here so jobs can reference their meetings without
+  // relying on the order of returned rows.
+  const rows = items.map((item) => {
+    const { redactedText, entities } = redactPII(item.transcript);
+    const meetingId = crypto.randomUUID();
+    const input: MeetingJobInput = {
+      title: item.title || "Untitled Meeting",
+      transcript: item.transcript,
+      source_type: "file_upload",
+      source_file_name: item.sourceFileName,
+    };
+    const checkpoint: MeetingJobCheckpoint = { meetingId, piiCount: entities.length };
+    return {
+      meeting: {
+        id: meetingId,
+        client_id: item.clientId,
+        title: input.title,
+        transcript_text: item.transcript,
+        transcript_redacted: redactedText,
+        pii_entities: entities,
+        source_type: input.source_type,
+        source_file_name: input.source_file_name,
+        status: "processing",
+      },
+      job: {
+        id: crypto.randomUUID(),
+        batch_id: batchId,
+        client_id: item.clientId,
+        meeting_id: meetingId,
+        status: "queued",
+        current_step: "ai",
+        input,
+        checkpoint,
+      },
+    };
+  });
+
+  unwrap(
+    await supabase.rpc("create_meeting_batch", {
+      p_meetings: rows.map((r) => r.meeting),
+      p_jobs: rows.map((r) => r.job),
+    })
+  );
+  revalidateBookData("meetings");
+  return { batchId, jobIds: rows.map((r) => r.job.id) };
+}
+
+export async function getBatchJobs(
+  supabase: ServerSupabase,
+  batchId: string
+): Promise<Omit<MeetingJob, "input" | "checkpoint">[]> {
+  const result = await supabase
+    .from("meeting_jobs")
+    .select("id, batch_id, client_id, meeting_id, status, current_step, attempts, error, created_at, updated_at")
+    .eq("batch_id", batchId)
+    .order("created_at");
+  return unwrap(result) as Omit<MeetingJob, "input" | "checkpoint">[];
+}
+
+function countStatuses(jobs: { status: MeetingJobStatus }[]): Record<MeetingJobStatus, number> {
+  const counts = { queued: 0, running: 0, succeeded: 0, failed: 0 };
+  for (const job of jobs) counts[job.status]++;
+  return counts;
+}
+
+/**
+ * Runs the batch's queued jobs (and failed ones when `retryFailed`) until
+ * none are left or the run budget is spent, then emits the status counts.
+ * Jobs already running elsewhere are skipped.
+ */
+export async function runMeetingBatch(
+  supabase: ServerSupabase,
+  batchId: string,
+  credentials: JobCredentials,
+  emit: (event: MeetingBatchEvent) => void,
+  { retryFailed = false }: { retryFailed?: boolean } = {}
+): Promise<void> {
+  const deadline = Date.now() + RUN_BUDGET_MS;
+  const pending = (await getBatchJobs(supabase, batchId))
+    .filter((j) => j.status === "queued" || (retryFailed && j.status === "failed"))
+    .map((j) => j.id);
+
+  let next = 0;
+  async function worker() {
+    while (next < pending.length && Date.now() < deadline) {
+      const jobId = pending[next++];
+      const job = await claimMeetingJob(supabase, jobId);
+      if (!job) continue;
+      await runMeetingJob(supabase, job, credentials, (event) =>
+        emit({ type: "item", jobId, event })
+      );
+    }
+  }
+
+  try {
+    await Promise.all(
+      Array.from({ length: Math.min(BATCH_CONCURRENCY, pending.length) }, worker)
+    );
+  } finally {
+    const jobs = await getBatchJobs(supabase, batchId).catch(() => null);
+    if (jobs) emit({ type: "summary", counts: countStatuses(jobs) });
+  }
+}
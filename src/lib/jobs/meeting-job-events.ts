@@ -0,0 +1,67 @@
+import { encodeEvent, readEventStream } from "@/lib/utils/event-stream";
+import type { MeetingJobStatus, MeetingJobStep } from "@/types/database";
+
+// Progress events streamed (as Server-Sent Events) by the meeting job routes.
+// Step ids match the ProcessingPipeline step ids, so the client can apply
+// them to the pipeline view directly.
+
+export type MeetingJobEvent =
+  | { type: "job"; jobId: string }
+  | { type: "meeting"; meetingId: string }
+  | {
+      type: "step";
+      step: MeetingJobStep;
+      status: "running" | "complete" | "error";
+      description?: string;
+    }
+  | { type: "done"; meetingId: string }
+  | { type: "error"; step: MeetingJobStep | null; error: string; isQuota: boolean };
+
+export function encodeJobEvent(event: MeetingJobEvent): Uint8Array {
+  return encodeEvent(event);
+}
+
+/**
+ * Reads a job event stream until it closes, calling `onEvent` for each event.
+ * Non-stream (JSON error) responses are surfaced as a single error event.
+ */
+export async function readJobEvents(
+  res: Response,
+  onEvent: (event: MeetingJobEvent) => void
+): Promise<void> {
+  if (!res.ok || !res.body) {
+    const data = await res.json().catch(() => ({}));
+    onEvent({
+      type: "error",
+      step: null,
+      error: data.error || "Failed to start processing",
+      isQuota: Boolean(data.isQuota),
+    });
+    return;
+  }
+
+  await readEventStream(res.body, onEvent);
+}
+
+// Batch runs multiplex the events of every job they run, tagged with the job
+// ID, and end with the batch's status counts.
+export type MeetingBatchEvent =
+  | { type: "item"; jobId: string; event: MeetingJobEvent }
+  | { type: "summary"; counts: Record<MeetingJobStatus, number> };
+
+export function encodeBatchEvent(event: MeetingBatchEvent): Uint8Array {
+  return encodeEvent(event);
+}
+
+/** Reads a batch run stream; non-stream responses are thrown as errors. */
+export async function readBatchEvents(
+  res: Response,
+  onEvent: (event: MeetingBatchEvent) => void
+): Promise<void> {
+  if (!res.ok || !res.body) {
+    const data = await res.json().catch(() => ({}));
+    throw new Error(data.error || "Failed to run import");
+  }
+
+  await readEventStream(res.body, onEvent);
+}
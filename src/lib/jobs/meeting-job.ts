@@ -0,0 +1,384 @@
+import {
+  complianceCacheKey,
+  meetingAnalysisCacheKey,
+  reviewCompliance,
+  streamMeetingAnalysis,
+} from "@/lib/ai/meeting-analysis";
+import type { ComplianceReviewInput, MeetingAnalysisInput } from "@/lib/ai/meeting-analysis";
+import { cachedAIResult } from "@/lib/ai/result-cache";
+import { revalidateBookData } from "@/lib/cache/book-data";
+import type { FallbackChains } from "@/lib/ai/models";
+import { isRetryableAIError, parseAIError } from "@/lib/ai/provider";
+import type { ComplianceFlagType, MeetingOutputType } from "@/lib/ai/schemas";
+import { encodeJobEvent } from "@/lib/jobs/meeting-job-events";
+import type { MeetingJobEvent } from "@/lib/jobs/meeting-job-events";
+import type { createServerSupabaseClient } from "@/lib/supabase/server";
+import { redactPII } from "@/lib/utils/pii-redaction";
+import { withRetry } from "@/lib/utils/retry";
+import type {
+  Client,
+  MeetingJob,
+  MeetingJobInput,
+  MeetingJobStep,
+} from "@/types/database";
+
+// Server-side meeting pipeline. Each job row carries a checkpoint with the
+// result of every finished step, written before the next step starts, so a
+// failed or interrupted job resumes where it stopped. The job runs
+// independently of the progress stream: closing the tab does not stop it.
+//
+// The analysis is streamed with the email draft first; the compliance scan
+// starts as soon as the draft is final and overlaps the rest of the analysis.
+// The output, tasks and flags are then written in one transactional RPC
+// (persist_meeting_results), which is idempotent, so a retried job never
+// leaves a half-written or duplicated meeting.
+
+type ServerSupabase = Awaited<ReturnType<typeof createServerSupabaseClient>>;
+
+export interface MeetingJobCheckpoint {
+  meetingId?: string;
+  piiCount?: number;
+  analysis?: MeetingOutputType;
+  /** null when the scan failed; compliance is advisory and never blocks a job. */
+  compliance?: ComplianceFlagType | null;
+}
+
+export interface JobCredentials {
+  apiKey: string;
+  model?: string;
+  fallbackChains?: Partial<FallbackChains>;
+}
+
+// A running job touches its row every JOB_HEARTBEAT_MS, including while a
+// step (a long AI call, a wait in the scheduler queue) is in progress. A
+// running job whose row has not been touched for STALE_JOB_MS is assumed to
+// belong to a request that died, and may be resumed.
+const JOB_HEARTBEAT_MS = 30 * 1000;
+export const STALE_JOB_MS = 2 * 60 * 1000;
+
+const AI_RETRY = { attempts: 3, baseDelayMs: 1000, shouldRetry: isRetryableAIError };
+
+/** Throws Supabase errors (plain objects) as Error instances. */
+export function unwrap<T>({ data, error }: { data: T; error: { message: string } | null }): T {
+  if (error) throw new Error(error.message);
+  return data;
+}
+
+export async function createMeetingJob(
+  supabase: ServerSupabase,
+  clientId: string,
+  input: MeetingJobInput
+): Promise<MeetingJob> {
+  const result = await supabase
+    .from("meeting_jobs")
+    .insert({ client_id: clientId, input, status: "running", current_step: "pii" })
+    .select()
+    .single();
+  return unwrap(result) as MeetingJob;
+}
+
+/**
+ * Marks a failed (or stale running) job as running again. Returns null when
+ * the job is unknown, already finished, or currently running elsewhere.
+ */
+export async function claimMeetingJob(
+  supabase: ServerSupabase,
+  jobId: string
+): Promise<MeetingJob | null> {
+  const staleBefore = new Date(Date.now() - STALE_JOB_MS).toISOString();
+  const result = await supabase
+    .from("meeting_jobs")
+    .update({ status: "running", error: null, updated_at: new Date().toISOString() })
+    .eq("id", jobId)
+    .or(`status.in.(queued,failed),and(status.eq.running,updated_at.lt.${staleBefore})`)
+    .select()
+    .maybeSingle();
+  return unwrap(result) as MeetingJob | null;
+}
+
+export async function runMeetingJob(
+  supabase: ServerSupabase,
+  job: MeetingJob,
+  { apiKey, model, fallbackChains }: JobCredentials,
+  emit: (event: MeetingJobEvent) => void
+): Promise<void> {
+  const checkpoint = job.checkpoint as MeetingJobCheckpoint;
+  let step: MeetingJobStep = job.current_step ?? "pii";
+
+  async function save(fields: Record<string, unknown> = {}) {
+    unwrap(
+      await supabase
+        .from("meeting_jobs")
+        .update({
+          current_step: step,
+          meeting_id: checkpoint.meetingId ?? null,
+          checkpoint,
+          updated_at: new Date().toISOString(),
+          ...fields,
+        })
+        .eq("id", job.id)
+    );
+  }
+
+  const heartbeat = setInterval(() => {
+    supabase
+      .from("meeting_jobs")
+      .update({ updated_at: new Date().toISOString() })
+      .eq("id", job.id)
+      .eq("status", "running")
+      .then(({ error }) => {
+        if (error) console.warn(`Meeting job ${job.id} heartbeat failed:`, error.message);
+      });
+  }, JOB_HEARTBEAT_MS);
+
+  try {
+    await save({ attempts: job.attempts + 1 });
+    const client = unwrap(
+      await supabase
+        .from("clients")
+        .select("id, name, risk_tolerance, aum_value")
+        .eq("id", job.client_id)
+        .single()
+    ) as Pick<Client, "id" | "name" | "risk_tolerance" | "aum_value">;
+
+    // ── PII redaction + meeting record ──
+    step = "pii";
+    emit({ type: "step", step, status: "running", description: "Scanning for sensitive data..." });
+    if (!checkpoint.meetingId) {
+      const { transcript, title, source_type, source_file_name } = job.input;
+      const { redactedText, entities } = redactPII(transcript);
+      const meeting = unwrap(
+        await supabase
+          .from("meetings")
+          .insert({
+            client_id: job.client_id,
+            title: title || "Untitled Meeting",
+            transcript_text: transcript,
+            transcript_redacted: redactedText,
+            pii_entities: entities,
+            source_type,
+            source_file_name,
+            status: "processing",
+          })
+          .select("id")
+          .single()
+      ) as { id: string };
+      checkpoint.meetingId = meeting.id;
+      checkpoint.piiCount = entities.length;
+      await save();
+      revalidateBookData("meetings");
+    }
+    const meetingId = checkpoint.meetingId;
+    const piiCount = checkpoint.piiCount ?? 0;
+    emit({ type: "meeting", meetingId });
+    emit({
+      type: "step",
+      step,
+      status: "complete",
+      description:
+        piiCount > 0
+          ? `${piiCount} PII item${piiCount !== 1 ? "s" : ""} redacted`
+          : "No PII detected",
+    });
+
+    // Compliance never fails the job: errors are logged and recorded as null.
+    const scanDraft = (draft: string) => {
+      const input: ComplianceReviewInput = {
+        apiKey,
+        model,
+        emailDraft: draft,
+        riskTolerance: client.risk_tolerance,
+        fallbackModels: fallbackChains?.compliance,
+      };
+      return cachedAIResult(
+        complianceCacheKey(input),
+        () => withRetry(() => reviewCompliance(input), AI_RETRY),
+        { supabase }
+      )
+        .then((result) => result.value)
+        .catch((error) => {
+          console.error("Compliance scan failed:", parseAIError(error).message);
+          return null;
+        });
+    };
+    // Started from inside the analysis stream; keyed by the draft it scanned
+    // so a retried analysis with a different draft is not matched to it.
+    let earlyScan: { draft: string; result: Promise<ComplianceFlagType | null> } | null =
+      null;
+    let analysisCached = false;
+
+    // ── AI analysis ──
+    step = "ai";
+    emit({ type: "step", step, status: "running", description: "Generating summary, tasks & email..." });
+    if (!checkpoint.analysis) {
+      const { transcript_redacted } = unwrap(
+        await supabase
+          .from("meetings")
+          .select("transcript_redacted")
+          .eq("id", meetingId)
+          .single()
+      ) as { transcript_redacted: string };
+      const input: MeetingAnalysisInput = {
+        apiKey,
+        model,
+        transcript: transcript_redacted,
+        clientName: client.name,
+        riskTolerance: client.risk_tolerance,
+        aumValue: Number(client.aum_value),
+        fallbackModels: fallbackChains?.processing,
+      };
+      const result = await cachedAIResult(
+        meetingAnalysisCacheKey(input),
+        () =>
+          withRetry(
+            () =>
+              streamMeetingAnalysis(input, (draft) => {
+                if (checkpoint.compliance !== undefined) return;
+                earlyScan = { draft, result: scanDraft(draft) };
+                emit({
+                  type: "step",
+                  step: "compliance",
+                  status: "running",
+                  description: "Running FINRA & SEC review...",
+                });
+              }),
+            AI_RETRY
+          ),
+        { supabase }
+      );
+      checkpoint.analysis = result.value;
+      analysisCached = result.status === "hit";
+      await save();
+    }
+    const analysis = checkpoint.analysis;
+
+    emit({
+      type: "step",
+      step,
+      status: "complete",
+      description: `${analysis.tasks.length} tasks extracted${analysisCached ? " (cached)" : ""}`,
+    });
+
+    // ── Compliance scan ──
+    step = "compliance";
+    emit({ type: "step", step, status: "running", description: "Running FINRA & SEC review..." });
+    if (checkpoint.compliance === undefined) {
+      const scan: { draft: string; result: Promise<ComplianceFlagType | null> } | null =
+        earlyScan;
+      checkpoint.compliance = await (scan?.draft === analysis.email_draft
+        ? scan.result
+        : scanDraft(analysis.email_draft));
+      await save();
+    }
+
+    const flags = checkpoint.compliance?.flags ?? [];
+    emit({
+      type: "step",
+      step,
+      status: "complete",
+      description:
+        checkpoint.compliance === null
+          ? "Scan unavailable — review the draft manually"
+          : flags.length > 0
+          ? `${flags.length} flag${flags.length !== 1 ? "s" : ""} found`
+          : "No compliance issues",
+    });
+
+    // ── Persist output, tasks and flags; mark ready for review ──
+    step = "done";
+    unwrap(
+      await supabase.rpc("persist_meeting_results", {
+        p_meeting_id: meetingId,
+        p_output: {
+          summary_text: analysis.summary,
+          key_topics: analysis.key_topics,
+          client_email_draft: analysis.email_draft,
+        },
+        p_tasks: analysis.tasks.map((t) => ({
+          description: t.description,
+          priority: t.priority,
+          due_date: t.due_date_suggestion,
+        })),
+        p_flags: flags.map((f) => ({
+          flagged_text: f.flagged_text,
+          risk_category: f.risk_category,
+          severity: f.severity,
+          explanation: f.explanation,
+        })),
+      })
+    );
+    revalidateBookData("meetings", "tasks", "flags");
+    await save({ status: "succeeded" });
+    emit({ type: "step", step, status: "complete", description: "Meeting ready for review" });
+    emit({ type: "done", meetingId });
+  } catch (error) {
+    const { message, isQuota } = parseAIError(error);
+    console.error(`Meeting job ${job.id} failed at ${step}:`, message);
+    await save({ status: "failed", error: message }).catch((saveError) => {
+      console.error("Failed to record job failure:", saveError);
+    });
+    emit({ type: "step", step, status: "error", description: "Failed" });
+    emit({ type: "error", step, error: message, isQuota });
+  } finally {
+    clearInterval(heartbeat);
+  }
+}
+
+/**
+ * Streams the events `run` emits as Server-Sent Events. `done` settles when
+ * `run` finishes, whether or not anyone is still reading the stream.
+ */
+export function streamJobEvents<E>(
+  encode: (event: E) => Uint8Array,
+  run: (emit: (event: E) => void) => Promise<void>
+): { response: Response; done: Promise<void> } {
+  let controller: ReadableStreamDefaultController<Uint8Array> | null = null;
+  const stream = new ReadableStream<Uint8Array>({
+    start(c) {
+      controller = c;
+    },
+    cancel() {
+      // The client went away; keep running and stop writing.
+      controller = null;
+    },
+  });
+
+  const emit = (event: E) => {
+    try {
+      controller?.enqueue(encode(event));
+    } catch {
+      controller = null;
+    }
+  };
+
+  const done = run(emit).finally(() => {
+    try {
+      controller?.close();
+    } catch {
+      // Already closed by the client.
+    }
+  });
+
+  return {
+    response: new Response(stream, {
+      headers: {
+        "Content-Type": "text/event-stream",
+        "Cache-Control": "no-cache, no-transform",
+        Connection: "keep-alive",
+      },
+    }),
+    done,
+  };
+}
+
+/** Runs a job and streams its progress as Server-Sent Events. */
+export function streamMeetingJob(
+  supabase: ServerSupabase,
+  job: MeetingJob,
+  credentials: JobCredentials
+): { response: Response; done: Promise<void> } {
+  return streamJobEvents(encodeJobEvent, (emit) => {
+    emit({ type: "job", jobId: job.id });
+    return runMeetingJob(supabase, job, credentials, emit);
+  });
+}
@@ -0,0 +1,56 @@
+import type { SupabaseClient } from "@supabase/supabase-js";
+import type { Client, ComplianceFlag, Meeting, MeetingOutput, Task } from "@/types/database";
+
+export interface MeetingWorkbenchData {
+  meeting: Meeting;
+  client: Client | null;
+  output: MeetingOutput | null;
+  tasks: Task[];
+  flags: ComplianceFlag[];
+}
+
+type MeetingRow = Meeting & {
+  clients: Client | null;
+  // One-to-one through the unique meeting_id, but tolerate an array shape.
+  meeting_outputs:
+    | (MeetingOutput & { compliance_flags: ComplianceFlag[] | null })
+    | (MeetingOutput & { compliance_flags: ComplianceFlag[] | null })[]
+    | null;
+  tasks: Task[] | null;
+};
+
+/**
+ * Everything the meeting workbench shows, in one nested PostgREST request:
+ * the meeting with its client, output (and the output's compliance flags)
+ * and tasks. Works with both the server and the browser Supabase client.
+ * Returns null if there is no such meeting.
+ */
+export async function loadMeetingWorkbench(
+  supabase: SupabaseClient,
+  meetingId: string
+): Promise<MeetingWorkbenchData | null> {
+  const { data, error } = await supabase
+    .from("meetings")
+    .select("*, clients(*), meeting_outputs(*, compliance_flags(*)), tasks(*)")
+    .eq("id", meetingId)
+    .order("priority", { referencedTable: "tasks" })
+    .order("severity", { referencedTable: "meeting_outputs.compliance_flags" })
+    .maybeSingle();
+
+  // 22P02: the id is not a valid uuid
+  if (error?.code === "22P02") return null;
+  if (error) throw new Error(error.message);
+  if (!data) return null;
+
+  const { clients, meeting_outputs, tasks, ...meeting } = data as MeetingRow;
+  const embedded = Array.isArray(meeting_outputs) ? meeting_outputs[0] : meeting_outputs;
+  const { compliance_flags, ...output } = embedded ?? { compliance_flags: null };
+
+  return {
+    meeting: meeting as Meeting,
+    client: clients,
+    output: embedded ? (output as MeetingOutput) : null,
+    tasks: tasks || [],
+    flags: compliance_flags || [],
+  };
+}
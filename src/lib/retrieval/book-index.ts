@@ -0,0 +1,315 @@
+import { createHash } from "crypto";
+import { after } from "next/server";
+import { embed, embedMany } from "ai";
+import { createEmbeddingProvider, detectProvider, EMBEDDING_MODELS } from "@/lib/ai/provider";
+import { scheduleAICall } from "@/lib/ai/scheduler";
+import { createVectorIndex } from "@/lib/retrieval/vector-index";
+import type { VectorIndex } from "@/lib/retrieval/vector-index";
+import type { createServerSupabaseClient } from "@/lib/supabase/server";
+
+// Semantic index over the client book for chat grounding: client notes,
+// meeting summaries with key topics, and tasks. One index is kept per
+// embedding model in process memory. It is re-synced in the background when
+// the caller's table-version string changes; turns are answered from the
+// previous sync meanwhile, and callers fall back to plain sections until the
+// first sync completes. Embeddings are persisted in `book_embeddings` keyed
+// by record id and text hash, so only records whose text changed are
+// re-embedded, even after a cold start.
+
+type ServerSupabase = Awaited<ReturnType<typeof createServerSupabaseClient>>;
+
+export type BookRecordKind = "client" | "meeting" | "task";
+
+export interface BookRecord {
+  id: string;
+  kind: BookRecordKind;
+  text: string;
+}
+
+export interface RetrievedRecord extends BookRecord {
+  score: number;
+}
+
+const EMBED_BATCH_SIZE = 100;
+// Rows per keyset page; must not exceed PostgREST's max-rows (default 1000).
+const LOAD_PAGE_SIZE = 1000;
+// Long summaries are truncated; the head carries most of the signal.
+const MAX_RECORD_CHARS = 2000;
+// Switch from brute force to IVF once the book is this large.
+const ANN_OPTIONS = { minSize: 5000, nprobe: 8 };
+const UNVERSIONED_TTL_MS = 15_000;
+
+interface BookIndex {
+  vectors: VectorIndex | null;
+  records: Map<string, BookRecord>;
+  version: string | null;
+  syncedAt: number;
+  syncing: Promise<void> | null;
+}
+
+const indexes = new Map<string, BookIndex>();
+
+type ClientName = { name: string } | null;
+
+function record(id: string, kind: BookRecordKind, text: string): BookRecord {
+  return { id: `${kind}:${id}`, kind, text: text.slice(0, MAX_RECORD_CHARS) };
+}
+
+function formatDate(value: string | null): string {
+  return value ? new Date(value).toLocaleDateString() : "no date";
+}
+
+function hashText(text: string): string {
+  return createHash("sha256").update(text).digest("hex");
+}
+
+type PageResult<T> = PromiseLike<{ data: T[] | null; error: { message: string } | null }>;
+
+/** Reads every row of a query in id order, one keyset page at a time. */
+async function selectAll<T extends { id: string }>(
+  page: (lastId: string | null) => PageResult<T>
+): Promise<T[]> {
+  const rows: T[] = [];
+  let lastId: string | null = null;
+  for (;;) {
+    const { data, error } = await page(lastId);
+    if (error) throw new Error(error.message);
+    rows.push(...(data || []));
+    if (!data || data.length < LOAD_PAGE_SIZE) return rows;
+    lastId = data[data.length - 1].id;
+  }
+}
+
+async function loadBookRecords(supabase: ServerSupabase): Promise<BookRecord[]> {
+  const [clients, outputs, tasks] = await Promise.all([
+    selectAll((lastId) => {
+      let query = supabase
+        .from("clients")
+        .select("id, name, aum_value, risk_tolerance, status, notes")
+        .order("id")
+        .limit(LOAD_PAGE_SIZE);
+      if (lastId) query = query.gt("id", lastId);
+      return query;
+    }),
+    selectAll((lastId) => {
+      let query = supabase
+        .from("meeting_outputs")
+        .select("id, summary_text, key_topics, meetings(title, status, created_at, clients(name))")
+        .order("id")
+        .limit(LOAD_PAGE_SIZE);
+      if (lastId) query = query.gt("id", lastId);
+      return query;
+    }),
+    selectAll((lastId) => {
+      let query = supabase
+        .from("tasks")
+        .select("id, description, priority, status, due_date, clients(name)")
+        .order("id")
+        .limit(LOAD_PAGE_SIZE);
+      if (lastId) query = query.gt("id", lastId);
+      return query;
+    }),
+  ]);
+
+  const records: BookRecord[] = [];
+  for (const c of clients) {
+    records.push(
+      record(
+        c.id,
+        "client",
+        `Client ${c.name}: AUM $${Number(c.aum_value).toLocaleString()}, Risk: ${c.risk_tolerance}, Status: ${c.status}` +
+          (c.notes ? `. Notes: ${c.notes}` : "")
+      )
+    );
+  }
+  for (const o of outputs) {
+    const meeting = o.meetings as unknown as {
+      title: string;
+      status: string;
+      created_at: string;
+      clients: ClientName;
+    } | null;
+    if (!o.summary_text && !(o.key_topics as string[] | null)?.length) continue;
+    records.push(
+      record(
+        o.id,
+        "meeting",
+        `Meeting "${meeting?.title ?? "Untitled"}" with ${meeting?.clients?.name || "Unknown"} ` +
+          `(${meeting?.status ?? "unknown"}, ${formatDate(meeting?.created_at ?? null)}). ` +
+          `Topics: ${((o.key_topics as string[] | null) || []).join(", ")}. Summary: ${o.summary_text ?? ""}`
+      )
+    );
+  }
+  for (const t of tasks) {
+    const clientName = (t.clients as unknown as ClientName)?.name || "Unknown";
+    records.push(
+      record(
+        t.id,
+        "task",
+        `Task [${t.priority}, ${t.status}] ${t.description} — for ${clientName} (due ${formatDate(t.due_date)})`
+      )
+    );
+  }
+  return records;
+}
+
+/** Stored embeddings for the given records whose text hash still matches. */
+async function loadStoredEmbeddings(
+  supabase: ServerSupabase,
+  modelId: string,
+  hashes: Map<string, string>
+): Promise<Map<string, number[]>> {
+  const stored = new Map<string, number[]>();
+  const { data, error } = await supabase
+    .from("book_embeddings")
+    .select("record_id, text_hash, embedding")
+    .eq("model", modelId)
+    .in("record_id", [...hashes.keys()]);
+  if (error) {
+    console.warn("Book embedding read failed:", error.message);
+    return stored;
+  }
+  for (const row of data || []) {
+    if (hashes.get(row.record_id) === row.text_hash) {
+      stored.set(row.record_id, row.embedding as number[]);
+    }
+  }
+  return stored;
+}
+
+async function syncIndex(
+  index: BookIndex,
+  supabase: ServerSupabase,
+  apiKey: string,
+  modelId: string,
+  model: ReturnType<typeof createEmbeddingProvider>,
+  version: string
+): Promise<void> {
+  const records = await loadBookRecords(supabase);
+  const current = new Set(records.map((r) => r.id));
+  const removed: string[] = [];
+  for (const id of index.records.keys()) {
+    if (current.has(id)) continue;
+    index.records.delete(id);
+    index.vectors?.remove(id);
+    removed.push(id);
+  }
+  for (let i = 0; i < removed.length; i += EMBED_BATCH_SIZE) {
+    const { error } = await supabase
+      .from("book_embeddings")
+      .delete()
+      .eq("model", modelId)
+      .in("record_id", removed.slice(i, i + EMBED_BATCH_SIZE));
+    if (error) console.warn("Book embedding delete failed:", error.message);
+  }
+
+  const changed = records.filter((r) => index.records.get(r.id)?.text !== r.text);
+  for (let i = 0; i < changed.length; i += EMBED_BATCH_SIZE) {
+    const batch = changed.slice(i, i + EMBED_BATCH_SIZE);
+    const hashes = new Map(batch.map((r) => [r.id, hashText(r.text)]));
+    const stored = await loadStoredEmbeddings(supabase, modelId, hashes);
+    const missing = batch.filter((r) => !stored.has(r.id));
+
+    if (missing.length > 0) {
+      const { embeddings } = await scheduleAICall(apiKey, () =>
+        embedMany({ model, values: missing.map((r) => r.text) })
+      );
+      missing.forEach((r, j) => stored.set(r.id, embeddings[j]));
+      const { error } = await supabase.from("book_embeddings").upsert(
+        missing.map((r, j) => ({
+          model: modelId,
+          record_id: r.id,
+          text_hash: hashes.get(r.id),
+          embedding: embeddings[j],
+          updated_at: new Date().toISOString(),
+        }))
+      );
+      if (error) console.warn("Book embedding write failed:", error.message);
+    }
+
+    for (const r of batch) {
+      const embedding = stored.get(r.id)!;
+      if (!index.vectors) {
+        index.vectors = createVectorIndex(embedding.length, ANN_OPTIONS);
+      }
+      index.vectors.upsert(r.id, embedding);
+      index.records.set(r.id, r);
+    }
+  }
+
+  // Only marked synced once every record is embedded; a failed sync is
+  // retried on the next turn and keeps the batches that did succeed.
+  index.version = version;
+  index.syncedAt = Date.now();
+}
+
+function isFresh(index: BookIndex, version: string | null): boolean {
+  if (version === null) {
+    return index.version !== null && Date.now() - index.syncedAt < UNVERSIONED_TTL_MS;
+  }
+  return index.version === version;
+}
+
+/**
+ * Returns the `k` book records most similar to `query`. `version` identifies
+ * the current state of the source tables (null when unknown); when it differs
+ * from the last sync a re-sync starts in the background and this turn
+ * searches the previous sync. Throws if no sync has completed yet, so the
+ * caller can fall back to its non-retrieval context.
+ */
+export async function retrieveBookRecords(
+  supabase: ServerSupabase,
+  {
+    apiKey,
+    model,
+    query,
+    version,
+    k,
+  }: { apiKey: string; model: string; query: string; version: string | null; k: number }
+): Promise<RetrievedRecord[]> {
+  const embeddingModelId = EMBEDDING_MODELS[detectProvider(model)];
+  const embeddingModel = createEmbeddingProvider(apiKey, model);
+  let index = indexes.get(embeddingModelId);
+  if (!index) {
+    index = { vectors: null, records: new Map(), version: null, syncedAt: 0, syncing: null };
+    indexes.set(embeddingModelId, index);
+  }
+
+  const target = index;
+  if (!isFresh(target, version) && !target.syncing) {
+    const syncing = syncIndex(
+      target,
+      supabase,
+      apiKey,
+      embeddingModelId,
+      embeddingModel,
+      version ?? "unversioned"
+    )
+      .catch((error) => {
+        console.warn("Book index sync failed:", error instanceof Error ? error.message : error);
+      })
+      .finally(() => {
+        target.syncing = null;
+      });
+    target.syncing = syncing;
+    // Keep the sync running after this turn's response has been sent.
+    after(() => syncing);
+  }
+  if (target.version === null) {
+    throw new Error("Book index is still being built");
+  }
+
+  const { embedding } = await scheduleAICall(
+    apiKey,
+    () => embed({ model: embeddingModel, value: query }),
+    { priority: "interactive" }
+  );
+
+  if (!target.vectors) return [];
+  const results: RetrievedRecord[] = [];
+  for (const hit of target.vectors.search(embedding, k)) {
+    const found = target.records.get(hit.id);
+    if (found) results.push({ ...found, score: hit.score });
+  }
+  return results;
+}
@@ -0,0 +1,231 @@
+// In-process vector index for cosine-similarity search. Vectors are
+// normalized on insert and stored row-major in one growable Float32Array, so
+// a brute-force scan is a tight dot-product loop over contiguous memory.
+//
+// Above `ann.minSize` vectors an IVF (inverted file) index is layered on top:
+// k-means centroids partition the rows into lists and a query only scans the
+// `nprobe` lists closest to it. The IVF is rebuilt lazily once the row count
+// has drifted far from the size it was trained on.
+
+export interface VectorSearchHit {
+  id: string;
+  score: number;
+}
+
+export interface AnnOptions {
+  /** Use the IVF index once the index holds at least this many vectors. */
+  minSize: number;
+  /** Number of closest lists scanned per query. */
+  nprobe: number;
+}
+
+export interface VectorIndex {
+  readonly dimensions: number;
+  readonly size: number;
+  has: (id: string) => boolean;
+  upsert: (id: string, vector: ArrayLike<number>) => void;
+  remove: (id: string) => void;
+  search: (query: ArrayLike<number>, k: number) => VectorSearchHit[];
+}
+
+interface IvfState {
+  centroids: Float32Array;
+  lists: Set<number>[];
+  listOfRow: Int32Array;
+  trainedSize: number;
+}
+
+const KMEANS_ITERATIONS = 8;
+const KMEANS_SAMPLE = 4096;
+
+function normalizeInto(target: Float32Array, offset: number, vector: ArrayLike<number>) {
+  let norm = 0;
+  for (let i = 0; i < vector.length; i++) norm += vector[i] * vector[i];
+  const scale = norm > 0 ? 1 / Math.sqrt(norm) : 0;
+  for (let i = 0; i < vector.length; i++) target[offset + i] = vector[i] * scale;
+}
+
+function dot(a: Float32Array, aOffset: number, b: Float32Array, bOffset: number, dims: number) {
+  let sum = 0;
+  for (let i = 0; i < dims; i++) sum += a[aOffset + i] * b[bOffset + i];
+  return sum;
+}
+
+/** Keeps the k best hits in descending score order. */
+function pushTopK(hits: VectorSearchHit[], k: number, id: string, score: number) {
+  if (hits.length === k && score <= hits[k - 1].score) return;
+  let i = hits.length < k ? hits.length : k - 1;
+  while (i > 0 && hits[i - 1].score < score) {
+    if (i < k) hits[i] = hits[i - 1];
+    i--;
+  }
+  hits[i] = { id, score };
+}
+
+export function createVectorIndex(dimensions: number, ann?: AnnOptions): VectorIndex {
+  let capacity = 256;
+  let data = new Float32Array(capacity * dimensions);
+  const ids: string[] = [];
+  const rowOf = new Map<string, number>();
+  const query = new Float32Array(dimensions);
+  let ivf: IvfState | null = null;
+
+  function ensureCapacity(rows: number) {
+    if (rows <= capacity) return;
+    while (capacity < rows) capacity *= 2;
+    const grown = new Float32Array(capacity * dimensions);
+    grown.set(data);
+    data = grown;
+    if (ivf) {
+      const listOfRow = new Int32Array(capacity).fill(-1);
+      listOfRow.set(ivf.listOfRow);
+      ivf.listOfRow = listOfRow;
+    }
+  }
+
+  function nearestCentroid(source: Float32Array, offset: number, state: IvfState) {
+    let best = 0;
+    let bestScore = -Infinity;
+    for (let c = 0; c < state.lists.length; c++) {
+      const score = dot(state.centroids, c * dimensions, source, offset, dimensions);
+      if (score > bestScore) {
+        bestScore = score;
+        best = c;
+      }
+    }
+    return best;
+  }
+
+  function assign(row: number) {
+    if (!ivf) return;
+    const list = nearestCentroid(data, row * dimensions, ivf);
+    ivf.lists[list].add(row);
+    ivf.listOfRow[row] = list;
+  }
+
+  function unassign(row: number) {
+    if (!ivf) return;
+    const list = ivf.listOfRow[row];
+    if (list >= 0) ivf.lists[list].delete(row);
+    ivf.listOfRow[row] = -1;
+  }
+
+  /** Spherical k-means over a sample of rows. */
+  function trainIvf(): IvfState {
+    const rows = ids.length;
+    const listCount = Math.max(1, Math.round(Math.sqrt(rows)));
+    const centroids = new Float32Array(listCount * dimensions);
+    const stride = Math.max(1, Math.floor(rows / Math.min(rows, KMEANS_SAMPLE)));
+    const sample: number[] = [];
+    for (let r = 0; r < rows; r += stride) sample.push(r);
+    for (let c = 0; c < listCount; c++) {
+      const row = sample[Math.floor((c * sample.length) / listCount)];
+      centroids.set(data.subarray(row * dimensions, (row + 1) * dimensions), c * dimensions);
+    }
+
+    const state: IvfState = {
+      centroids,
+      lists: Array.from({ length: listCount }, () => new Set<number>()),
+      listOfRow: new Int32Array(capacity).fill(-1),
+      trainedSize: rows,
+    };
+    const sums = new Float32Array(listCount * dimensions);
+    for (let iter = 0; iter < KMEANS_ITERATIONS; iter++) {
+      sums.fill(0);
+      for (const row of sample) {
+        const c = nearestCentroid(data, row * dimensions, state);
+        for (let i = 0; i < dimensions; i++) sums[c * dimensions + i] += data[row * dimensions + i];
+      }
+      for (let c = 0; c < listCount; c++) {
+        // Empty clusters keep their previous centroid.
+        let norm = 0;
+        for (let i = 0; i < dimensions; i++) norm += sums[c * dimensions + i] ** 2;
+        if (norm > 0) normalizeInto(centroids, c * dimensions, sums.subarray(c * dimensions, (c + 1) * dimensions));
+      }
+    }
+    return state;
+  }
+
+  function ensureIvf(): IvfState | null {
+    if (!ann || ids.length < ann.minSize) {
+      ivf = null;
+      return null;
+    }
+    const drift = ivf ? Math.abs(ids.length - ivf.trainedSize) / ivf.trainedSize : 1;
+    if (!ivf || drift > 0.5) {
+      ivf = trainIvf();
+      for (let row = 0; row < ids.length; row++) assign(row);
+    }
+    return ivf;
+  }
+
+  function scanRow(row: number, hits: VectorSearchHit[], k: number) {
+    pushTopK(hits, k, ids[row], dot(data, row * dimensions, query, 0, dimensions));
+  }
+
+  return {
+    dimensions,
+    get size() {
+      return ids.length;
+    },
+
+    has(id) {
+      return rowOf.has(id);
+    },
+
+    upsert(id, vector) {
+      if (vector.length !== dimensions) {
+        throw new Error(`Expected a ${dimensions}-dimensional vector, got ${vector.length}`);
+      }
+      let row = rowOf.get(id);
+      if (row === undefined) {
+        row = ids.length;
+        ensureCapacity(row + 1);
+        ids.push(id);
+        rowOf.set(id, row);
+      } else {
+        unassign(row);
+      }
+      normalizeInto(data, row * dimensions, vector);
+      assign(row);
+    },
+
+    remove(id) {
+      const row = rowOf.get(id);
+      if (row === undefined) return;
+      const last = ids.length - 1;
+      unassign(row);
+      // Move the last row into the gap to keep storage contiguous.
+      if (row !== last) {
+        unassign(last);
+        data.copyWithin(row * dimensions, last * dimensions, (last + 1) * dimensions);
+        ids[row] = ids[last];
+        rowOf.set(ids[row], row);
+        assign(row);
+      }
+      ids.pop();
+      rowOf.delete(id);
+    },
+
+    search(vector, k) {
+      const hits: VectorSearchHit[] = [];
+      if (k <= 0 || ids.length === 0) return hits;
+      normalizeInto(query, 0, vector);
+
+      const state = ensureIvf();
+      if (!state || !ann) {
+        for (let row = 0; row < ids.length; row++) scanRow(row, hits, k);
+        return hits;
+      }
+
+      const probes: VectorSearchHit[] = [];
+      for (let c = 0; c < state.lists.length; c++) {
+        pushTopK(probes, ann.nprobe, String(c), dot(state.centroids, c * dimensions, query, 0, dimensions));
+      }
+      for (const probe of probes) {
+        for (const row of state.lists[Number(probe.id)]) scanRow(row, hits, k);
+      }
+      return hits;
+    },
+  };
+}
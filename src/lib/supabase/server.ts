@@ -1,4 +1,5 @@
 import { createServerClient } from "@supabase/ssr";
+import { createClient } from "@supabase/supabase-js";
 import { cookies } from "next/headers";
 
 export async function createServerSupabaseClient() {
@@ -26,3 +27,15 @@ export async function createServerSupabaseClient() {
     }
   );
 }
+
+/**
+ * Cookie-less client for reads cached across requests (unstable_cache may
+ * not touch cookies). Only for data that is the same for every visitor.
+ */
+export function createStaticSupabaseClient() {
+  return createClient(
+    process.env.NEXT_PUBLIC_SUPABASE_URL!,
+    process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
+    { auth: { persistSession: false } }
+  );
+}
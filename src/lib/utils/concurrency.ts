@@ -0,0 +1,37 @@
+/**
+ * Maps `items` through `fn` with at most `limit` calls in flight. Results keep
+ * the input order; the first rejection rejects the whole call once the
+ * in-flight work has settled, and no new items are started after it.
+ */
+export async function mapWithConcurrency<T, R>(
+  items: readonly T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  let failed = false;
+
+  async function worker() {
+    while (!failed && next < items.length) {
+      const index = next++;
+      try {
+        results[index] = await fn(items[index], index);
+      } catch (error) {
+        failed = true;
+        throw error;
+      }
+    }
+  }
+
+  const workers = Array.from(
+    { length: Math.max(1, Math.min(limit, items.length)) },
+    () => worker()
+  );
+  const settled = await Promise.allSettled(workers);
+  const rejection = settled.find(
+    (s): s is PromiseRejectedResult => s.status === "rejected"
+  );
+  if (rejection) throw rejection.reason;
+  return results;
+}
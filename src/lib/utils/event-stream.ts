@@ -0,0 +1,43 @@
+// Minimal Server-Sent Events framing for our JSON event protocols: each event
+// is one `data: <json>` line followed by a blank line.
+
+const encoder = new TextEncoder();
+
+export function encodeEvent(event: unknown): Uint8Array {
+  return encoder.encode(`data: ${JSON.stringify(event)}\n\n`);
+}
+
+function parseFrame<T>(frame: string, onEvent: (event: T) => void) {
+  for (const line of frame.split("\n")) {
+    if (line.startsWith("data: ")) onEvent(JSON.parse(line.slice(6)) as T);
+  }
+}
+
+/**
+ * Reads an event stream until it closes, calling `onEvent` per event. Parsing
+ * is incremental: each chunk is scanned once and only the unterminated tail
+ * of the last frame is carried over.
+ */
+export async function readEventStream<T>(
+  body: ReadableStream<Uint8Array>,
+  onEvent: (event: T) => void
+): Promise<void> {
+  const reader = body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = "";
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+
+    // A boundary can only end in the new text (or straddle the old tail).
+    let searchFrom = Math.max(0, buffer.length - 1);
+    buffer += value;
+    let start = 0;
+    let boundary: number;
+    while ((boundary = buffer.indexOf("\n\n", searchFrom)) !== -1) {
+      parseFrame(buffer.slice(start, boundary), onEvent);
+      start = searchFrom = boundary + 2;
+    }
+    buffer = buffer.slice(start);
+  }
+  if (buffer.trim()) parseFrame(buffer, onEvent);
+}
@@ -0,0 +1,174 @@
+import type { PIIEntity, RedactionResult } from "@/types/database";
+import { applyRedactions, scanPII, toPIIEntity } from "@/lib/utils/pii-redaction";
+
+// RFC 5321 caps an email address at 254 characters; every other PII pattern
+// is far shorter, so no match can reach further than this from an edit.
+export const MAX_PII_MATCH_LENGTH = 254;
+
+export interface IncrementalRedaction {
+  text: string;
+  entities: PIIEntity[];
+  /** Offset of the first character of every line, ascending. */
+  lineStarts: number[];
+}
+
+function collectLineStarts(
+  text: string,
+  from: number,
+  to: number,
+  into: number[]
+): void {
+  let i = text.indexOf("\n", from);
+  while (i !== -1 && i < to) {
+    into.push(i + 1);
+    i = text.indexOf("\n", i + 1);
+  }
+}
+
+/** Index of the last entry in `sorted` that is <= `value`. */
+function floorIndex(sorted: number[], value: number): number {
+  let lo = 0;
+  let hi = sorted.length - 1;
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >> 1;
+    if (sorted[mid] <= value) lo = mid;
+    else hi = mid - 1;
+  }
+  return lo;
+}
+
+const LETTER = /[a-z]/i;
+const WHITESPACE = /\s/;
+
+/**
+ * Whether the scan can start at `i` as if from the start of the text: `i`
+ * follows whitespace between two letters, which no pattern matches across
+ * (only SSN_PARTIAL spans words, and only before "in" or "four").
+ */
+function isSafeSplit(text: string, i: number): boolean {
+  return (
+    WHITESPACE.test(text[i - 1]) &&
+    LETTER.test(text[i - 2]) &&
+    LETTER.test(text[i]) &&
+    !/^(?:in|four)\b/i.test(text.slice(i, i + 5))
+  );
+}
+
+/**
+ * The nearest safe split at or before (step -1) or after (step 1) `index`,
+ * at most MAX_PII_MATCH_LENGTH characters away, or -1 if there is none.
+ */
+function nearestSafeSplit(text: string, index: number, step: -1 | 1): number {
+  for (let n = 0, i = index; n < MAX_PII_MATCH_LENGTH; n++, i += step) {
+    if (i < 2 || i >= text.length) return -1;
+    if (isSafeSplit(text, i)) return i;
+  }
+  return -1;
+}
+
+export function createIncrementalRedaction(text: string): IncrementalRedaction {
+  const lineStarts = [0];
+  collectLineStarts(text, 0, text.length, lineStarts);
+  const entities = scanPII(text).map((m) => toPIIEntity(text, m));
+  return { text, entities, lineStarts };
+}
+
+/**
+ * Brings `prev` up to date with `text`, rescanning only the lines around the
+ * edited range (widened by MAX_PII_MATCH_LENGTH on each side, and capped near
+ * that window on long lines) and shifting the offsets of every entity after it.
+ */
+export function updateIncrementalRedaction(
+  prev: IncrementalRedaction,
+  text: string
+): IncrementalRedaction {
+  if (text === prev.text) return prev;
+  const old = prev.text;
+
+  // Locate the edit as the span between the common prefix and suffix.
+  const maxShared = Math.min(old.length, text.length);
+  let editStart = 0;
+  while (editStart < maxShared && old[editStart] === text[editStart]) {
+    editStart++;
+  }
+  let shared = 0;
+  while (
+    shared < maxShared - editStart &&
+    old[old.length - 1 - shared] === text[text.length - 1 - shared]
+  ) {
+    shared++;
+  }
+  const oldEnd = old.length - shared;
+  const newEnd = text.length - shared;
+  const delta = newEnd - oldEnd;
+
+  // Patch the line index: keep lines before the edit, index the inserted
+  // text, shift everything after.
+  const lineStarts: number[] = [];
+  let li = 0;
+  while (li < prev.lineStarts.length && prev.lineStarts[li] <= editStart) {
+    lineStarts.push(prev.lineStarts[li++]);
+  }
+  collectLineStarts(text, editStart, newEnd, lineStarts);
+  while (li < prev.lineStarts.length && prev.lineStarts[li] <= oldEnd) li++;
+  while (li < prev.lineStarts.length) {
+    lineStarts.push(prev.lineStarts[li++] + delta);
+  }
+
+  // Rescan whole lines around the edit so no match is cut mid-token. Where
+  // the line reaches further than the match window (a pasted or ASR
+  // transcript is often one line), split it between two words near the
+  // window edge instead.
+  const windowStart = Math.max(0, editStart - MAX_PII_MATCH_LENGTH);
+  const windowEnd = Math.min(text.length, newEnd + MAX_PII_MATCH_LENGTH);
+  let from = lineStarts[floorIndex(lineStarts, windowStart)];
+  if (windowStart - from > MAX_PII_MATCH_LENGTH) {
+    const split = nearestSafeSplit(text, windowStart, -1);
+    if (split !== -1) from = split;
+  }
+  const toLine = floorIndex(lineStarts, windowEnd);
+  let to = toLine + 1 < lineStarts.length ? lineStarts[toLine + 1] : text.length;
+  if (to - windowEnd > MAX_PII_MATCH_LENGTH) {
+    const split = nearestSafeSplit(text, windowEnd, 1);
+    if (split !== -1) to = split;
+  }
+
+  if (to - from > text.length / 2) {
+    const entities = scanPII(text).map((m) => toPIIEntity(text, m));
+    return { text, entities, lineStarts };
+  }
+
+  const head: PIIEntity[] = [];
+  const tail: PIIEntity[] = [];
+  for (const e of prev.entities) {
+    if (e.startIndex >= oldEnd) {
+      const startIndex = e.startIndex + delta;
+      const endIndex = e.endIndex + delta;
+      if (startIndex >= to) tail.push({ ...e, startIndex, endIndex });
+      else if (endIndex > to) to = endIndex;
+    } else if (e.endIndex <= from) {
+      head.push(e);
+    } else if (e.startIndex < from) {
+      from = e.startIndex;
+    }
+  }
+
+  const rescanned = scanPII(text, from, to).map((m) => toPIIEntity(text, m));
+  const rescannedEnd =
+    rescanned.length > 0 ? rescanned[rescanned.length - 1].endIndex : to;
+  let skip = 0;
+  while (skip < tail.length && tail[skip].startIndex < rescannedEnd) skip++;
+
+  return {
+    text,
+    entities: head.concat(rescanned, skip > 0 ? tail.slice(skip) : tail),
+    lineStarts,
+  };
+}
+
+export function toRedactionResult(state: IncrementalRedaction): RedactionResult {
+  return {
+    redactedText: applyRedactions(state.text, state.entities),
+    entities: state.entities,
+  };
+}
@@ -34,65 +34,165 @@ const PII_PATTERNS: PIIPattern[] = [
   },
 ];
 
-export function redactPII(text: string): RedactionResult {
-  const entities: PIIEntity[] = [];
-  let redactedText = text;
-  let offset = 0;
-
-  const allMatches: {
-    type: PIIEntity["type"];
-    match: RegExpExecArray;
-    label: string;
-  }[] = [];
-
-  for (const pattern of PII_PATTERNS) {
-    const regex = new RegExp(pattern.regex.source, pattern.regex.flags);
-    let match: RegExpExecArray | null;
-    while ((match = regex.exec(text)) !== null) {
-      allMatches.push({ type: pattern.type, match, label: pattern.label });
+/** A PII hit in the scanned text; `pattern` indexes into PII_PATTERNS. */
+export interface PIIMatch {
+  pattern: number;
+  start: number;
+  end: number;
+}
+
+// All patterns compiled once into a single alternation. Each pattern gets a
+// named group so the winning alternative can be identified without rescanning.
+// The `i` flag only matters for SSN_PARTIAL; every other pattern either has no
+// letters or already lists both cases.
+const COMBINED_REGEX = new RegExp(
+  PII_PATTERNS.map((p, i) => `(?<p${i}>${p.regex.source})`).join("|"),
+  "gi"
+);
+
+// Anchored per-pattern matchers, used only around accepted matches.
+const STICKY_REGEXES = PII_PATTERNS.map(
+  (p) => new RegExp(p.regex.source, p.regex.flags.replace("g", "") + "y")
+);
+
+function matchAt(pattern: number, text: string, index: number): number {
+  const regex = STICKY_REGEXES[pattern];
+  regex.lastIndex = index;
+  const match = regex.exec(text);
+  return match ? index + match[0].length : -1;
+}
+
+/**
+ * Scans `text` once and returns non-overlapping PII matches sorted by start.
+ *
+ * Conflict resolution mirrors running every pattern independently and keeping
+ * the earliest match (ties go to the earlier pattern): a pattern whose own
+ * match straddles an accepted match cannot match again until that match ends,
+ * which `resumeAt` tracks.
+ *
+ * `from`/`to` limit the scan to matches starting in that range while keeping
+ * the surrounding text visible to word-boundary checks.
+ */
+export function scanPII(
+  text: string,
+  from = 0,
+  to = text.length
+): PIIMatch[] {
+  const matches: PIIMatch[] = [];
+  const resumeAt = new Array<number>(PII_PATTERNS.length).fill(from);
+  const combined = COMBINED_REGEX;
+  combined.lastIndex = from;
+
+  let match: RegExpExecArray | null;
+  while ((match = combined.exec(text)) !== null) {
+    const start = match.index;
+    if (start >= to) break;
+    const groups = match.groups!;
+    let pattern = 0;
+    while (groups[`p${pattern}`] === undefined) pattern++;
+    let end = start + match[0].length;
+
+    if (start < resumeAt[pattern]) {
+      // The winning alternative is still inside its own rejected match — try
+      // the lower-priority patterns at this position instead.
+      const blocked = pattern;
+      pattern = -1;
+      for (let p = blocked + 1; p < PII_PATTERNS.length; p++) {
+        if (start < resumeAt[p]) continue;
+        const candidateEnd = matchAt(p, text, start);
+        if (candidateEnd !== -1) {
+          pattern = p;
+          end = candidateEnd;
+          break;
+        }
+      }
+      if (pattern === -1) {
+        combined.lastIndex = start + 1;
+        continue;
+      }
     }
-  }
 
-  // Sort by position to handle offsets correctly
-  allMatches.sort((a, b) => a.match.index - b.match.index);
-
-  // Deduplicate overlapping matches
-  const deduplicated: typeof allMatches = [];
-  for (const item of allMatches) {
-    const start = item.match.index;
-    const end = start + item.match[0].length;
-    const overlaps = deduplicated.some((existing) => {
-      const eStart = existing.match.index;
-      const eEnd = eStart + existing.match[0].length;
-      return start < eEnd && end > eStart;
-    });
-    if (!overlaps) {
-      deduplicated.push(item);
+    matches.push({ pattern, start, end });
+
+    // Walk every other pattern's own match sequence across [start, end) so a
+    // match that runs past `end` blocks that pattern until it finishes.
+    for (let p = 0; p < PII_PATTERNS.length; p++) {
+      if (p === pattern) continue;
+      let pos = Math.max(start, resumeAt[p]);
+      while (pos < end) {
+        let next = -1;
+        for (let i = pos; i < end && next === -1; i++) {
+          const candidateEnd = matchAt(p, text, i);
+          if (candidateEnd !== -1) next = candidateEnd;
+        }
+        if (next === -1) break;
+        pos = next;
+      }
+      resumeAt[p] = Math.max(resumeAt[p], pos);
     }
+
+    combined.lastIndex = end;
   }
 
-  for (const { type, match, label } of deduplicated) {
-    const original = match[0];
-    const replacement = `[REDACTED_${label}]`;
-    const startIndex = match.index + offset;
-
-    entities.push({
-      type,
-      original,
-      replacement,
-      startIndex: match.index,
-      endIndex: match.index + original.length,
-    });
-
-    redactedText =
-      redactedText.slice(0, startIndex) +
-      replacement +
-      redactedText.slice(startIndex + original.length);
-
-    offset += replacement.length - original.length;
+  return matches;
+}
+
+/** Converts a scanner match into the entity shape stored on meetings. */
+export function toPIIEntity(text: string, match: PIIMatch): PIIEntity {
+  const { type, label } = PII_PATTERNS[match.pattern];
+  return {
+    type,
+    original: text.slice(match.start, match.end),
+    replacement: `[REDACTED_${label}]`,
+    startIndex: match.start,
+    endIndex: match.end,
+  };
+}
+
+const PATTERN_BY_REPLACEMENT = new Map(
+  PII_PATTERNS.map((p, i) => [`[REDACTED_${p.label}]`, i])
+);
+
+/** Packs entities as [pattern, start, end] triples for transfer between threads. */
+export function packEntities(entities: PIIEntity[]): Int32Array {
+  const packed = new Int32Array(entities.length * 3);
+  entities.forEach((e, i) => {
+    packed[i * 3] = PATTERN_BY_REPLACEMENT.get(e.replacement) ?? 0;
+    packed[i * 3 + 1] = e.startIndex;
+    packed[i * 3 + 2] = e.endIndex;
+  });
+  return packed;
+}
+
+export function unpackEntities(text: string, packed: Int32Array): PIIEntity[] {
+  const entities: PIIEntity[] = [];
+  for (let i = 0; i < packed.length; i += 3) {
+    entities.push(
+      toPIIEntity(text, {
+        pattern: packed[i],
+        start: packed[i + 1],
+        end: packed[i + 2],
+      })
+    );
+  }
+  return entities;
+}
+
+/** Builds the redacted string for sorted, non-overlapping entities. */
+export function applyRedactions(text: string, entities: PIIEntity[]): string {
+  const parts: string[] = [];
+  let cursor = 0;
+  for (const entity of entities) {
+    parts.push(text.slice(cursor, entity.startIndex), entity.replacement);
+    cursor = entity.endIndex;
   }
+  parts.push(text.slice(cursor));
+  return parts.join("");
+}
 
-  return { redactedText, entities };
+export function redactPII(text: string): RedactionResult {
+  const entities = scanPII(text).map((m) => toPIIEntity(text, m));
+  return { redactedText: applyRedactions(text, entities), entities };
 }
 
 export function getPIISummary(entities: PIIEntity[]): string {
@@ -0,0 +1,39 @@
+/**
+ * Reads the request body chunk by chunk, giving up as soon as it exceeds
+ * `limit`. When the client declares a Content-Length the bytes are copied
+ * straight into one preallocated buffer, so only a single copy is ever held.
+ */
+export async function readBodyWithLimit(
+  req: Request,
+  limit: number
+): Promise<Uint8Array | null> {
+  const declared = Number(req.headers.get("content-length")) || 0;
+  if (declared > limit) return null;
+  if (!req.body) return new Uint8Array(0);
+
+  const reader = req.body.getReader();
+  const buffer = declared > 0 ? new Uint8Array(declared) : null;
+  const chunks: Uint8Array[] = [];
+  let received = 0;
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    if (received + value.byteLength > (buffer ? buffer.byteLength : limit)) {
+      await reader.cancel();
+      return null;
+    }
+    if (buffer) buffer.set(value, received);
+    else chunks.push(value);
+    received += value.byteLength;
+  }
+
+  if (buffer) return buffer.subarray(0, received);
+  const bytes = new Uint8Array(received);
+  let offset = 0;
+  for (const chunk of chunks) {
+    bytes.set(chunk, offset);
+    offset += chunk.byteLength;
+  }
+  return bytes;
+}
@@ -0,0 +1,26 @@
+export interface RetryOptions {
+  /** Total attempts, including the first. */
+  attempts: number;
+  baseDelayMs: number;
+  /** Return false to fail fast (e.g. quota or invalid-key errors). */
+  shouldRetry?: (error: unknown) => boolean;
+}
+
+/**
+ * Runs `fn` until it succeeds or `attempts` are used up, waiting with
+ * exponential backoff plus jitter between attempts.
+ */
+export async function withRetry<T>(
+  fn: (attempt: number) => Promise<T>,
+  { attempts, baseDelayMs, shouldRetry = () => true }: RetryOptions
+): Promise<T> {
+  for (let attempt = 1; ; attempt++) {
+    try {
+      return await fn(attempt);
+    } catch (error) {
+      if (attempt >= attempts || !shouldRetry(error)) throw error;
+      const delay = baseDelayMs * 2 ** (attempt - 1);
+      await new Promise((r) => setTimeout(r, delay / 2 + Math.random() * delay));
+    }
+  }
+}
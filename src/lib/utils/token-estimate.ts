@@ -0,0 +1,21 @@
+// Local token estimate for budgeting chat requests without a tokenizer
+// download. Approximates BPE tokenizers (cl100k / Gemini SentencePiece): a
+// word costs one token per ~4 characters and each punctuation mark or symbol
+// costs one. It errs slightly high on English prose, which is the safe side
+// for a budget.
+
+const PIECE = /[A-Za-z0-9]+|[^\sA-Za-z0-9]/g;
+// Per-message framing (role markers, separators) added by chat formats.
+export const MESSAGE_OVERHEAD_TOKENS = 4;
+
+export function estimateTokens(text: string): number {
+  let tokens = 0;
+  for (const piece of text.match(PIECE) || []) {
+    tokens += piece.length > 1 ? Math.ceil(piece.length / 4) : 1;
+  }
+  return tokens;
+}
+
+export function estimateMessageTokens(message: { content: string }): number {
+  return estimateTokens(message.content) + MESSAGE_OVERHEAD_TOKENS;
+}
@@ -0,0 +1,82 @@
+// Overlapping audio windows produce transcripts whose edges repeat the same
+// speech. Stitching finds the longest run of matching words between the end
+// of one part and the start of the next and keeps it only once.
+
+const MIN_OVERLAP_WORDS = 4;
+const DEFAULT_SEARCH_WORDS = 150;
+
+interface Token {
+  word: string;
+  start: number;
+  end: number;
+}
+
+function tokenize(text: string, from = 0): Token[] {
+  const tokens: Token[] = [];
+  const regex = /\S+/g;
+  regex.lastIndex = from;
+  let match: RegExpExecArray | null;
+  while ((match = regex.exec(text)) !== null) {
+    const word = match[0].toLowerCase().replace(/[^a-z0-9]/g, "");
+    if (word) {
+      tokens.push({ word, start: match.index, end: match.index + match[0].length });
+    }
+  }
+  return tokens;
+}
+
+/** Longest common run of words between `a` and `b` (classic DP, O(a·b)). */
+function longestCommonRun(a: Token[], b: Token[]) {
+  let best = { length: 0, aEnd: 0, bEnd: 0 };
+  let prev = new Array<number>(b.length + 1).fill(0);
+  for (let i = 1; i <= a.length; i++) {
+    const row = new Array<number>(b.length + 1).fill(0);
+    for (let j = 1; j <= b.length; j++) {
+      if (a[i - 1].word === b[j - 1].word) {
+        row[j] = prev[j - 1] + 1;
+        if (row[j] > best.length) best = { length: row[j], aEnd: i, bEnd: j };
+      }
+    }
+    prev = row;
+  }
+  return best;
+}
+
+/**
+ * Joins transcripts of consecutive overlapping windows. Only the last/first
+ * `searchWords` words of each pair are compared, which should cover the
+ * overlap; pairs without a run of at least MIN_OVERLAP_WORDS are joined as-is.
+ */
+export function stitchTranscripts(
+  parts: string[],
+  searchWords = DEFAULT_SEARCH_WORDS
+): string {
+  const nonEmpty = parts.map((p) => p.trim()).filter(Boolean);
+  if (nonEmpty.length === 0) return "";
+
+  let stitched = nonEmpty[0];
+  for (let i = 1; i < nonEmpty.length; i++) {
+    const next = nonEmpty[i];
+    // Only the end of the running transcript can overlap; skip tokenizing
+    // the rest of it.
+    const tailFrom = Math.max(0, stitched.length - searchWords * 24);
+    const tail = tokenize(stitched, tailFrom).slice(-searchWords);
+    const nextTokens = tokenize(next);
+    const head = nextTokens.slice(0, searchWords);
+    const run = longestCommonRun(tail, head);
+
+    if (run.length < MIN_OVERLAP_WORDS) {
+      stitched = `${stitched}\n\n${next}`;
+      continue;
+    }
+
+    // Keep the earlier part through the shared run, then continue the later
+    // part right after it.
+    const cutA = tail[run.aEnd - 1].end;
+    const cutB =
+      run.bEnd < nextTokens.length ? nextTokens[run.bEnd].start : next.length;
+    const rest = next.slice(cutB).trimStart();
+    stitched = rest ? `${stitched.slice(0, cutA)} ${rest}` : stitched.slice(0, cutA);
+  }
+  return stitched;
+}
@@ -0,0 +1,85 @@
+// Minimal zip reader for transcript imports. Reads the central directory and
+// inflates entries with the browser's DecompressionStream, so no archive
+// library is bundled. Supports stored and deflated entries; zip64 and
+// encrypted archives are rejected.
+
+export interface ZipEntry {
+  path: string;
+  size: number;
+  /** Decompresses the entry. */
+  read: () => Promise<Blob>;
+}
+
+const EOCD_SIGNATURE = 0x06054b50;
+const CENTRAL_SIGNATURE = 0x02014b50;
+const LOCAL_SIGNATURE = 0x04034b50;
+// End-of-central-directory record plus the longest possible comment.
+const EOCD_SEARCH_BYTES = 22 + 0xffff;
+
+const decoder = new TextDecoder();
+
+async function view(blob: Blob, start: number, end: number): Promise<DataView> {
+  return new DataView(await blob.slice(start, end).arrayBuffer());
+}
+
+export async function readZipEntries(file: Blob): Promise<ZipEntry[]> {
+  const tailStart = Math.max(0, file.size - EOCD_SEARCH_BYTES);
+  const tail = await view(file, tailStart, file.size);
+  let eocd = -1;
+  for (let i = tail.byteLength - 22; i >= 0; i--) {
+    if (tail.getUint32(i, true) === EOCD_SIGNATURE) {
+      eocd = i;
+      break;
+    }
+  }
+  if (eocd < 0) throw new Error("Not a zip archive");
+
+  const count = tail.getUint16(eocd + 10, true);
+  const dirSize = tail.getUint32(eocd + 12, true);
+  const dirOffset = tail.getUint32(eocd + 16, true);
+  if (count === 0xffff || dirOffset === 0xffffffff) {
+    throw new Error("Zip64 archives are not supported");
+  }
+
+  const dir = await view(file, dirOffset, dirOffset + dirSize);
+  const entries: ZipEntry[] = [];
+  for (let pos = 0, i = 0; i < count; i++) {
+    if (dir.getUint32(pos, true) !== CENTRAL_SIGNATURE) {
+      throw new Error("Corrupt zip central directory");
+    }
+    const flags = dir.getUint16(pos + 8, true);
+    const method = dir.getUint16(pos + 10, true);
+    const compressedSize = dir.getUint32(pos + 20, true);
+    const size = dir.getUint32(pos + 24, true);
+    const nameLength = dir.getUint16(pos + 28, true);
+    const extraLength = dir.getUint16(pos + 30, true);
+    const commentLength = dir.getUint16(pos + 32, true);
+    const localOffset = dir.getUint32(pos + 42, true);
+    const path = decoder.decode(
+      new Uint8Array(dir.buffer, dir.byteOffset + pos + 46, nameLength)
+    );
+    pos += 46 + nameLength + extraLength + commentLength;
+
+    if (path.endsWith("/")) continue;
+    if (flags & 1) throw new Error(`Encrypted entry: ${path}`);
+    if (method !== 0 && method !== 8) continue;
+
+    entries.push({
+      path,
+      size,
+      read: async () => {
+        const local = await view(file, localOffset, localOffset + 30);
+        if (local.getUint32(0, true) !== LOCAL_SIGNATURE) {
+          throw new Error(`Corrupt zip entry: ${path}`);
+        }
+        const start =
+          localOffset + 30 + local.getUint16(26, true) + local.getUint16(28, true);
+        const data = file.slice(start, start + compressedSize);
+        if (method === 0) return data;
+        const inflated = data.stream().pipeThrough(new DecompressionStream("deflate-raw"));
+        return new Response(inflated).blob();
+      },
+    });
+  }
+  return entries;
+}
@@ -0,0 +1,171 @@
+import { unpackEntities } from "@/lib/utils/pii-redaction";
+import type { IncrementalRedaction } from "@/lib/utils/pii-incremental";
+import type { TranscriptStats } from "@/lib/utils/transcript-stats";
+import { runTranscriptOp } from "@/lib/workers/transcript-ops";
+import type {
+  TranscriptOp,
+  TranscriptRequest,
+  TranscriptResponse,
+  TranscriptResult,
+} from "@/lib/workers/transcript-ops";
+import type { PIIEntity, RedactionResult } from "@/types/database";
+
+export interface TranscriptRequestOptions {
+  /** Requests sharing a key supersede each other. Defaults to the operation. */
+  key?: string;
+  signal?: AbortSignal;
+}
+
+export interface PIIScan {
+  entities: PIIEntity[];
+  summary: string;
+}
+
+export interface TranscriptWorker {
+  redact(
+    text: string,
+    options?: TranscriptRequestOptions
+  ): Promise<RedactionResult & { summary: string }>;
+  preview(text: string, options?: TranscriptRequestOptions): Promise<PIIScan>;
+  stats(text: string, options?: TranscriptRequestOptions): Promise<TranscriptStats>;
+}
+
+interface InflightRequest {
+  message: TranscriptRequest;
+  resolve: (result: TranscriptResult) => void;
+  reject: (error: unknown) => void;
+}
+
+function staleRequestError() {
+  return new DOMException("Superseded by a newer transcript request", "AbortError");
+}
+
+/** True when a request was dropped because a newer one replaced it. */
+export function isStaleRequest(error: unknown): boolean {
+  return error instanceof DOMException && error.name === "AbortError";
+}
+
+function createTranscriptWorker(): TranscriptWorker {
+  const inflight = new Map<number, InflightRequest>();
+  const latestByKey = new Map<string, number>();
+  // Incremental preview state for the main-thread fallback.
+  const previews = new Map<string, IncrementalRedaction>();
+  let nextId = 1;
+  let worker: Worker | null = null;
+
+  function settle(response: TranscriptResponse) {
+    const entry = inflight.get(response.id);
+    if (!entry) return;
+    inflight.delete(response.id);
+    if (latestByKey.get(entry.message.key) === response.id) {
+      latestByKey.delete(entry.message.key);
+    }
+    if (response.status === "done") entry.resolve(response.result);
+    else if (response.status === "cancelled") entry.reject(staleRequestError());
+    else entry.reject(new Error(response.error));
+  }
+
+  function runLocally(message: TranscriptRequest) {
+    setTimeout(() => {
+      if (!inflight.has(message.id)) return;
+      try {
+        const result = runTranscriptOp(message, previews);
+        settle({ id: message.id, status: "done", result });
+      } catch (error) {
+        settle({
+          id: message.id,
+          status: "error",
+          error: error instanceof Error ? error.message : String(error),
+        });
+      }
+    }, 0);
+  }
+
+  if (typeof Worker !== "undefined") {
+    try {
+      worker = new Worker(new URL("./transcript.worker.ts", import.meta.url), {
+        type: "module",
+      });
+      worker.addEventListener(
+        "message",
+        (event: MessageEvent<TranscriptResponse>) => settle(event.data)
+      );
+      worker.addEventListener("error", () => {
+        // The worker could not load; finish outstanding work on this thread.
+        worker?.terminate();
+        worker = null;
+        for (const { message } of inflight.values()) runLocally(message);
+      });
+    } catch {
+      worker = null;
+    }
+  }
+
+  function cancel(id: number) {
+    if (!inflight.has(id)) return;
+    worker?.postMessage({ id, op: "cancel" });
+    settle({ id, status: "cancelled" });
+  }
+
+  function request<Op extends TranscriptOp>(
+    op: Op,
+    text: string,
+    options: TranscriptRequestOptions = {}
+  ): Promise<Extract<TranscriptResult, { op: Op }>> {
+    const key = options.key ?? op;
+    const id = nextId++;
+    const message: TranscriptRequest = { id, key, op, text };
+
+    // Reject the superseded request right away so callers never render it.
+    const previous = latestByKey.get(key);
+    if (previous !== undefined) cancel(previous);
+    latestByKey.set(key, id);
+
+    return new Promise((resolve, reject) => {
+      if (options.signal?.aborted) {
+        latestByKey.delete(key);
+        reject(staleRequestError());
+        return;
+      }
+      inflight.set(id, {
+        message,
+        resolve: (result) => resolve(result as Extract<TranscriptResult, { op: Op }>),
+        reject,
+      });
+      options.signal?.addEventListener("abort", () => cancel(id), { once: true });
+
+      if (worker) worker.postMessage(message);
+      else runLocally(message);
+    });
+  }
+
+  return {
+    async redact(text, options) {
+      const result = await request("redact", text, options);
+      return {
+        redactedText: result.redactedText,
+        entities: unpackEntities(text, result.entities),
+        summary: result.summary,
+      };
+    },
+    async preview(text, options) {
+      const result = await request("preview", text, options);
+      return {
+        entities: unpackEntities(text, result.entities),
+        summary: result.summary,
+      };
+    },
+    async stats(text, options) {
+      const result = await request("stats", text, options);
+      return result.stats;
+    },
+  };
+}
+
+let sharedWorker: TranscriptWorker | null = null;
+
+/** Shared transcript worker for the browser tab, created on first use. */
+export function getTranscriptWorker(): TranscriptWorker {
+  if (!sharedWorker) sharedWorker = createTranscriptWorker();
+  return sharedWorker;
+}
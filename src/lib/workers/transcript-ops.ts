@@ -0,0 +1,82 @@
+import {
+  applyRedactions,
+  getPIISummary,
+  packEntities,
+  scanPII,
+  toPIIEntity,
+} from "@/lib/utils/pii-redaction";
+import {
+  createIncrementalRedaction,
+  updateIncrementalRedaction,
+} from "@/lib/utils/pii-incremental";
+import type { IncrementalRedaction } from "@/lib/utils/pii-incremental";
+import { getTranscriptStats } from "@/lib/utils/transcript-stats";
+import type { TranscriptStats } from "@/lib/utils/transcript-stats";
+
+export type TranscriptOp = "redact" | "preview" | "stats";
+
+export interface TranscriptRequest {
+  id: number;
+  /** Requests sharing a key supersede each other; only the latest runs. */
+  key: string;
+  op: TranscriptOp;
+  text: string;
+}
+
+export interface TranscriptCancel {
+  id: number;
+  op: "cancel";
+}
+
+export type TranscriptWorkerMessage = TranscriptRequest | TranscriptCancel;
+
+/** Entities travel as packed [pattern, start, end] triples (see packEntities). */
+export type TranscriptResult =
+  | { op: "redact"; redactedText: string; entities: Int32Array; summary: string }
+  | { op: "preview"; entities: Int32Array; summary: string }
+  | { op: "stats"; stats: TranscriptStats };
+
+export type TranscriptResponse =
+  | { id: number; status: "done"; result: TranscriptResult }
+  | { id: number; status: "cancelled" }
+  | { id: number; status: "error"; error: string };
+
+/**
+ * Runs one request. `previews` holds the incremental scan per request key so
+ * repeated previews of an edited transcript only rescan the edit.
+ */
+export function runTranscriptOp(
+  request: TranscriptRequest,
+  previews: Map<string, IncrementalRedaction>
+): TranscriptResult {
+  const { op, text, key } = request;
+
+  if (op === "stats") {
+    return { op, stats: getTranscriptStats(text) };
+  }
+
+  if (op === "preview") {
+    const prev = previews.get(key);
+    const next = prev
+      ? updateIncrementalRedaction(prev, text)
+      : createIncrementalRedaction(text);
+    previews.set(key, next);
+    return {
+      op,
+      entities: packEntities(next.entities),
+      summary: getPIISummary(next.entities),
+    };
+  }
+
+  const entities = scanPII(text).map((m) => toPIIEntity(text, m));
+  return {
+    op,
+    redactedText: applyRedactions(text, entities),
+    entities: packEntities(entities),
+    summary: getPIISummary(entities),
+  };
+}
+
+export function transferablesOf(result: TranscriptResult): Transferable[] {
+  return "entities" in result ? [result.entities.buffer] : [];
+}
@@ -0,0 +1,58 @@
+import { runTranscriptOp, transferablesOf } from "@/lib/workers/transcript-ops";
+import type {
+  TranscriptRequest,
+  TranscriptResponse,
+  TranscriptWorkerMessage,
+} from "@/lib/workers/transcript-ops";
+import type { IncrementalRedaction } from "@/lib/utils/pii-incremental";
+
+const previews = new Map<string, IncrementalRedaction>();
+const pending = new Map<string, TranscriptRequest>();
+let flushScheduled = false;
+
+function respond(response: TranscriptResponse, transfer: Transferable[] = []) {
+  self.postMessage(response, { transfer });
+}
+
+// Work is deferred by a macrotask so a burst of requests (one per keystroke)
+// collapses to the newest one per key before any scanning starts.
+function flush() {
+  flushScheduled = false;
+  const batch = [...pending.values()];
+  pending.clear();
+  for (const request of batch) {
+    try {
+      const result = runTranscriptOp(request, previews);
+      respond({ id: request.id, status: "done", result }, transferablesOf(result));
+    } catch (error) {
+      respond({
+        id: request.id,
+        status: "error",
+        error: error instanceof Error ? error.message : String(error),
+      });
+    }
+  }
+}
+
+self.addEventListener("message", (event: MessageEvent<TranscriptWorkerMessage>) => {
+  const message = event.data;
+
+  if (message.op === "cancel") {
+    for (const [key, request] of pending) {
+      if (request.id === message.id) {
+        pending.delete(key);
+        respond({ id: request.id, status: "cancelled" });
+      }
+    }
+    return;
+  }
+
+  const superseded = pending.get(message.key);
+  if (superseded) respond({ id: superseded.id, status: "cancelled" });
+  pending.set(message.key, message);
+
+  if (!flushScheduled) {
+    flushScheduled = true;
+    setTimeout(flush, 0);
+  }
+});
@@ -71,6 +71,32 @@ export interface ComplianceFlag {
   created_at: string;
 }
 
+export type MeetingJobStatus = 'queued' | 'running' | 'succeeded' | 'failed';
+
+export type MeetingJobStep = 'pii' | 'ai' | 'compliance' | 'done';
+
+export interface MeetingJobInput {
+  title: string;
+  transcript: string;
+  source_type: MeetingSourceType;
+  source_file_name: string | null;
+}
+
+export interface MeetingJob {
+  id: string;
+  client_id: string;
+  meeting_id: string | null;
+  batch_id: string | null;
+  status: MeetingJobStatus;
+  current_step: MeetingJobStep | null;
+  input: MeetingJobInput;
+  checkpoint: Record<string, unknown>;
+  attempts: number;
+  error: string | null;
+  created_at: string;
+  updated_at: string;
+}
+
 export interface ChatMessage {
   id: string;
   role: 'user' | 'assistant' | 'system';
@@ -0,0 +1,26 @@
+-- Server-side meeting processing jobs.
+--
+-- One row per pipeline run. `checkpoint` records the output of every step
+-- that has finished (meeting id, AI analysis, saved output id, compliance
+-- review, ...) so a failed or interrupted job resumes after the last
+-- completed step instead of starting over. API keys are never stored; a
+-- retry must supply the key again.
+
+create table if not exists meeting_jobs (
+  id uuid primary key default gen_random_uuid(),
+  client_id uuid not null references clients(id) on delete cascade,
+  meeting_id uuid references meetings(id) on delete set null,
+  status text not null default 'queued'
+    check (status in ('queued', 'running', 'succeeded', 'failed')),
+  current_step text
+    check (current_step in ('pii', 'ai', 'compliance', 'done')),
+  input jsonb not null,
+  checkpoint jsonb not null default '{}'::jsonb,
+  attempts integer not null default 0,
+  error text,
+  created_at timestamptz not null default now(),
+  updated_at timestamptz not null default now()
+);
+
+create index if not exists meeting_jobs_meeting_id_idx on meeting_jobs (meeting_id);
+create index if not exists meeting_jobs_status_updated_idx on meeting_jobs (status, updated_at);
@@ -0,0 +1,17 @@
+-- Content-addressed cache for structured AI results (see
+-- src/lib/ai/result-cache.ts). `key` is a SHA-256 over the task, model,
+-- prompts and output schema, so identical requests share one row.
+
+create table if not exists ai_result_cache (
+  key text primary key,
+  task text not null,
+  value jsonb not null,
+  expires_at timestamptz not null,
+  created_at timestamptz not null default now()
+);
+
+create index if not exists ai_result_cache_expires_at_idx on ai_result_cache (expires_at);
+
+-- Expired rows are ignored on read; purge them periodically, e.g. with pg_cron:
+--   select cron.schedule('purge-ai-cache', '0 * * * *',
+--     $$delete from ai_result_cache where expires_at < now()$$);
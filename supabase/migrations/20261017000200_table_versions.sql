@@ -0,0 +1,39 @@
+-- Per-table change counters used to invalidate server-side caches (e.g. the
+-- chat client-book context in src/lib/ai/chat-context.ts). A statement-level
+-- trigger bumps the counter once per insert/update/delete statement, so bulk
+-- writes cost a single increment.
+
+create table if not exists table_versions (
+  table_name text primary key,
+  version bigint not null default 0,
+  updated_at timestamptz not null default now()
+);
+
+insert into table_versions (table_name)
+values ('clients'), ('meetings'), ('tasks')
+on conflict (table_name) do nothing;
+
+create or replace function bump_table_version() returns trigger
+language plpgsql as $$
+begin
+  update table_versions
+  set version = version + 1, updated_at = now()
+  where table_name = tg_table_name;
+  return null;
+end;
+$$;
+
+drop trigger if exists clients_bump_version on clients;
+create trigger clients_bump_version
+  after insert or update or delete on clients
+  for each statement execute function bump_table_version();
+
+drop trigger if exists meetings_bump_version on meetings;
+create trigger meetings_bump_version
+  after insert or update or delete on meetings
+  for each statement execute function bump_table_version();
+
+drop trigger if exists tasks_bump_version on tasks;
+create trigger tasks_bump_version
+  after insert or update or delete on tasks
+  for each statement execute function bump_table_version();
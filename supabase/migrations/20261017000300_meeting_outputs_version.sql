@@ -0,0 +1,11 @@
+-- Track meeting_outputs in table_versions so the chat retrieval index
+-- (src/lib/retrieval/book-index.ts) re-embeds summaries when they change.
+
+insert into table_versions (table_name)
+values ('meeting_outputs')
+on conflict (table_name) do nothing;
+
+drop trigger if exists meeting_outputs_bump_version on meeting_outputs;
+create trigger meeting_outputs_bump_version
+  after insert or update or delete on meeting_outputs
+  for each statement execute function bump_table_version();
@@ -0,0 +1,12 @@
+-- Batch transcript imports.
+--
+-- An import creates one meeting_jobs row per transcript, all sharing a
+-- batch_id. Meetings are inserted (already redacted) when the batch is
+-- created, so batch jobs start queued at the 'ai' step and are claimed and
+-- run by POST /api/meetings/batches/[batchId] with bounded concurrency.
+
+alter table meeting_jobs add column if not exists batch_id uuid;
+
+create index if not exists meeting_jobs_batch_id_idx
+  on meeting_jobs (batch_id, created_at)
+  where batch_id is not null;
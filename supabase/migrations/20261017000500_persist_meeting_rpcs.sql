@@ -0,0 +1,84 @@
+-- Transactional write paths for meeting processing, called over RPC.
+--
+-- persist_meeting_results writes the AI output, tasks and compliance flags
+-- of a meeting and marks it ready for review in one transaction, replacing
+-- five separate inserts/updates. It is idempotent per meeting: the output is
+-- keyed by the unique meeting_id, and tasks and flags are only written when
+-- none exist yet, so a job retried after a lost response (or resumed from an
+-- older checkpoint that already saved some rows) never duplicates anything.
+--
+-- create_meeting_batch inserts the meetings and queued jobs of a batch
+-- import together, so a failed import leaves no orphaned meetings.
+
+create or replace function persist_meeting_results(
+  p_meeting_id uuid,
+  p_output jsonb,
+  p_tasks jsonb default '[]'::jsonb,
+  p_flags jsonb default '[]'::jsonb
+) returns uuid
+language plpgsql as $$
+declare
+  v_client_id uuid;
+  v_output_id uuid;
+begin
+  select client_id into v_client_id
+  from meetings
+  where id = p_meeting_id
+  for update;
+  if not found then
+    raise exception 'Meeting % not found', p_meeting_id;
+  end if;
+
+  insert into meeting_outputs (meeting_id, summary_text, key_topics, client_email_draft)
+  select p_meeting_id, o.summary_text, o.key_topics, o.client_email_draft
+  from jsonb_populate_record(null::meeting_outputs, p_output) o
+  on conflict (meeting_id) do nothing
+  returning id into v_output_id;
+
+  if v_output_id is null then
+    select id into v_output_id from meeting_outputs where meeting_id = p_meeting_id;
+  end if;
+
+  if not exists (select 1 from tasks where meeting_id = p_meeting_id) then
+    insert into tasks (meeting_id, client_id, description, priority, due_date)
+    select p_meeting_id, v_client_id, t.description, t.priority, t.due_date
+    from jsonb_populate_recordset(null::tasks, coalesce(p_tasks, '[]'::jsonb)) t;
+  end if;
+
+  if not exists (select 1 from compliance_flags where meeting_output_id = v_output_id) then
+    insert into compliance_flags (meeting_output_id, flagged_text, risk_category, severity, explanation)
+    select v_output_id, f.flagged_text, f.risk_category, f.severity, f.explanation
+    from jsonb_populate_recordset(null::compliance_flags, coalesce(p_flags, '[]'::jsonb)) f;
+  end if;
+
+  update meetings
+  set status = 'review_needed'
+  where id = p_meeting_id and status = 'processing';
+
+  return v_output_id;
+end;
+$$;
+
+create or replace function create_meeting_batch(
+  p_meetings jsonb,
+  p_jobs jsonb
+) returns void
+language plpgsql as $$
+begin
+  insert into meetings (
+    id, client_id, title, transcript_text, transcript_redacted,
+    pii_entities, source_type, source_file_name, status
+  )
+  select
+    m.id, m.client_id, m.title, m.transcript_text, m.transcript_redacted,
+    m.pii_entities, m.source_type, m.source_file_name, m.status
+  from jsonb_populate_recordset(null::meetings, p_meetings) m;
+
+  insert into meeting_jobs (
+    id, batch_id, client_id, meeting_id, status, current_step, input, checkpoint
+  )
+  select
+    j.id, j.batch_id, j.client_id, j.meeting_id, j.status, j.current_step, j.input, j.checkpoint
+  from jsonb_populate_recordset(null::meeting_jobs, p_jobs) j;
+end;
+$$;
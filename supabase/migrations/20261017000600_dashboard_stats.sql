@@ -0,0 +1,152 @@
+-- Dashboard KPIs maintained in the database.
+--
+-- dashboard_stats is a single row of running totals (AUM, client count,
+-- pending tasks, unresolved compliance flags) and meeting_month_counts holds
+-- meetings per calendar month. Row-level triggers apply the delta of every
+-- insert/update/delete, so the overview reads one small row via
+-- get_dashboard_stats() instead of scanning clients and flags.
+
+create table if not exists dashboard_stats (
+  id boolean primary key default true check (id),
+  total_aum numeric not null default 0,
+  client_count bigint not null default 0,
+  pending_tasks bigint not null default 0,
+  unresolved_flags bigint not null default 0,
+  updated_at timestamptz not null default now()
+);
+
+create table if not exists meeting_month_counts (
+  month date primary key,
+  meeting_count bigint not null default 0
+);
+
+-- Backfill from the current data. Writes are blocked until the triggers
+-- below exist, so no change falls between the backfill and the deltas.
+lock table clients, tasks, compliance_flags, meetings in share row exclusive mode;
+
+insert into dashboard_stats (id, total_aum, client_count, pending_tasks, unresolved_flags)
+select
+  true,
+  (select coalesce(sum(aum_value), 0) from clients),
+  (select count(*) from clients),
+  (select count(*) from tasks where status = 'pending'),
+  (select count(*) from compliance_flags where not is_resolved)
+on conflict (id) do update set
+  total_aum = excluded.total_aum,
+  client_count = excluded.client_count,
+  pending_tasks = excluded.pending_tasks,
+  unresolved_flags = excluded.unresolved_flags,
+  updated_at = now();
+
+insert into meeting_month_counts (month, meeting_count)
+select date_trunc('month', created_at)::date, count(*)
+from meetings
+group by 1
+on conflict (month) do update set meeting_count = excluded.meeting_count;
+
+create or replace function dashboard_stats_on_client() returns trigger
+language plpgsql as $$
+begin
+  update dashboard_stats set
+    total_aum = total_aum
+      + case when tg_op <> 'DELETE' then coalesce(new.aum_value, 0) else 0 end
+      - case when tg_op <> 'INSERT' then coalesce(old.aum_value, 0) else 0 end,
+    client_count = client_count
+      + case tg_op when 'INSERT' then 1 when 'DELETE' then -1 else 0 end,
+    updated_at = now()
+  where id;
+  return null;
+end;
+$$;
+
+create or replace function dashboard_stats_on_task() returns trigger
+language plpgsql as $$
+declare
+  delta integer :=
+    (case when tg_op = 'DELETE' then 0 when new.status = 'pending' then 1 else 0 end)
+    - (case when tg_op = 'INSERT' then 0 when old.status = 'pending' then 1 else 0 end);
+begin
+  if delta <> 0 then
+    update dashboard_stats
+    set pending_tasks = pending_tasks + delta, updated_at = now()
+    where id;
+  end if;
+  return null;
+end;
+$$;
+
+create or replace function dashboard_stats_on_flag() returns trigger
+language plpgsql as $$
+declare
+  delta integer :=
+    (case when tg_op = 'DELETE' then 0 when not new.is_resolved then 1 else 0 end)
+    - (case when tg_op = 'INSERT' then 0 when not old.is_resolved then 1 else 0 end);
+begin
+  if delta <> 0 then
+    update dashboard_stats
+    set unresolved_flags = unresolved_flags + delta, updated_at = now()
+    where id;
+  end if;
+  return null;
+end;
+$$;
+
+create or replace function dashboard_stats_on_meeting() returns trigger
+language plpgsql as $$
+begin
+  if tg_op = 'INSERT' then
+    insert into meeting_month_counts (month, meeting_count)
+    values (date_trunc('month', new.created_at)::date, 1)
+    on conflict (month) do update
+      set meeting_count = meeting_month_counts.meeting_count + 1;
+  else
+    update meeting_month_counts
+    set meeting_count = meeting_count - 1
+    where month = date_trunc('month', old.created_at)::date;
+  end if;
+  return null;
+end;
+$$;
+
+drop trigger if exists clients_dashboard_stats on clients;
+create trigger clients_dashboard_stats
+  after insert or delete or update of aum_value on clients
+  for each row execute function dashboard_stats_on_client();
+
+drop trigger if exists tasks_dashboard_stats on tasks;
+create trigger tasks_dashboard_stats
+  after insert or delete or update of status on tasks
+  for each row execute function dashboard_stats_on_task();
+
+drop trigger if exists compliance_flags_dashboard_stats on compliance_flags;
+create trigger compliance_flags_dashboard_stats
+  after insert or delete or update of is_resolved on compliance_flags
+  for each row execute function dashboard_stats_on_flag();
+
+drop trigger if exists meetings_dashboard_stats on meetings;
+create trigger meetings_dashboard_stats
+  after insert or delete on meetings
+  for each row execute function dashboard_stats_on_meeting();
+
+create or replace function get_dashboard_stats()
+returns table (
+  total_aum numeric,
+  client_count bigint,
+  meetings_this_month bigint,
+  pending_tasks bigint,
+  compliance_flags bigint
+)
+language sql stable as $$
+  select
+    s.total_aum,
+    s.client_count,
+    coalesce(
+      (select m.meeting_count from meeting_month_counts m
+       where m.month = date_trunc('month', now())::date),
+      0
+    ),
+    s.pending_tasks,
+    s.unresolved_flags
+  from dashboard_stats s
+  where s.id;
+$$;
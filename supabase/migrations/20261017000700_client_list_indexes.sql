@@ -0,0 +1,11 @@
+-- Indexes for the paginated client list (src/lib/cache/book-data.ts).
+--
+-- Pages are keyset-paginated on (name, id) or (aum_value, id), so each page
+-- is an index range scan regardless of how deep the user has scrolled.
+-- Name search uses `ilike '%term%'`, served by a trigram index.
+
+create extension if not exists pg_trgm;
+
+create index if not exists clients_name_id_idx on clients (name, id);
+create index if not exists clients_aum_id_idx on clients (aum_value, id);
+create index if not exists clients_name_trgm_idx on clients using gin (name gin_trgm_ops);
@@ -0,0 +1,10 @@
+-- Indexes for the client detail history lists (src/lib/cache/book-data.ts).
+--
+-- Meetings and tasks are listed per client, newest first, and
+-- keyset-paginated on (created_at, id), so each page of older history is a
+-- range scan of one of these indexes.
+
+create index if not exists meetings_client_created_idx
+  on meetings (client_id, created_at desc, id desc);
+create index if not exists tasks_client_created_idx
+  on tasks (client_id, created_at desc, id desc);
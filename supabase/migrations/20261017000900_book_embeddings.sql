@@ -0,0 +1,14 @@
+-- Persisted embeddings for the chat retrieval index (see
+-- src/lib/retrieval/book-index.ts). Rows are keyed by embedding model and
+-- record id ("client:<uuid>", "meeting:<uuid>", "task:<uuid>"); `text_hash`
+-- is a SHA-256 of the embedded text, so a record is only re-embedded when
+-- its text changes, including after a cold start.
+
+create table if not exists book_embeddings (
+  model text not null,
+  record_id text not null,
+  text_hash text not null,
+  embedding real[] not null,
+  updated_at timestamptz not null default now(),
+  primary key (model, record_id)
+);